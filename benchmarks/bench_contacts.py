@@ -0,0 +1,57 @@
+"""Benchmarks the generation of 1D-2D contacts for a large mesh1d.
+
+Run from the repository root with `python benchmarks/bench_contacts.py`.
+"""
+
+import timeit
+import tracemalloc
+
+import numpy as np
+from meshes import structured_mesh2d
+
+from ugrid.contacts import generate_contacts
+from ugrid.py_structures import UGridMesh1D
+
+
+def random_mesh1d(num_nodes, extent, seed=0, low=0.0):
+    rng = np.random.default_rng(seed)
+    return UGridMesh1D(
+        name="mesh1d",
+        network_name="network",
+        node_edge_id=np.zeros(num_nodes, dtype=np.int32),
+        node_edge_offset=np.zeros(num_nodes),
+        node_x=low + rng.random(num_nodes) * (extent - low),
+        node_y=low + rng.random(num_nodes) * (extent - low),
+        edge_node=np.array([], dtype=np.int32),
+    )
+
+
+def run(mesh1d, mesh2d, method):
+    tracemalloc.start()
+    start = timeit.default_timer()
+    contacts = generate_contacts(mesh1d, mesh2d, method)
+    elapsed = timeit.default_timer() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"  {method:>10}: {elapsed:.3f} s, {peak / 2**20:.0f} MiB peak, {contacts.edges.size // 2} contacts"
+    )
+
+
+def main():
+    mesh2d = structured_mesh2d(1000, 1000)
+    extent = mesh2d.node_x.max()
+    mesh1d = random_mesh1d(1_000_000, extent)
+    print(f"mesh1d: {mesh1d.node_x.size} nodes, mesh2d: {mesh2d.face_x.size} faces")
+    for method in ("containing", "nearest"):
+        run(mesh1d, mesh2d, method)
+
+    # Most nodes of a mesh1d over a larger area than the mesh2d lie outside of it
+    mesh2d = structured_mesh2d(300, 300)
+    mesh1d = random_mesh1d(100_000, 1.5 * 300, low=-150.0)
+    print(f"mesh1d: {mesh1d.node_x.size} nodes, mostly outside a mesh2d of 90000 faces")
+    run(mesh1d, mesh2d, "containing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmarks the cached sparse interpolation operators against rebuilding the averaging every time step.
+
+Run from the repository root with `python benchmarks/bench_interpolation.py`.
+"""
+
+import timeit
+
+import numpy as np
+from meshes import structured_mesh2d
+
+from ugrid.interpolation import MeshInterpolator
+
+
+def face_to_node_by_hand(mesh2d, face_data):
+    face_nodes = mesh2d.face_nodes.reshape(-1, mesh2d.num_face_nodes_max)
+    faces = np.repeat(np.arange(face_nodes.shape[0]), face_nodes.shape[1])
+    totals = np.bincount(
+        face_nodes.ravel(), weights=face_data[faces], minlength=mesh2d.node_x.size
+    )
+    counts = np.bincount(face_nodes.ravel(), minlength=mesh2d.node_x.size)
+    return totals / np.maximum(counts, 1)
+
+
+def main():
+    mesh2d = structured_mesh2d(1000, 1000)
+    num_times = 48
+    face_data = np.random.default_rng(0).random((num_times, mesh2d.face_x.size))
+    print(
+        f"mesh2d: {mesh2d.node_x.size} nodes, {mesh2d.face_x.size} faces, {num_times} time steps"
+    )
+
+    start = timeit.default_timer()
+    for step in face_data:
+        face_to_node_by_hand(mesh2d, step)
+    print(f"  rebuilt every time step: {timeit.default_timer() - start:.3f} s")
+
+    interpolator = MeshInterpolator(mesh2d)
+    start = timeit.default_timer()
+    interpolator.operator("face", "node")
+    print(f"  operator construction:   {timeit.default_timer() - start:.3f} s")
+    start = timeit.default_timer()
+    interpolator.interpolate(face_data, "face", "node")
+    print(f"  cached, one product:     {timeit.default_timer() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmarks the reconstruction of mesh1d coordinates from their chainage along the network1d branches.
+
+Run from the repository root with `python benchmarks/bench_network.py`.
+"""
+
+import timeit
+
+import numpy as np
+
+from ugrid.network import fill_mesh1d_coordinates
+from ugrid.py_structures import UGridMesh1D, UGridNetwork1D
+
+
+def random_network1d_and_mesh1d(num_branches, num_mesh1d_nodes, seed=0):
+    rng = np.random.default_rng(seed)
+    num_geometry_nodes = rng.integers(2, 40, num_branches).astype(np.int32)
+    geometry_x = rng.random(num_geometry_nodes.sum()).cumsum()
+    geometry_y = rng.random(num_geometry_nodes.sum())
+    network1d = UGridNetwork1D(
+        name="network",
+        node_x=np.zeros(2 * num_branches),
+        node_y=np.zeros(2 * num_branches),
+        edge_node=np.arange(2 * num_branches, dtype=np.int32),
+        edge_length=rng.random(num_branches) * 100.0 + 1.0,
+        edge_order=np.zeros(num_branches, dtype=np.int32),
+        geometry_nodes_x=geometry_x,
+        geometry_nodes_y=geometry_y,
+        num_edge_geometry_nodes=num_geometry_nodes,
+    )
+    node_edge_id = rng.integers(0, num_branches, num_mesh1d_nodes).astype(np.int32)
+    mesh1d = UGridMesh1D(
+        name="mesh1d",
+        network_name="network",
+        node_edge_id=node_edge_id,
+        node_edge_offset=rng.random(num_mesh1d_nodes)
+        * network1d.edge_length[node_edge_id],
+        edge_node=np.stack(
+            [np.arange(num_mesh1d_nodes - 1), np.arange(1, num_mesh1d_nodes)], axis=1
+        )
+        .astype(np.int32)
+        .ravel(),
+    )
+    return network1d, mesh1d
+
+
+def main():
+    network1d, mesh1d = random_network1d_and_mesh1d(20_000, 500_000)
+    print(
+        f"network1d: {network1d.edge_length.size} branches, mesh1d: {mesh1d.node_edge_id.size} nodes"
+    )
+    best = min(
+        timeit.repeat(
+            lambda: fill_mesh1d_coordinates(mesh1d, network1d), number=1, repeat=5
+        )
+    )
+    print(f"  fill_mesh1d_coordinates: {best:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
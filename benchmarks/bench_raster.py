@@ -0,0 +1,44 @@
+"""Benchmarks the rasterization of mesh2d data, with the pixel lookup cached across time steps.
+
+Run from the repository root with `python benchmarks/bench_raster.py`.
+"""
+
+import timeit
+
+import numpy as np
+from meshes import structured_mesh2d
+
+from ugrid.raster import MeshRasterizer, RasterGrid
+
+
+def main():
+    mesh2d = structured_mesh2d(1000, 1000, shuffle=True)
+    grid = RasterGrid.from_mesh2d(
+        mesh2d, (mesh2d.node_x.max() - mesh2d.node_x.min()) / 2000
+    )
+    rasterizer = MeshRasterizer(mesh2d, grid)
+    print(f"mesh2d: {mesh2d.face_x.size} faces, grid: {grid.num_pixels} pixels")
+
+    start = timeit.default_timer()
+    rasterizer.pixel_face
+    print(f"  pixel to face lookup:   {timeit.default_timer() - start:.3f} s")
+    start = timeit.default_timer()
+    rasterizer.node_weights
+    print(f"  node weights:           {timeit.default_timer() - start:.3f} s")
+
+    face_data = np.random.default_rng(0).random(mesh2d.face_x.size)
+    node_data = np.random.default_rng(0).random(mesh2d.node_x.size)
+    best = min(
+        timeit.repeat(lambda: rasterizer.rasterize(face_data), number=1, repeat=5)
+    )
+    print(f"  face data, per frame:   {best:.3f} s")
+    best = min(
+        timeit.repeat(
+            lambda: rasterizer.rasterize(node_data, "node"), number=1, repeat=5
+        )
+    )
+    print(f"  node data, per frame:   {best:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmarks reading every topology of a file with `read_all` against separate `*_get` calls.
+
+Run from the repository root with `python benchmarks/bench_read_all.py [files...]`,
+by default on the example data files. Needs the native UGrid library.
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+from ugrid import UGrid
+
+KINDS = ("network1d", "mesh1d", "mesh2d", "contacts")
+
+
+def read_separately(file_path):
+    with UGrid(file_path, "r") as ug:
+        return {
+            kind: [
+                getattr(ug, f"{kind}_get")(i)
+                for i in range(getattr(ug, f"{kind}_get_num_topologies")())
+            ]
+            for kind in KINDS
+        }
+
+
+def read_all(file_path, max_workers=None):
+    with UGrid(file_path, "r") as ug:
+        return ug.read_all(max_workers=max_workers)
+
+
+def main():
+    data = Path(__file__).parents[1] / "docs" / "examples" / "data_examples"
+    file_paths = sys.argv[1:] or [
+        str(data / "AllUGridEntities.nc"),
+        str(data / "ADH_SanDiego.nc"),
+    ]
+    for file_path in file_paths:
+        counts = {kind: len(values) for kind, values in read_all(file_path).items()}
+        print(f"{Path(file_path).name}: {counts}")
+        separate = min(
+            timeit.repeat(lambda: read_separately(file_path), number=10, repeat=5)
+        )
+        print(f"  separate calls: {separate / 10 * 1e3:.2f} ms")
+        for max_workers in (None, 2, 4):
+            best = min(
+                timeit.repeat(
+                    lambda: read_all(file_path, max_workers), number=10, repeat=5
+                )
+            )
+            print(f"  read_all, {max_workers or 1} workers: {best / 10 * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmarks reading many map files with `read_many` against a serial loop, for an increasing number of workers.
+
+Run from the repository root with `python benchmarks/bench_read_many.py [files...]`,
+by default on copies of the test result file. Needs the native UGrid library.
+"""
+
+import shutil
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+from ugrid import UGrid, read_many
+
+VARIABLES = ["mesh2d_s1", "mesh1d_s1"]
+
+
+def read_serial(file_paths):
+    results = []
+    for file_path in file_paths:
+        with UGrid(file_path, "r") as ug:
+            results.append(
+                {name: ug.variable_get_data_double(name) for name in VARIABLES}
+            )
+    return results
+
+
+def main():
+    file_paths = sys.argv[1:]
+    with tempfile.TemporaryDirectory() as directory:
+        if not file_paths:
+            source = Path(__file__).parents[1] / "tests" / "data" / "ResultFile.nc"
+            for i in range(32):
+                file_paths.append(
+                    shutil.copy(source, Path(directory) / f"run_{i:04d}.nc")
+                )
+        print(f"{len(file_paths)} files, variables {VARIABLES}")
+
+        serial = min(timeit.repeat(lambda: read_serial(file_paths), number=1, repeat=3))
+        print(f"  serial loop: {serial:.3f} s")
+        for max_workers in (1, 2, 4, 8):
+            best = min(
+                timeit.repeat(
+                    lambda: read_many(file_paths, VARIABLES, max_workers=max_workers),
+                    number=1,
+                    repeat=3,
+                )
+            )
+            print(
+                f"  read_many, {max_workers} workers: {best:.3f} s ({serial / best:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
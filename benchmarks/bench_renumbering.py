@@ -0,0 +1,61 @@
+"""Benchmarks gather-heavy kernels on randomly numbered meshes, before and after renumbering.
+
+Run from the repository root with `python benchmarks/bench_renumbering.py`.
+"""
+
+import timeit
+
+import numpy as np
+from meshes import chain_mesh1d, structured_mesh2d
+
+from ugrid.renumbering import renumber_mesh1d, renumber_mesh2d
+
+
+def face_centers(mesh2d):
+    face_nodes = mesh2d.face_nodes.reshape(-1, mesh2d.num_face_nodes_max)
+    return mesh2d.node_x[face_nodes].mean(axis=1), mesh2d.node_y[face_nodes].mean(
+        axis=1
+    )
+
+
+def edge_lengths(node_x, node_y, edge_nodes):
+    edge_nodes = edge_nodes.reshape(-1, 2)
+    return np.hypot(
+        node_x[edge_nodes[:, 1]] - node_x[edge_nodes[:, 0]],
+        node_y[edge_nodes[:, 1]] - node_y[edge_nodes[:, 0]],
+    )
+
+
+def best_of(function, *args, repeat=5):
+    return min(timeit.repeat(lambda: function(*args), number=1, repeat=repeat))
+
+
+def main():
+    mesh2d = structured_mesh2d(1500, 1500, shuffle=True)
+    print(f"mesh2d: {mesh2d.node_x.size} nodes, {mesh2d.face_x.size} faces")
+    meshes = {"random": mesh2d}
+    for method in ("hilbert", "rcm"):
+        start = timeit.default_timer()
+        meshes[method], _ = renumber_mesh2d(mesh2d, method)
+        print(f"  renumbering ({method}): {timeit.default_timer() - start:.3f} s")
+    for name, mesh in meshes.items():
+        print(
+            f"  {name:>8}: face centers {best_of(face_centers, mesh):.4f} s, "
+            f"edge lengths {best_of(edge_lengths, mesh.node_x, mesh.node_y, mesh.edge_nodes):.4f} s"
+        )
+
+    mesh1d = chain_mesh1d(2_000_000, shuffle=True)
+    print(f"mesh1d: {mesh1d.node_x.size} nodes")
+    meshes = {"random": mesh1d}
+    for method in ("hilbert", "rcm"):
+        start = timeit.default_timer()
+        meshes[method], _ = renumber_mesh1d(mesh1d, method)
+        print(f"  renumbering ({method}): {timeit.default_timer() - start:.3f} s")
+    for name, mesh in meshes.items():
+        print(
+            f"  {name:>8}: edge lengths {best_of(edge_lengths, mesh.node_x, mesh.node_y, mesh.edge_node):.4f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
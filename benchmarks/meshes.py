@@ -0,0 +1,95 @@
+"""Synthetic meshes used by the benchmarks."""
+
+import numpy as np
+
+from ugrid import UGridMesh1D, UGridMesh2D
+
+
+def structured_mesh2d(num_x: int, num_y: int, shuffle: bool = False) -> UGridMesh2D:
+    """Creates a rectilinear mesh2d of quadrilaterals, optionally with randomly numbered nodes, edges and faces.
+
+    Args:
+        num_x (int): The number of faces in the x direction.
+        num_y (int): The number of faces in the y direction.
+        shuffle (bool): Whether to randomly permute the nodes, edges and faces.
+
+    Returns:
+        UGridMesh2D: The mesh2d, using a start index of 0.
+    """
+    node_index = np.arange((num_x + 1) * (num_y + 1)).reshape(num_y + 1, num_x + 1)
+    node_y, node_x = np.divmod(np.arange(node_index.size, dtype=np.double), num_x + 1)
+
+    horizontal = np.stack(
+        [node_index[:, :-1].ravel(), node_index[:, 1:].ravel()], axis=1
+    )
+    vertical = np.stack([node_index[:-1, :].ravel(), node_index[1:, :].ravel()], axis=1)
+    edge_nodes = np.concatenate([horizontal, vertical])
+    face_nodes = np.stack(
+        [
+            node_index[:-1, :-1].ravel(),
+            node_index[:-1, 1:].ravel(),
+            node_index[1:, 1:].ravel(),
+            node_index[1:, :-1].ravel(),
+        ],
+        axis=1,
+    )
+    face_x = node_x[face_nodes].mean(axis=1)
+    face_y = node_y[face_nodes].mean(axis=1)
+
+    if shuffle:
+        rng = np.random.default_rng(0)
+        node_order = rng.permutation(node_x.size)
+        node_rank = np.argsort(node_order)
+        node_x, node_y = node_x[node_order], node_y[node_order]
+        edge_nodes = node_rank[edge_nodes][rng.permutation(edge_nodes.shape[0])]
+        face_order = rng.permutation(face_nodes.shape[0])
+        face_nodes = node_rank[face_nodes][face_order]
+        face_x, face_y = face_x[face_order], face_y[face_order]
+
+    return UGridMesh2D(
+        name="mesh2d",
+        node_x=node_x,
+        node_y=node_y,
+        edge_node=edge_nodes.astype(np.int32).ravel(),
+        face_nodes=face_nodes.astype(np.int32).ravel(),
+        face_x=face_x,
+        face_y=face_y,
+        num_face_nodes_max=4,
+    )
+
+
+def chain_mesh1d(num_nodes: int, shuffle: bool = False) -> UGridMesh1D:
+    """Creates a mesh1d made of a single meandering chain of nodes on one network edge.
+
+    Args:
+        num_nodes (int): The number of mesh1d nodes.
+        shuffle (bool): Whether to randomly permute the nodes and edges.
+
+    Returns:
+        UGridMesh1D: The mesh1d, using a start index of 0.
+    """
+    offset = np.arange(num_nodes, dtype=np.double)
+    node_x = offset
+    node_y = np.sin(offset / 50.0) * 100.0
+    edge_nodes = np.stack([np.arange(num_nodes - 1), np.arange(1, num_nodes)], axis=1)
+
+    if shuffle:
+        rng = np.random.default_rng(0)
+        node_order = rng.permutation(num_nodes)
+        node_rank = np.argsort(node_order)
+        offset, node_x, node_y = (
+            offset[node_order],
+            node_x[node_order],
+            node_y[node_order],
+        )
+        edge_nodes = node_rank[edge_nodes][rng.permutation(num_nodes - 1)]
+
+    return UGridMesh1D(
+        name="mesh1d",
+        network_name="network1d",
+        node_edge_id=np.zeros(num_nodes, dtype=np.int32),
+        node_edge_offset=offset,
+        node_x=node_x,
+        node_y=node_y,
+        edge_node=edge_nodes.astype(np.int32).ravel(),
+    )
@@ -103,7 +103,7 @@ setup(
     url="https://github.com/Deltares/UGridPy",
     license="MIT",
     platforms="Windows, Linux",
-    install_requires=["numpy", "meshkernel"],
+    install_requires=["numpy", "scipy", "meshkernel"],
     extras_require={
         "tests": ["pytest", "pytest-cov", "nbval"],
         "lint": [
@@ -112,6 +112,8 @@ setup(
             "isort",
         ],
         "docs": ["sphinx", "sphinx_book_theme", "myst_nb"],
+        "zarr": ["zarr"],
+        "arrow": ["pyarrow"],
     },
     python_requires=">=3.8",
     packages=["ugrid"],
@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from numpy.testing import assert_array_equal
+from test_dataset import FakeUGrid, create_files
+
+import ugrid.aio
+from ugrid import AsyncUGrid
+
+
+class SlowUGrid(FakeUGrid):
+    r"""A `FakeUGrid` whose reads take some time, recording how many run at once per file and overall,
+    and the files closed during a read."""
+
+    lock = threading.Lock()
+    running = {}
+    most_running = {}
+    closed_while_reading = []
+
+    def __init__(self, file_path, method):
+        super().__init__(file_path, method)
+        self.file_path = file_path
+
+    def __exit__(self, type, value, traceback):
+        if SlowUGrid.running.get(self.file_path, 0) > 0:
+            SlowUGrid.closed_while_reading.append(self.file_path)
+
+    def variable_get_data_double(self, variable_name):
+        with SlowUGrid.lock:
+            for key in (self.file_path, "all"):
+                SlowUGrid.running[key] = SlowUGrid.running.get(key, 0) + 1
+                SlowUGrid.most_running[key] = max(
+                    SlowUGrid.most_running.get(key, 0), SlowUGrid.running[key]
+                )
+        time.sleep(0.05)
+        with SlowUGrid.lock:
+            SlowUGrid.running[self.file_path] -= 1
+            SlowUGrid.running["all"] -= 1
+        return super().variable_get_data_double(variable_name)
+
+    def network1d_get_num_topologies(self):
+        return int("network1d" in self.file)
+
+    def mesh1d_get_num_topologies(self):
+        return int("mesh1d" in self.file)
+
+    def mesh2d_get_num_topologies(self):
+        return int("mesh2d" in self.file)
+
+    def contacts_get_num_topologies(self):
+        return int("contacts" in self.file)
+
+    def variable_get_attributes_names(self, variable_name):
+        return ["units", "long_name"]
+
+    def variable_get_attributes_values(self, variable_name):
+        return ["m", "water level"]
+
+
+def test_async_ugrid_reads(monkeypatch):
+    r"""Tests `AsyncUGrid` gets topologies, data and attributes like `UGrid`."""
+
+    files = create_files(monkeypatch, num_files=1)
+    monkeypatch.setattr(ugrid.aio, "UGrid", SlowUGrid)
+
+    async def read():
+        async with AsyncUGrid("run_0000.nc") as ug:
+            counts = [
+                await ug.network1d_get_num_topologies(),
+                await ug.mesh1d_get_num_topologies(),
+                await ug.mesh2d_get_num_topologies(),
+                await ug.contacts_get_num_topologies(),
+            ]
+            mesh2d = await ug.mesh2d_get(0)
+            data = await ug.variable_get_data_double("mesh2d_s1")
+            attributes = await ug.variable_get_attributes("mesh2d_s1")
+        assert not ug.is_open
+        return counts, mesh2d, data, attributes
+
+    counts, mesh2d, data, attributes = asyncio.run(read())
+    assert counts == [0, 0, 1, 0]
+    assert mesh2d is files["run_0000.nc"]["mesh2d"]
+    assert_array_equal(data, files["run_0000.nc"]["mesh2d_s1"].ravel())
+    assert attributes == {"units": "m", "long_name": "water level"}
+
+    async def read_closed():
+        ug = AsyncUGrid("run_0000.nc")
+        await ug.mesh2d_get(0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(read_closed())
+
+
+def test_async_ugrid_serializes_per_file(monkeypatch):
+    r"""Tests the calls on a file are serialized, also between objects, while files are read concurrently
+    without blocking the loop."""
+
+    create_files(monkeypatch, num_files=2)
+    monkeypatch.setattr(ugrid.aio, "UGrid", SlowUGrid)
+    monkeypatch.setattr(SlowUGrid, "running", {})
+    monkeypatch.setattr(SlowUGrid, "most_running", {})
+    executor = ThreadPoolExecutor(max_workers=4)
+
+    async def read_all():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def tick():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.ensure_future(tick())
+        files = [
+            AsyncUGrid(file_path, executor=executor)
+            for file_path in ("run_0000.nc", "run_0000.nc", "run_0001.nc")
+        ]
+        for ug in files:
+            await ug.open()
+        await asyncio.gather(
+            *[
+                ug.variable_get_data_double("mesh2d_s1")
+                for ug in files
+                for _ in range(3)
+            ]
+        )
+        for ug in files:
+            await ug.close()
+        done.set()
+        await ticker
+        return ticks
+
+    ticks = asyncio.run(read_all())
+    executor.shutdown()
+    assert SlowUGrid.most_running["run_0000.nc"] == 1
+    assert SlowUGrid.most_running["run_0001.nc"] == 1
+    assert SlowUGrid.most_running["all"] == 2
+    # The loop kept running while the reads were blocking
+    assert ticks > 10
+
+
+def test_async_ugrid_cancelled_call_keeps_the_file(monkeypatch):
+    r"""Tests a cancelled call keeps its file until the native call returns, so closing waits for it."""
+
+    files = create_files(monkeypatch, num_files=1)
+    monkeypatch.setattr(ugrid.aio, "UGrid", SlowUGrid)
+    monkeypatch.setattr(SlowUGrid, "running", {})
+    monkeypatch.setattr(SlowUGrid, "closed_while_reading", [])
+
+    async def read_and_cancel():
+        ug = await AsyncUGrid("run_0000.nc").open()
+        read = asyncio.ensure_future(ug.variable_get_data_double("mesh2d_s1"))
+        await asyncio.sleep(0.01)
+        read.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await read
+        await ug.close()
+        second = await AsyncUGrid("run_0000.nc").open()
+        data = await second.variable_get_data_double("mesh2d_s1")
+        await second.close()
+        return data
+
+    data = asyncio.run(read_and_cancel())
+    assert SlowUGrid.closed_while_reading == []
+    assert_array_equal(data, files["run_0000.nc"]["mesh2d_s1"].ravel())
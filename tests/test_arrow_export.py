@@ -0,0 +1,126 @@
+import sys
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from scipy.io import netcdf_file
+from test_mesh2d import create_ugrid_mesh2d
+from test_zarr_export import ExportUGrid
+
+import ugrid.arrow_export
+import ugrid.file_inventory
+from ugrid import InputError, data_to_arrow, export_parquet, mesh2d_to_arrow
+
+
+class ParquetUGrid(ExportUGrid):
+    r"""Stands for `UGrid` over a NetCDF classic file with the test mesh2d, a water level and a layered velocity."""
+
+    def topology_get_data_variables(self, topology_id, topology_type, location):
+        return ["mesh2d_s1", "mesh2d_ucx"] if location == 2 else []
+
+    def variable_get_dimensions(self, variable_name):
+        shape = [6, 9] if variable_name == "mesh2d_s1" else [6, 9, 3]
+        return np.array(shape, dtype=np.int32)
+
+    def mesh2d_get(self, topology_id):
+        mesh2d = create_ugrid_mesh2d()
+        mesh2d.start_index = 1
+        return mesh2d
+
+
+def create_source(file_path, monkeypatch, num_times=6):
+    r"""Writes a NetCDF classic file with a water level and a layered velocity on the faces of the test mesh2d."""
+
+    with netcdf_file(file_path, "w") as file:
+        file.createDimension("time", None)
+        file.createDimension("nmesh2d_face", 9)
+        file.createDimension("nmesh2d_layer", 3)
+        file.createVariable("time", "f8", ("time",))[:] = 60.0 * np.arange(num_times)
+        s1 = file.createVariable("mesh2d_s1", "f4", ("time", "nmesh2d_face"))
+        s1[:] = np.arange(num_times)[:, np.newaxis] + np.arange(9) / 10.0
+        ucx = file.createVariable(
+            "mesh2d_ucx", "f8", ("time", "nmesh2d_face", "nmesh2d_layer")
+        )
+        ucx[:] = np.ones((num_times, 9, 3))
+    monkeypatch.setattr(ugrid.file_inventory, "UGrid", ParquetUGrid)
+    monkeypatch.setattr(ugrid.arrow_export, "UGrid", ParquetUGrid)
+
+
+def test_mesh2d_to_arrow_shares_connectivity():
+    r"""Tests `mesh2d_to_arrow` builds fixed-size list connectivity columns on the memory of the mesh2d."""
+
+    pa = pytest.importorskip("pyarrow")
+    mesh2d = create_ugrid_mesh2d()
+
+    tables = mesh2d_to_arrow(mesh2d)
+
+    faces = tables["faces"]
+    assert faces.num_rows == 9
+    assert faces.column_names == ["face", "x", "y", "nodes"]
+    assert faces.schema.field("nodes").type == pa.list_(pa.int32(), 4)
+    nodes = faces.column("nodes").chunk(0)
+    assert nodes.values.buffers()[1].address == mesh2d.face_nodes.ctypes.data
+    assert_array_equal(
+        nodes.values.to_numpy().reshape(-1, 4), mesh2d.face_nodes.reshape(-1, 4)
+    )
+    assert tables["edges"].num_rows == 24
+    assert tables["nodes"].column_names == ["node", "x", "y"]
+    assert faces.schema.metadata[b"mesh"] == b"mesh2d"
+
+
+def test_data_to_arrow_long_format():
+    r"""Tests `data_to_arrow` writes a row per time and entity, and rejects times which do not match the data."""
+
+    pytest.importorskip("pyarrow")
+    data = np.arange(6.0).reshape(2, 3)
+
+    table = data_to_arrow("s1", data, "face", times=[10.0, 20.0])
+
+    assert table.column_names == ["time", "face", "s1"]
+    assert_array_equal(table.column("time").to_numpy(), [10, 10, 10, 20, 20, 20])
+    assert_array_equal(table.column("face").to_numpy(), [0, 1, 2, 0, 1, 2])
+    assert_array_equal(table.column("s1").to_numpy(), np.arange(6.0))
+    assert data_to_arrow("z", np.zeros(3), "node").column_names == ["node", "z"]
+    with pytest.raises(InputError):
+        data_to_arrow("s1", data, "face", times=[10.0])
+
+
+def test_export_parquet_in_row_groups(tmp_path, monkeypatch):
+    r"""Tests `export_parquet` writes the mesh tables and the supported variables in row groups of whole time steps."""
+
+    pytest.importorskip("pyarrow")
+    import pyarrow.parquet as pq
+
+    create_source(tmp_path / "map.nc", monkeypatch)
+
+    written = export_parquet(
+        tmp_path / "map.nc", tmp_path / "tables", row_group_rows=20
+    )
+
+    assert set(written) == {"nodes", "edges", "faces", "mesh2d_s1"}
+    assert written["faces"] == tmp_path / "tables" / "mesh2d_faces.parquet"
+    assert pq.read_table(written["faces"]).num_rows == 9
+    file = pq.ParquetFile(written["mesh2d_s1"])
+    assert file.num_row_groups == 3
+    assert file.metadata.row_group(0).num_rows == 18
+    table = file.read()
+    assert table.schema.metadata[b"location"] == b"face"
+    assert table.num_rows == 54
+    assert_array_equal(table.column("time").to_numpy()[::9], 60.0 * np.arange(6))
+    assert_array_equal(
+        table.column("mesh2d_s1").to_numpy(),
+        (np.arange(6)[:, np.newaxis] + np.arange(9) / 10.0).astype(np.float32).ravel(),
+    )
+
+    with pytest.raises(InputError):
+        export_parquet(
+            tmp_path / "map.nc", tmp_path / "tables", variables=["mesh2d_ucx"]
+        )
+
+
+def test_export_without_pyarrow(monkeypatch):
+    r"""Tests the Arrow exports explain how to install the optional pyarrow package when it is missing."""
+
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="UGrid\\[arrow\\]"):
+        mesh2d_to_arrow(create_ugrid_mesh2d())
@@ -0,0 +1,149 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from test_dataset import FakeUGrid, create_files
+
+import ugrid.batch
+from ugrid.batch import find_files, main, run_batch, statistics_task
+
+
+def size_task(file_path):
+    r"""A picklable task returning the size of a file, failing on files named `bad*`."""
+
+    if "bad" in file_path:
+        raise ValueError("bad file")
+    with open(file_path, "rb") as file:
+        return len(file.read())
+
+
+def crash_task(file_path):
+    r"""A picklable task killing its worker process on files named `crash*`, as a crash of the native library would."""
+
+    if "crash" in file_path:
+        os._exit(1)
+    return size_task(file_path)
+
+
+def create_directory(tmp_path, names):
+    r"""Creates files with one byte per character of their name."""
+
+    for name in names:
+        (tmp_path / name).write_bytes(name.encode())
+    return tmp_path
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_run_batch_isolates_errors(tmp_path, max_workers):
+    r"""Tests `run_batch` keeps the order of the files and records the failures per file."""
+
+    names = [f"run_{i:04d}.nc" for i in range(10)] + ["bad_0000.nc"]
+    directory = create_directory(tmp_path, names)
+    file_paths = find_files(directory)
+    assert len(file_paths) == 11
+    assert file_paths[0].endswith("bad_0000.nc")
+
+    progress = []
+    report = run_batch(
+        file_paths,
+        size_task,
+        max_workers=max_workers,
+        chunksize=2,
+        progress=lambda done, total, result: progress.append((done, total)),
+    )
+
+    assert [result.file_path for result in report.results] == file_paths
+    assert len(report.failed) == 1
+    assert report.failed[0].error == "ValueError: bad file"
+    assert [result.value for result in report.results[1:]] == [11] * 10
+    assert report.num_bytes == 11 * 11
+    assert progress[-1] == (11, 11)
+    assert report.files_per_second > 0.0
+    assert "1 failed" in str(report)
+
+
+def test_run_batch_survives_dead_workers(tmp_path):
+    r"""Tests `run_batch` restarts the pool when a worker dies and only fails the file that killed it."""
+
+    names = [f"run_{i:04d}.nc" for i in range(12)] + ["crash_0000.nc", "crash_0001.nc"]
+    file_paths = find_files(create_directory(tmp_path, names))
+
+    report = run_batch(file_paths, crash_task, max_workers=3, chunksize=3)
+
+    assert [result.file_path for result in report.failed] == file_paths[:2]
+    assert report.failed[0].error.startswith("BrokenProcessPool")
+    assert [result.value for result in report.results[2:]] == [11] * 12
+
+
+def test_statistics_task_ignores_fill_values(monkeypatch):
+    r"""Tests `statistics_task` leaves the NaN values and the `_FillValue` entries out of the statistics."""
+
+    files = create_files(monkeypatch, num_files=1, num_times=2)
+    file = files["run_0000.nc"]
+    file["mesh2d_s1"] = np.array([[1.0, -999.0], [np.nan, 3.0]])
+    file["attributes"] = {"mesh2d_s1": {"units": "m", "_FillValue": "-999.0"}}
+    monkeypatch.setattr(ugrid.batch, "UGrid", FakeUGrid)
+
+    statistics = statistics_task("run_0000.nc", ["mesh2d_s1", "time"])
+
+    assert statistics["mesh2d_s1"] == {"min": 1.0, "max": 3.0, "mean": 2.0, "count": 2}
+    assert statistics["time"]["count"] == 2
+
+
+def test_main_statistics(tmp_path, monkeypatch, capsys):
+    r"""Tests the statistics operation of the command line interface."""
+
+    files = create_files(monkeypatch, num_files=2)
+    directory = create_directory(tmp_path, files)
+    for name in list(files):
+        files[str(directory / name)] = files.pop(name)
+    monkeypatch.setattr(ugrid.batch, "UGrid", FakeUGrid)
+
+    status = main(
+        ["statistics", str(directory), "--variables", "mesh2d_s1", "--workers", "1"]
+    )
+
+    assert status == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 2
+    _, variable_name, minimum, maximum, mean, count = lines[1].split("\t")
+    assert variable_name == "mesh2d_s1"
+    assert float(minimum) == 4.0
+    assert float(maximum) == pytest.approx(7.1)
+    assert float(mean) == pytest.approx(np.mean(np.arange(4, 8)) + 0.05)
+    assert int(count) == 8
+
+
+def test_main_stations(tmp_path, monkeypatch):
+    r"""Tests the stations operation of the command line interface takes the faces with the nearest center."""
+
+    files = create_files(monkeypatch, num_files=2)
+    directory = tmp_path / "input"
+    directory.mkdir()
+    create_directory(directory, files)
+    for name in list(files):
+        file = files.pop(name)
+        file["mesh2d_ucmag"] = file["time"][:, np.newaxis] * 10.0 + np.arange(9)
+        files[str(directory / name)] = file
+    monkeypatch.setattr(ugrid.batch, "UGrid", FakeUGrid)
+    stations = tmp_path / "stations.csv"
+    stations.write_text("2.4,0.6\n0.4,2.6\n")
+    output = tmp_path / "output"
+
+    arguments = ["--stations", str(stations), "--output", str(output)]
+    arguments += ["--workers", "1", "--quiet"]
+
+    status = main(
+        ["stations", str(directory), "--variables", "mesh2d_ucmag"] + arguments
+    )
+
+    assert status == 0
+    extracted = np.load(output / "run_0001_stations.npz")
+    assert_array_equal(extracted["face"], [6, 2])
+    assert_array_equal(
+        extracted["mesh2d_ucmag"], np.arange(4, 8)[:, np.newaxis] * 10.0 + [6, 2]
+    )
+    # A variable not located on the faces fails the files, not the batch
+    status = main(["stations", str(directory), "--variables", "mesh2d_s1"] + arguments)
+    assert status == 1
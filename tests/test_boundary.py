@@ -0,0 +1,92 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+from test_mesh2d import create_ugrid_mesh2d
+
+from ugrid import FaceNodesCSR, extract_mesh2d_boundary
+from ugrid.utils import find_edges
+
+
+def create_mesh2d_with_hole():
+    r"""Creates the 3x3 test mesh2d without its central face, with the edge faces connectivity"""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    keep = np.arange(9) != 4
+    mesh2d.face_nodes = mesh2d.face_nodes.reshape(-1, 4)[keep].ravel()
+    mesh2d.face_x = mesh2d.face_x[keep]
+    mesh2d.face_y = mesh2d.face_y[keep]
+
+    # Edge faces of the mesh2d edges, one-based with fill values
+    derived_edge_nodes, derived_edge_faces, _ = FaceNodesCSR.from_mesh2d(mesh2d).edges()
+    derived_keys = derived_edge_nodes[:, 0] * 16 + derived_edge_nodes[:, 1]
+    edge_nodes = mesh2d.edge_nodes.reshape(-1, 2) - 1
+    keys = edge_nodes.min(axis=1) * 16 + edge_nodes.max(axis=1)
+    edge_faces = derived_edge_faces[np.searchsorted(derived_keys, keys)]
+    mesh2d.edge_faces = (
+        np.where(edge_faces < 0, -999, edge_faces + 1).astype(np.int32).ravel()
+    )
+    return mesh2d
+
+
+def test_extract_mesh2d_boundary_from_face_nodes():
+    r"""Tests `extract_mesh2d_boundary` derives the outer ring from the face nodes."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    boundary = extract_mesh2d_boundary(mesh2d)
+
+    assert boundary.num_rings == 1
+    assert_array_equal(boundary.ring_area, [9.0])
+    assert_array_equal(boundary.ring_offsets, [0, 12])
+    assert_array_equal(boundary.ring_nodes, [0, 1, 8, 12, 13, 14, 15, 11, 7, 6, 4, 2])
+    assert_array_equal(
+        np.sort(boundary.edges), [0, 3, 4, 7, 8, 11, 12, 13, 14, 21, 22, 23]
+    )
+    assert_array_equal(boundary.nodes, [0, 1, 2, 4, 6, 7, 8, 11, 12, 13, 14, 15])
+
+    x, y, offsets = boundary.ring_coordinates(mesh2d.node_x, mesh2d.node_y)
+    assert_array_equal(offsets, [0, 13])
+    assert (x[0], y[0]) == (x[-1], y[-1])
+
+
+def test_extract_mesh2d_boundary_with_hole_from_edge_faces():
+    r"""Tests `extract_mesh2d_boundary` finds the outer ring and the hole using the edge faces."""
+
+    mesh2d = create_mesh2d_with_hole()
+    boundary = extract_mesh2d_boundary(mesh2d)
+
+    assert boundary.num_rings == 2
+    assert_array_equal(boundary.ring_area, [9.0, -1.0])
+    assert_array_equal(boundary.ring_is_hole, [False, True])
+    hole = boundary.ring_nodes[boundary.ring_offsets[1] : boundary.ring_offsets[2]]
+    assert_array_equal(np.sort(hole), [3, 5, 9, 10])
+    edge_nodes = mesh2d.edge_nodes.reshape(-1, 2) - 1
+    assert_array_equal(
+        np.sort(edge_nodes[boundary.edges], axis=1),
+        np.sort(boundary.edge_nodes, axis=1),
+    )
+
+
+def test_extract_mesh2d_boundary_of_clockwise_faces():
+    r"""Tests `extract_mesh2d_boundary` orients the rings counterclockwise for clockwise faces."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    expected = extract_mesh2d_boundary(mesh2d)
+
+    mesh2d.face_nodes = mesh2d.face_nodes.reshape(-1, 4)[:, ::-1].ravel()
+    boundary = extract_mesh2d_boundary(mesh2d)
+
+    assert_array_equal(boundary.ring_area, expected.ring_area)
+    assert_array_equal(boundary.ring_nodes, expected.ring_nodes)
+
+
+def test_find_edges():
+    r"""Tests `find_edges` locates node pairs in either orientation and flags missing ones."""
+
+    edge_nodes = np.array([[0, 1], [2, 1], [3, 0]])
+    first = np.array([1, 1, 0, 2, 3])
+    second = np.array([0, 2, 3, 3, 0])
+
+    assert_array_equal(find_edges(first, second, edge_nodes, 4), [0, 1, 2, -1, 2])
+    assert_array_equal(find_edges(first, second, edge_nodes[:0], 4), [-1] * 5)
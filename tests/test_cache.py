@@ -0,0 +1,166 @@
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from test_dataset import FakeUGrid, create_files
+
+import ugrid.cache
+from ugrid import (
+    DiskCache,
+    InputError,
+    TopologyCache,
+    default_topology_cache,
+    fingerprint,
+)
+from ugrid.c_structures import CUGridMesh2D
+
+
+def create_cached_files(tmp_path, monkeypatch):
+    r"""Creates UGrid files on disk, whose content is served by `FakeUGrid`."""
+
+    files = create_files(monkeypatch, num_files=2)
+    for name in list(files):
+        path = tmp_path / name
+        path.write_bytes(b"CDF")
+        files[str(path)] = files.pop(name)
+    monkeypatch.setattr(ugrid.cache, "UGrid", FakeUGrid)
+    return files
+
+
+def test_disk_cache_serves_memory_mapped_topologies(tmp_path, monkeypatch):
+    r"""Tests `DiskCache.get` reads a topology once and then loads it memory mapped."""
+
+    files = create_cached_files(tmp_path, monkeypatch)
+    file_path = str(tmp_path / "run_0000.nc")
+    mesh2d = files[file_path]["mesh2d"]
+    cache = DiskCache(tmp_path / "cache")
+
+    first = cache.get(file_path)
+    assert first is mesh2d
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    FakeUGrid.opened.clear()
+    second = DiskCache(tmp_path / "cache").get(file_path)
+    assert FakeUGrid.opened == []
+    assert isinstance(second.node_x, np.memmap)
+    assert_array_equal(second.node_x, mesh2d.node_x)
+    assert_array_equal(second.face_nodes, mesh2d.face_nodes)
+    assert second.start_index == mesh2d.start_index
+    assert fingerprint(second) == fingerprint(mesh2d)
+    assert cache.fingerprint(cache.key(file_path)) == fingerprint(mesh2d)
+    with pytest.raises(ValueError):
+        second.node_x[0] = 1.0
+
+
+def test_disk_cache_is_keyed_by_file_identity(tmp_path, monkeypatch):
+    r"""Tests rewriting a file or asking for another topology misses the cache."""
+
+    create_cached_files(tmp_path, monkeypatch)
+    file_path = tmp_path / "run_0000.nc"
+    cache = DiskCache(tmp_path / "cache")
+
+    key = cache.key(file_path)
+    assert cache.key(tmp_path / "run_0001.nc") != key
+    assert cache.key(file_path, "mesh2d", 1) != key
+    cache.get(file_path)
+    cache.get(file_path)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    status = os.stat(file_path)
+    os.utime(file_path, ns=(status.st_atime_ns, status.st_mtime_ns + 1_000_000_000))
+    assert cache.key(file_path) != key
+    cache.get(file_path)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    cache.clear()
+    assert cache.load(key) is None
+    with pytest.raises(InputError):
+        cache.key(file_path, "mesh3d")
+
+
+def test_topology_cache_returns_read_only_copies(tmp_path, monkeypatch):
+    r"""Tests `TopologyCache.get` reads a topology once and protects the cached arrays and object."""
+
+    files = create_cached_files(tmp_path, monkeypatch)
+    file_path = str(tmp_path / "run_0000.nc")
+    cache = TopologyCache()
+
+    first = cache.get(file_path, "mesh2d", 0)
+    FakeUGrid.opened.clear()
+    second = cache.get(file_path, "mesh2d", 0)
+    assert FakeUGrid.opened == []
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert second is not first
+    assert second.node_x is first.node_x
+    assert fingerprint(second) == fingerprint(files[file_path]["mesh2d"])
+    with pytest.raises(ValueError):
+        second.node_x[0] = 1.0
+    second.node_x = np.zeros(3)
+    assert_array_equal(cache.get(file_path).node_x, first.node_x)
+
+    # A reader replaces opening the file, as used by UGrid
+    read = cache.get(
+        tmp_path / "run_0001.nc",
+        "mesh2d",
+        0,
+        lambda: files[str(tmp_path / "run_0001.nc")]["mesh2d"],
+    )
+    assert fingerprint(read) == fingerprint(
+        files[str(tmp_path / "run_0001.nc")]["mesh2d"]
+    )
+    assert default_topology_cache() is default_topology_cache()
+
+
+def test_cached_topologies_can_be_put(tmp_path, monkeypatch):
+    r"""Tests the read-only arrays of cached topologies convert to the C structures used by `mesh2d_put`."""
+
+    files = create_cached_files(tmp_path, monkeypatch)
+    file_path = str(tmp_path / "run_0000.nc")
+    mesh2d = files[file_path]["mesh2d"]
+    DiskCache(tmp_path / "cache").get(file_path)
+
+    for cached in (
+        TopologyCache().get(file_path),
+        DiskCache(tmp_path / "cache").get(file_path),
+    ):
+        assert not cached.node_x.flags.writeable
+        c_mesh2d = CUGridMesh2D.from_py_structure(cached, 80)
+        assert c_mesh2d.num_nodes == mesh2d.node_x.size
+        assert_array_equal(c_mesh2d.node_x[: mesh2d.node_x.size], mesh2d.node_x)
+        assert_array_equal(
+            c_mesh2d.face_node[: mesh2d.face_nodes.size], mesh2d.face_nodes
+        )
+
+
+def test_topology_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    r"""Tests `TopologyCache` keeps within its byte budget and invalidates files explicitly."""
+
+    create_cached_files(tmp_path, monkeypatch)
+    first, second = str(tmp_path / "run_0000.nc"), str(tmp_path / "run_0001.nc")
+    probe = TopologyCache()
+    probe.get(first)
+    num_bytes = probe.num_bytes
+    assert num_bytes > 0
+
+    cache = TopologyCache(max_bytes=num_bytes)
+    cache.get(first)
+    cache.get(second)
+    assert (len(cache), cache.evictions, cache.num_bytes) == (1, 1, num_bytes)
+    cache.get(first)
+    assert (cache.hits, cache.misses, cache.evictions) == (0, 3, 2)
+
+    cache = TopologyCache(max_bytes=3 * num_bytes)
+    cache.get(first)
+    cache.get(second)
+    assert cache.invalidate(first) == 1
+    assert cache.num_bytes == num_bytes
+    cache.get(first)
+    assert cache.misses == 3
+    assert cache.invalidate() == 2
+    assert (len(cache), cache.num_bytes) == (0, 0)
+
+    # Topologies larger than the budget are read but not cached
+    cache = TopologyCache(max_bytes=num_bytes - 1)
+    cache.get(first)
+    assert len(cache) == 0
@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from test_mesh2d import create_ugrid_mesh2d
+
+from ugrid import FaceNodesCSR, InputError
+
+
+def create_mixed_face_nodes():
+    r"""Creates a padded face nodes array with a triangle, a quadrilateral and a pentagon"""
+
+    node_x = np.array([0.0, 1.0, 1.0, 0.0, 2.0, 2.0, 1.5], dtype=np.double)
+    node_y = np.array([0.0, 0.0, 1.0, 1.0, 0.0, 1.0, 2.0], dtype=np.double)
+    face_nodes = np.array(
+        [0, 1, 3, -999, -999, 1, 2, 3, -999, -999, 1, 4, 5, 6, 2],
+        dtype=np.int32,
+    )
+    return node_x, node_y, face_nodes
+
+
+def test_face_nodes_csr_from_uniform_mesh2d_is_a_view():
+    r"""Tests `FaceNodesCSR.from_mesh2d` does not copy the face nodes of a mesh without padding."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    csr = FaceNodesCSR.from_mesh2d(mesh2d)
+
+    assert csr.num_faces == 9
+    assert csr.is_uniform
+    assert np.shares_memory(csr.indices, mesh2d.face_nodes)
+    assert csr.to_padded() is csr.indices
+
+    assert_allclose(csr.face_area(mesh2d.node_x, mesh2d.node_y), np.ones(9))
+    centroid_x, centroid_y = csr.face_centroid(mesh2d.node_x, mesh2d.node_y)
+    assert_allclose(centroid_x, mesh2d.face_x)
+    assert_allclose(centroid_y, mesh2d.face_y)
+
+
+def test_face_nodes_csr_round_trip_with_buffers():
+    r"""Tests the conversions between padded and ragged face nodes, reusing buffers."""
+
+    _, _, face_nodes = create_mixed_face_nodes()
+    out_offsets = np.empty(4, dtype=np.int64)
+    out_indices = np.empty(15, dtype=np.int32)
+
+    csr = FaceNodesCSR.from_padded(
+        face_nodes, 5, out_offsets=out_offsets, out_indices=out_indices
+    )
+
+    assert csr.offsets is out_offsets
+    assert np.shares_memory(csr.indices, out_indices)
+    assert_array_equal(csr.nodes_per_face, [3, 3, 5])
+    assert_array_equal(csr.indices, [0, 1, 3, 1, 2, 3, 1, 4, 5, 6, 2])
+
+    out = np.empty(15, dtype=np.int32)
+    assert csr.to_padded(out=out) is out
+    assert_array_equal(out, face_nodes)
+
+    with pytest.raises(InputError):
+        csr.to_padded(4)
+
+
+def test_face_nodes_csr_geometry_and_edges():
+    r"""Tests areas, centroids and derived edges computed on the ragged face nodes."""
+
+    node_x, node_y, face_nodes = create_mixed_face_nodes()
+    csr = FaceNodesCSR.from_padded(face_nodes, 5)
+
+    assert_allclose(csr.face_area(node_x, node_y), [0.5, 0.5, 1.5])
+    centroid_x, centroid_y = csr.face_centroid(node_x, node_y)
+    assert_allclose(centroid_x[:2], [1.0 / 3.0, 2.0 / 3.0])
+    assert_allclose(centroid_y[:2], [1.0 / 3.0, 2.0 / 3.0])
+
+    edge_nodes, edge_faces, face_edges = csr.edges()
+    assert edge_nodes.shape == (9, 2)
+    shared = np.flatnonzero(edge_faces[:, 1] >= 0)
+    assert_array_equal(edge_nodes[shared], [[1, 2], [1, 3]])
+    assert_array_equal(edge_faces[shared], [[1, 2], [0, 1]])
+    assert_array_equal(
+        np.sort(edge_nodes[face_edges], axis=1)[:3],
+        [[0, 1], [1, 3], [0, 3]],
+    )
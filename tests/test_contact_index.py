@@ -0,0 +1,186 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from test_contacts import create_contacts
+from test_mesh2d import create_ugrid_mesh2d
+
+import ugrid.contacts
+from ugrid import (
+    ContactIndex,
+    InputError,
+    UGridContacts,
+    UGridMesh1D,
+    UGridMesh2D,
+    generate_contacts,
+)
+from ugrid.utils import points_in_polygons
+
+
+def create_small_contacts():
+    r"""Creates contacts from four mesh1d nodes to five mesh2d faces, mesh1d node 2 has no contact"""
+
+    edges = np.array([0, 4, 1, 2, 0, 1, 3, 0, 0, 3], dtype=np.int32)
+    return UGridContacts(
+        name="contacts",
+        edges=edges,
+        mesh_from_name="mesh1d",
+        mesh_to_name="mesh2d",
+        mesh_from_location=0,
+        mesh_to_location=2,
+    )
+
+
+def test_contact_index_offsets():
+    r"""Tests the index of the contacts by their from and to entities."""
+
+    index = ContactIndex(create_small_contacts(), num_from_entities=4)
+
+    offsets, contacts = index.index("from")
+    assert_array_equal(offsets, [0, 3, 4, 4, 5])
+    assert_array_equal(contacts, [0, 2, 4, 1, 3])
+    offsets, contacts = index.index("to")
+    assert_array_equal(offsets, [0, 1, 2, 3, 4, 5])
+    assert index.index("to")[1] is contacts
+
+
+def test_contact_index_linked():
+    r"""Tests the entities linked to several entities are gathered at once."""
+
+    index = ContactIndex(create_small_contacts(), num_from_entities=4)
+
+    offsets, faces = index.linked([0, 2, 3], "from")
+    assert_array_equal(offsets, [0, 3, 3, 4])
+    assert_array_equal(faces, [4, 1, 3, 0])
+    offsets, nodes = index.linked([1, 2], "to")
+    assert_array_equal(nodes, [0, 1])
+
+    with pytest.raises(InputError):
+        index.linked([4], "from")
+
+
+def test_contact_index_reduce_and_transfer():
+    r"""Tests contact and face values are summed per mesh1d node, for several time steps at once."""
+
+    index = ContactIndex(create_small_contacts(), num_from_entities=4)
+
+    contact_values = np.array(
+        [[1.0, 2.0, 3.0, 4.0, 5.0], [10.0, 20.0, 30.0, 40.0, 50.0]]
+    )
+    assert_allclose(
+        index.reduce(contact_values, "from"),
+        [[9.0, 2.0, 0.0, 4.0], [90.0, 20.0, 0.0, 40.0]],
+    )
+
+    face_flux = np.array([0.5, 1.0, 2.0, 4.0, 8.0])
+    assert_allclose(index.transfer(face_flux, "to"), [13.0, 2.0, 0.0, 0.5])
+    assert_allclose(
+        index.transfer(face_flux, "to", np.maximum, np.nan), [8.0, 2.0, np.nan, 0.5]
+    )
+    assert_allclose(index.transfer(np.arange(4.0), "from"), [3.0, 0.0, 1.0, 0.0, 0.0])
+
+
+def test_contact_index_from_test_contacts():
+    r"""Tests every contact of the test contacts is indexed once on each side."""
+
+    contacts = create_contacts()
+    index = ContactIndex(contacts)
+
+    for side in ("from", "to"):
+        offsets, indexed = index.index(side)
+        assert offsets[-1] == index.num_contacts
+        assert_array_equal(np.sort(indexed), np.arange(index.num_contacts))
+
+
+def create_mesh1d_over_mesh2d():
+    r"""Creates a mesh1d with four nodes over the 3x3 test mesh2d, the last node lies outside the mesh2d"""
+
+    node_x = np.array([0.5, 2.2, 1.1, 5.0])
+    node_y = np.array([0.5, 1.7, 2.9, 5.0])
+    return UGridMesh1D(
+        name="mesh1d",
+        network_name="network",
+        node_edge_id=np.zeros(4, dtype=np.int32),
+        node_edge_offset=np.arange(4, dtype=np.double),
+        node_x=node_x,
+        node_y=node_y,
+        edge_node=np.array([0, 1, 1, 2, 2, 3], dtype=np.int32),
+    )
+
+
+def test_generate_contacts_containing():
+    r"""Tests every mesh1d node is connected to the face containing it."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    contacts = generate_contacts(create_mesh1d_over_mesh2d(), mesh2d)
+
+    assert_array_equal(contacts.edges, [0, 0, 1, 7, 2, 5])
+    assert_array_equal(contacts.contact_type, [3, 3, 3])
+    assert contacts.contact_name_id == ["0_0", "1_7", "2_5"]
+    assert contacts.mesh_from_name == "mesh1d" and contacts.mesh_to_name == "mesh2d"
+
+
+def test_generate_contacts_nearest_and_polygon():
+    r"""Tests the nearest face method, limited by a distance or a polygon."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    mesh1d = create_mesh1d_over_mesh2d()
+
+    contacts = generate_contacts(mesh1d, mesh2d, "nearest")
+    assert_array_equal(contacts.edges, [0, 0, 1, 7, 2, 5, 3, 8])
+    contacts = generate_contacts(mesh1d, mesh2d, "nearest", max_distance=1.0)
+    assert_array_equal(contacts.edges, [0, 0, 1, 7, 2, 5])
+
+    polygon = ([1.0, 3.0, 3.0, 1.0], [0.0, 0.0, 3.0, 3.0])
+    contacts = generate_contacts(mesh1d, mesh2d, polygon=polygon)
+    assert_array_equal(contacts.edges, [1, 7, 2, 5])
+
+    with pytest.raises(InputError):
+        generate_contacts(mesh1d, mesh2d, "farthest")
+
+
+def test_generate_contacts_containing_outside_the_mesh2d(monkeypatch):
+    r"""Tests mesh1d nodes in a hole of the mesh2d or beyond it only test the faces around them."""
+
+    # A 20x20 mesh2d of unit squares, without the faces of [5, 15] x [5, 15]
+    node_y, node_x = np.divmod(np.arange(21 * 21, dtype=np.double), 21)
+    corner = np.arange(21 * 21).reshape(21, 21)[:-1, :-1].ravel()
+    face_nodes = np.stack([corner, corner + 1, corner + 22, corner + 21], axis=1)
+    hole = np.all((node_x[face_nodes] >= 5) & (node_x[face_nodes] <= 15), axis=1) & (
+        np.all((node_y[face_nodes] >= 5) & (node_y[face_nodes] <= 15), axis=1)
+    )
+    face_nodes = face_nodes[~hole]
+    mesh2d = UGridMesh2D(
+        name="mesh2d",
+        node_x=node_x,
+        node_y=node_y,
+        edge_node=np.array([], dtype=np.int32),
+        face_nodes=face_nodes.astype(np.int32).ravel(),
+        face_x=node_x[face_nodes].mean(axis=1),
+        face_y=node_y[face_nodes].mean(axis=1),
+        num_face_nodes_max=4,
+    )
+    mesh1d = UGridMesh1D(
+        name="mesh1d",
+        network_name="network",
+        node_edge_id=np.zeros(4, dtype=np.int32),
+        node_edge_offset=np.zeros(4),
+        node_x=np.array([0.5, 10.0, 7.3, 50.0]),
+        node_y=np.array([0.5, 10.0, 12.1, -3.0]),
+        edge_node=np.array([], dtype=np.int32),
+    )
+    tested = []
+
+    def counting_points_in_polygons(x, *args):
+        tested.append(x.size)
+        return points_in_polygons(x, *args)
+
+    monkeypatch.setattr(
+        ugrid.contacts, "points_in_polygons", counting_points_in_polygons
+    )
+
+    contacts = generate_contacts(mesh1d, mesh2d)
+
+    assert_array_equal(contacts.edges, [0, 0])
+    assert sum(tested) <= 16
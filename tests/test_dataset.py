@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from test_mesh2d import create_ugrid_mesh2d
+
+import ugrid.dataset
+from ugrid import InputError, MultiFileDataset, read_many
+
+
+class FakeUGrid:
+    r"""Stands for `UGrid` over in-memory files, recording the files opened."""
+
+    files = {}
+    opened = []
+
+    def __init__(self, file_path, method):
+        self.file = FakeUGrid.files[file_path]
+        FakeUGrid.opened.append(file_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+    def mesh2d_get(self, topology_id):
+        return self.file["mesh2d"]
+
+    def variable_get_dimensions(self, variable_name):
+        return np.array(self.file[variable_name].shape, dtype=np.int32)
+
+    def variable_get_attributes_names(self, variable_name):
+        return list(self.file.get("attributes", {}).get(variable_name, {}))
+
+    def variable_get_attributes_values(self, variable_name):
+        return list(self.file.get("attributes", {}).get(variable_name, {}).values())
+
+    def variable_get_data_double(self, variable_name):
+        return self.file[variable_name].ravel().astype(np.double)
+
+
+def create_files(monkeypatch, num_files=3, num_times=4):
+    r"""Creates in-memory time chunks of a water level on the faces of the same mesh2d."""
+
+    files = {}
+    for i in range(num_files):
+        mesh2d = create_ugrid_mesh2d()
+        mesh2d.start_index = 1
+        times = np.arange(i * num_times, (i + 1) * num_times, dtype=np.double)
+        files[f"run_{i:04d}.nc"] = {
+            "mesh2d": mesh2d,
+            "time": times,
+            "mesh2d_s1": times[:, np.newaxis] + np.arange(2) / 10.0,
+        }
+    monkeypatch.setattr(FakeUGrid, "files", files)
+    monkeypatch.setattr(FakeUGrid, "opened", [])
+    monkeypatch.setattr(ugrid.dataset, "UGrid", FakeUGrid)
+    return files
+
+
+def test_dataset_concatenates_along_time(monkeypatch):
+    r"""Tests `MultiFileDataset.get` concatenates a variable over all files, sorted by time."""
+
+    create_files(monkeypatch)
+    dataset = MultiFileDataset(["run_0002.nc", "run_0000.nc", "run_0001.nc"])
+
+    assert dataset.file_paths == ["run_0000.nc", "run_0001.nc", "run_0002.nc"]
+    assert_array_equal(dataset.times, np.arange(12))
+    times, data = dataset.get("mesh2d_s1")
+    assert_array_equal(times, np.arange(12))
+    assert data.shape == (12, 2)
+    assert_array_equal(data[:, 1], np.arange(12) + 0.1)
+
+
+def test_dataset_reads_overlapping_files_only(monkeypatch):
+    r"""Tests `MultiFileDataset.get` only opens the files overlapping the time range."""
+
+    create_files(monkeypatch)
+    dataset = MultiFileDataset(["run_0000.nc", "run_0001.nc", "run_0002.nc"])
+    FakeUGrid.opened.clear()
+
+    times, data = dataset.get("mesh2d_s1", time_start=5.0, time_end=6.5)
+    assert_array_equal(times, [5.0, 6.0])
+    assert_array_equal(data[:, 0], [5.0, 6.0])
+    assert FakeUGrid.opened == ["run_0001.nc"]
+
+    assert_array_equal(dataset.files_in_range(3.0, 8.0), [0, 1, 2])
+    assert_array_equal(dataset.files_in_range(3.5, 3.7), [])
+
+    def no_data(self, variable_name):
+        raise AssertionError("An empty time range must not read data")
+
+    monkeypatch.setattr(FakeUGrid, "variable_get_data_double", no_data)
+    times, data = dataset.get("mesh2d_s1", time_start=20.0)
+    assert times.size == 0
+    assert data.shape == (0, 2)
+
+
+def test_dataset_checks_topologies_and_times(monkeypatch):
+    r"""Tests `MultiFileDataset` rejects files with another mesh2d or overlapping times."""
+
+    files = create_files(monkeypatch)
+    files["run_0001.nc"]["mesh2d"].node_x = files["run_0001.nc"]["mesh2d"].node_x + 1.0
+    with pytest.raises(InputError):
+        MultiFileDataset(["run_0000.nc", "run_0001.nc"])
+    # The topology of the other files is not read when not checked
+    dataset = MultiFileDataset(["run_0000.nc", "run_0001.nc"], check_topology=False)
+    assert dataset.topology is files["run_0000.nc"]["mesh2d"]
+
+    files = create_files(monkeypatch)
+    files["run_0001.nc"]["time"] = files["run_0001.nc"]["time"] - 1.0
+    with pytest.raises(InputError):
+        MultiFileDataset(["run_0000.nc", "run_0001.nc"])
+
+
+def test_dataset_topology_of_unsorted_files(monkeypatch):
+    r"""Tests `MultiFileDataset` keeps the topology of the first file given when the files are not in time order."""
+
+    files = create_files(monkeypatch)
+    file_paths = ["run_0002.nc", "run_0000.nc", "run_0001.nc"]
+
+    for check_topology in (True, False):
+        dataset = MultiFileDataset(file_paths, check_topology=check_topology)
+        assert dataset.file_paths == sorted(file_paths)
+        assert dataset.topology is files["run_0002.nc"]["mesh2d"]
+
+
+def test_read_many_keeps_the_file_order(monkeypatch):
+    r"""Tests `read_many` returns the variables and topologies of every file in the order of the files."""
+
+    files = create_files(monkeypatch, num_files=6)
+    file_paths = sorted(files)[::-1]
+
+    for max_workers in (1, 4):
+        results = read_many(
+            file_paths,
+            variables=["time"],
+            topologies=["mesh2d", ("mesh2d", 0)],
+            max_workers=max_workers,
+        )
+        assert len(results) == len(file_paths)
+        for file_path, result in zip(file_paths, results):
+            assert_array_equal(result["time"], files[file_path]["time"])
+            assert result["mesh2d"] is files[file_path]["mesh2d"]
+            assert result[("mesh2d", 0)] is files[file_path]["mesh2d"]
+
+    with pytest.raises(InputError):
+        read_many(file_paths, topologies=["mesh3d"])
+    with pytest.raises(KeyError):
+        read_many(file_paths, variables=["missing"], max_workers=4)
+
+
+def test_read_many_without_pool_by_default(monkeypatch):
+    r"""Tests `read_many` reads the files one after the other unless more workers are asked for."""
+
+    files = create_files(monkeypatch)
+    monkeypatch.setattr(ugrid.dataset, "ThreadPoolExecutor", None)
+
+    results = read_many(sorted(files), variables=["time"])
+
+    assert FakeUGrid.opened == sorted(files)
+    assert_array_equal(results[2]["time"], files["run_0002.nc"]["time"])
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from test_contacts import create_contacts
+from test_mesh1d import create_mesh1d
+from test_mesh2d import create_ugrid_mesh2d
+from test_network1d import create_network1d
+
+from ugrid import InputError, fingerprint
+
+
+def test_fingerprint_is_stable():
+    r"""Tests topologies with the same content have the same fingerprint."""
+
+    for create in (create_ugrid_mesh2d, create_network1d, create_contacts):
+        first = fingerprint(create())
+        assert len(first) == 32
+        assert fingerprint(create()) == first
+
+    mesh1d = create_mesh1d()
+    other = create_mesh1d()
+    other.edge_edge_id = mesh1d.edge_edge_id.copy()
+    other.edge_edge_offset = mesh1d.edge_edge_offset.copy()
+    other.node_x = mesh1d.node_x.copy()
+    other.node_y = mesh1d.node_y.copy()
+    other.edge_x = mesh1d.edge_x.copy()
+    other.edge_y = mesh1d.edge_y.copy()
+    assert fingerprint(other) == fingerprint(mesh1d)
+
+
+def test_fingerprint_detects_changes():
+    r"""Tests any change of the content, including names, dtypes and views, changes the fingerprint."""
+
+    mesh2d = create_ugrid_mesh2d()
+    reference = fingerprint(mesh2d)
+
+    mesh2d.node_x = mesh2d.node_x.copy()
+    mesh2d.node_x[3] += 1e-12
+    assert fingerprint(mesh2d) != reference
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.name = "other"
+    assert fingerprint(mesh2d) != reference
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.face_nodes = mesh2d.face_nodes.astype(np.int64)
+    assert fingerprint(mesh2d) != reference
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.face_nodes = mesh2d.face_nodes.reshape(-1, 4)
+    assert fingerprint(mesh2d) != reference
+
+    network1d = create_network1d()
+    reference = fingerprint(network1d)
+    network1d.edge_id = ["other"]
+    assert fingerprint(network1d) != reference
+
+
+def test_fingerprint_non_contiguous_arrays():
+    r"""Tests non-contiguous arrays are hashed by content."""
+
+    mesh2d = create_ugrid_mesh2d()
+    reference = fingerprint(mesh2d)
+    doubled = np.repeat(mesh2d.node_x, 2)
+    mesh2d.node_x = doubled[::2]
+    assert fingerprint(mesh2d) == reference
+
+    with pytest.raises(InputError):
+        fingerprint(np.zeros(3))
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from test_network1d import create_network1d
+
+from ugrid import InputError, NetworkGraph, UGridNetwork1D
+
+
+def create_river_network1d():
+    r"""Creates a small river network: two tributaries joining at node 2, a third one joining at node 4,
+    and a separate branch between nodes 6 and 7"""
+
+    edge_node = np.array([0, 2, 1, 2, 2, 4, 3, 4, 4, 5, 6, 7], dtype=np.int32)
+    return UGridNetwork1D(
+        name="river",
+        node_x=np.arange(8, dtype=np.double),
+        node_y=np.zeros(8),
+        edge_node=edge_node,
+        edge_length=np.array([1.0, 2.0, 3.0, 4.0, 5.0, 1.0]),
+        edge_order=np.zeros(6, dtype=np.int32),
+        geometry_nodes_x=np.array([]),
+        geometry_nodes_y=np.array([]),
+        num_edge_geometry_nodes=np.zeros(6, dtype=np.int32),
+    )
+
+
+def test_network_graph_distances():
+    r"""Tests distances are computed from several sources at once, with or without the branch directions."""
+
+    graph = NetworkGraph(create_river_network1d())
+    distances = graph.distances([0, 3])
+
+    assert distances.shape == (2, 8)
+    assert_allclose(distances[0, :6], [0.0, 3.0, 1.0, 8.0, 4.0, 9.0])
+    assert np.isinf(distances[0, 6])
+    assert_allclose(graph.distances(0, directed=True)[0, [1, 5]], [np.inf, 9.0])
+
+    distance, closest = graph.nearest_source([0, 3])
+    assert_array_equal(closest[:6], [0, 0, 0, 3, 3, 3])
+    assert_array_equal(closest[6:], [-1, -1])
+    assert_allclose(distance[5], 9.0)
+
+
+def test_network_graph_shortest_path():
+    r"""Tests the nodes and branches of a shortest path."""
+
+    graph = NetworkGraph(create_river_network1d())
+    nodes, edges = graph.shortest_path(1, 3)
+
+    assert_array_equal(nodes, [1, 2, 4, 3])
+    assert_array_equal(edges, [1, 2, 3])
+    nodes, edges = graph.shortest_path(1, 3, directed=True)
+    assert nodes.size == 0 and edges.size == 0
+
+
+def test_network_graph_trace():
+    r"""Tests tracing downstream and upstream of nodes."""
+
+    graph = NetworkGraph(create_river_network1d())
+
+    nodes, edges = graph.trace([1])
+    assert_array_equal(nodes, [1, 2, 4, 5])
+    assert_array_equal(edges, [1, 2, 4])
+    nodes, edges = graph.trace([4, 7], "upstream")
+    assert_array_equal(nodes, [0, 1, 2, 3, 4, 6, 7])
+    assert_array_equal(edges, [0, 1, 2, 3, 5])
+
+    with pytest.raises(InputError):
+        graph.trace([1], "sideways")
+    with pytest.raises(InputError):
+        graph.trace([8])
+
+
+def test_network_graph_components_and_order():
+    r"""Tests the connected components and the Strahler order of the branches."""
+
+    graph = NetworkGraph(create_river_network1d())
+    count, node_labels, edge_labels = graph.connected_components()
+
+    assert count == 2
+    assert_array_equal(node_labels, [0, 0, 0, 0, 0, 0, 1, 1])
+    assert_array_equal(edge_labels, [0, 0, 0, 0, 0, 1])
+    assert_array_equal(graph.strahler_order(), [1, 1, 2, 1, 2, 1])
+
+
+def test_network_graph_from_test_network1d():
+    r"""Tests the graph of the test network1d, made of a single branch."""
+
+    graph = NetworkGraph(create_network1d())
+
+    assert graph.num_nodes == 2 and graph.num_edges == 1
+    assert_allclose(graph.distances([1])[0], [1165.29, 0.0])
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from test_mesh2d import create_ugrid_mesh2d
+
+from ugrid import InputError, MeshInterpolator
+
+
+def create_mesh2d():
+    r"""Creates the 3x3 test mesh2d with its one-based start index"""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    return mesh2d
+
+
+def linear_field(x, y):
+    r"""A linear field, which averaging over a symmetric stencil reproduces exactly"""
+
+    return x + 2.0 * y
+
+
+def test_mesh_interpolator_node_to_face():
+    r"""Tests the node to face operator reproduces a linear field at the face centers."""
+
+    mesh2d = create_mesh2d()
+    interpolator = MeshInterpolator(mesh2d)
+    node_data = linear_field(mesh2d.node_x, mesh2d.node_y)
+
+    for weighting in ("uniform", "distance"):
+        face_data = interpolator.interpolate(node_data, "node", "face", weighting)
+        assert_allclose(face_data, linear_field(mesh2d.face_x, mesh2d.face_y))
+
+
+def test_mesh_interpolator_face_to_node():
+    r"""Tests the face to node operator averages the faces around every node."""
+
+    mesh2d = create_mesh2d()
+    interpolator = MeshInterpolator(mesh2d)
+    face_data = np.arange(9, dtype=np.double)
+    node_data = interpolator.interpolate(face_data, "face", "node", "area")
+
+    # Node (0, 0) only touches face 0, node (1, 1) touches faces 0, 1, 3 and 4
+    assert node_data.shape == (16,)
+    assert_allclose(node_data[0], 0.0)
+    assert_allclose(node_data[3], 2.0)
+    assert_allclose(interpolator.operator("face", "node", "area").sum(axis=1), 1.0)
+
+
+def test_mesh_interpolator_edges():
+    r"""Tests the edge to face and face to edge operators, with the face edges derived from the face nodes."""
+
+    mesh2d = create_mesh2d()
+    interpolator = MeshInterpolator(mesh2d)
+    edge_nodes = mesh2d.edge_nodes.reshape(-1, 2) - 1
+    edge_x = mesh2d.node_x[edge_nodes].mean(axis=1)
+    edge_y = mesh2d.node_y[edge_nodes].mean(axis=1)
+
+    face_data = interpolator.interpolate(linear_field(edge_x, edge_y), "edge", "face")
+    assert_allclose(face_data, linear_field(mesh2d.face_x, mesh2d.face_y))
+
+    edge_data = interpolator.interpolate(np.ones(9), "face", "edge", "distance")
+    assert_allclose(edge_data, np.ones(edge_nodes.shape[0]))
+
+
+def test_mesh_interpolator_time_blocks():
+    r"""Tests blocks of time steps are interpolated along the requested axis, with cached operators."""
+
+    mesh2d = create_mesh2d()
+    interpolator = MeshInterpolator(mesh2d)
+    node_data = linear_field(mesh2d.node_x, mesh2d.node_y)
+    blocks = np.stack([node_data, 2.0 * node_data, 3.0 * node_data])
+
+    face_data = interpolator.interpolate(blocks, "node", "face")
+    assert face_data.shape == (3, 9)
+    assert_allclose(face_data[2], 3.0 * linear_field(mesh2d.face_x, mesh2d.face_y))
+
+    transposed = interpolator.interpolate(blocks.T, "node", "face", axis=0)
+    assert_allclose(transposed, face_data.T)
+    assert interpolator.operator("node", "face") is interpolator.operator(
+        "node", "face"
+    )
+
+
+def test_mesh_interpolator_invalid_arguments():
+    r"""Tests invalid locations, weightings and data sizes raise an InputError."""
+
+    interpolator = MeshInterpolator(create_mesh2d())
+
+    with pytest.raises(InputError):
+        interpolator.operator("node", "node")
+    with pytest.raises(InputError):
+        interpolator.operator("node", "face", "area")
+    with pytest.raises(InputError):
+        interpolator.operator("node", "volume")
+    with pytest.raises(InputError):
+        interpolator.interpolate(np.ones(5), "node", "face")
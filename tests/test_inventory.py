@@ -0,0 +1,113 @@
+import numpy as np
+
+import ugrid.file_inventory
+from ugrid import inventory
+
+
+class InquiryUGrid:
+    r"""Stands for `UGrid` with the answers of the inquiry calls for a file with one mesh2d and a water level."""
+
+    def __init__(self, file_path, method):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+    def entity_get_node_location_enum(self):
+        return 0
+
+    def entity_get_edge_location_enum(self):
+        return 1
+
+    def entity_get_face_location_enum(self):
+        return 2
+
+    def topology_get_network1d_enum(self):
+        return 0
+
+    def topology_get_mesh1d_enum(self):
+        return 1
+
+    def topology_get_mesh2d_enum(self):
+        return 2
+
+    def topology_get_contacts_enum(self):
+        return 3
+
+    def network1d_get_num_topologies(self):
+        return 0
+
+    def mesh1d_get_num_topologies(self):
+        return 0
+
+    def mesh2d_get_num_topologies(self):
+        return 1
+
+    def contacts_get_num_topologies(self):
+        return 0
+
+    def topology_inquire(self, topology, topology_id):
+        return {"num_nodes": 6, "num_edges": 7, "num_faces": 2}
+
+    def topology_get_data_variables(self, topology_id, topology_type, location):
+        return ["mesh2d_s1"] if location == 2 else []
+
+    def variable_get_dimensions(self, variable_name):
+        return np.array([3, 2], dtype=np.int32)
+
+    def variable_get_attributes_names(self, variable_name):
+        return ["mesh", "location"]
+
+    def variable_get_attributes_values(self, variable_name):
+        return ["mesh2d", "face"]
+
+    def variable_get_data_double(self, variable_name):
+        raise AssertionError("The inventory must not read data")
+
+
+def test_inventory_of_a_classic_file(monkeypatch):
+    r"""Tests `inventory` completes the inquiry calls with the types and attributes of the NetCDF classic header."""
+
+    monkeypatch.setattr(ugrid.file_inventory, "UGrid", InquiryUGrid)
+
+    summary = inventory("./data/ResultFile.nc")
+
+    assert summary.file_format == "classic"
+    assert summary.num_bytes == 1158032
+    assert summary.global_attributes["institution"] == "Deltares"
+    assert len(summary.topologies) == 1
+    topology = summary.topologies[0]
+    assert (topology.topology, topology.topology_id, topology.name) == (
+        "mesh2d",
+        0,
+        "mesh2d",
+    )
+    assert topology.counts["num_faces"] == 2
+    assert len(summary.variables) == 1
+    variable = summary.variables[0]
+    assert variable.name == "mesh2d_s1"
+    assert variable.location == "face"
+    assert variable.shape == (3, 2)
+    assert variable.dimensions == ("time", "nmesh2d_face")
+    assert variable.dtype == np.float64
+    assert variable.num_bytes == 48
+    assert "mesh2d_s1 float64('time', 'nmesh2d_face')" in str(summary)
+
+
+def test_inventory_of_another_format(tmp_path, monkeypatch):
+    r"""Tests `inventory` leaves the types and global attributes unknown for files that are not NetCDF classic."""
+
+    monkeypatch.setattr(ugrid.file_inventory, "UGrid", InquiryUGrid)
+    file_path = tmp_path / "map.nc"
+    file_path.write_bytes(b"\x89HDF\r\n\x1a\n" + bytes(100))
+
+    summary = inventory(file_path)
+
+    assert summary.file_format == "netcdf4"
+    assert summary.global_attributes == {}
+    assert summary.variables[0].dtype is None
+    assert summary.variables[0].dimensions is None
+    assert summary.variables[0].num_bytes is None
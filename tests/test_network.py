@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from test_mesh1d import create_mesh1d
+from test_network1d import create_network1d
+
+from ugrid import InputError, NetworkPolylines, fill_mesh1d_coordinates
+
+
+def create_polylines():
+    r"""Creates polylines for three branches: an L shape, a single segment and a branch without geometry"""
+
+    x = np.array([0.0, 3.0, 3.0, 10.0, 10.0])
+    y = np.array([0.0, 0.0, 4.0, 0.0, 2.0])
+    node_offsets = np.array([0, 3, 5, 5])
+    return NetworkPolylines(x, y, node_offsets)
+
+
+def test_network_polylines_from_network1d():
+    r"""Tests the polylines of the test network1d match its branch length."""
+
+    network1d = create_network1d()
+    polylines = NetworkPolylines.from_network1d(network1d)
+
+    assert polylines.num_branches == 1
+    assert_array_equal(polylines.node_offsets, [0, network1d.geometry_nodes_x.size])
+    assert_allclose(polylines.lengths(), network1d.edge_length, rtol=1e-3)
+    x, y = polylines.branch(0)
+    assert_array_equal(x, network1d.geometry_nodes_x)
+
+
+def test_network_polylines_chainage():
+    r"""Tests the chainage restarts at zero on every branch."""
+
+    polylines = create_polylines()
+
+    assert_allclose(polylines.chainage, [0.0, 3.0, 7.0, 0.0, 2.0])
+    assert_allclose(polylines.lengths(), [7.0, 2.0, 0.0])
+
+
+def test_network_polylines_interpolate():
+    r"""Tests locations along several branches are interpolated at once."""
+
+    polylines = create_polylines()
+    x, y = polylines.interpolate([0, 0, 0, 1, 0, 2], [1.5, 5.0, 7.0, 1.0, 100.0, 1.0])
+
+    assert_allclose(x[:5], [1.5, 3.0, 3.0, 10.0, 3.0])
+    assert_allclose(y[:5], [0.0, 2.0, 4.0, 1.0, 4.0])
+    assert np.isnan(x[5]) and np.isnan(y[5])
+
+
+def test_network_polylines_interpolate_scaled():
+    r"""Tests chainages are scaled when the given branch lengths differ from the geometric ones."""
+
+    polylines = create_polylines()
+    x, y = polylines.interpolate([0, 1], [7.0, 2.0], edge_length=[14.0, 4.0, 1.0])
+
+    assert_allclose(x, [3.0, 10.0])
+    assert_allclose(y, [0.5, 1.0])
+
+    with pytest.raises(InputError):
+        polylines.interpolate([3], [1.0])
+
+
+def test_fill_mesh1d_coordinates():
+    r"""Tests the mesh1d coordinates are computed along the network1d branches."""
+
+    network1d = create_network1d()
+    mesh1d = create_mesh1d()
+    mesh1d.edge_edge_id = np.array([], dtype=np.int32)
+    mesh1d.edge_edge_offset = np.array([], dtype=np.double)
+    fill_mesh1d_coordinates(mesh1d, network1d)
+
+    # The first and last mesh1d nodes lie at both ends of the branch
+    assert_allclose(mesh1d.node_x[[0, -1]], network1d.geometry_nodes_x[[0, -1]])
+    assert_allclose(mesh1d.node_y[[0, -1]], network1d.geometry_nodes_y[[0, -1]])
+    edge_nodes = mesh1d.edge_node.reshape(-1, 2)
+    assert_allclose(mesh1d.edge_x, mesh1d.node_x[edge_nodes].mean(axis=1))
+
+
+def test_fill_mesh1d_coordinates_with_edge_locations():
+    r"""Tests the mesh1d edge coordinates are computed from their own offsets when present."""
+
+    network1d = create_network1d()
+    mesh1d = create_mesh1d()
+    mesh1d.edge_edge_id = np.zeros(mesh1d.edge_node.size // 2, dtype=np.int32)
+    mesh1d.edge_edge_offset = mesh1d.node_edge_offset[1:].copy()
+    fill_mesh1d_coordinates(mesh1d, network1d)
+
+    assert_allclose(mesh1d.edge_x, mesh1d.node_x[1:])
+    assert_allclose(mesh1d.edge_y, mesh1d.node_y[1:])
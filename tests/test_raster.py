@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from test_mesh2d import create_ugrid_mesh2d
+
+from ugrid import InputError, MeshRasterizer, RasterGrid
+
+
+def create_mesh2d():
+    r"""Creates the 3x3 test mesh2d with its one-based start index"""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    return mesh2d
+
+
+def test_raster_grid_from_mesh2d():
+    r"""Tests `RasterGrid.from_mesh2d` covers the mesh2d nodes, starting from the top left corner."""
+
+    grid = RasterGrid.from_mesh2d(create_mesh2d(), 0.5)
+
+    assert grid.shape == (6, 6)
+    assert grid.geotransform() == (0.0, 0.5, 0.0, 3.0, 0.0, -0.5)
+    x, y = grid.pixel_centers()
+    assert_allclose(x[:2], [0.25, 0.75])
+    assert_allclose(y[:2], [2.75, 2.25])
+
+
+def test_mesh_rasterizer_face_data():
+    r"""Tests face data is rasterized on the pixels whose center lies inside each face."""
+
+    mesh2d = create_mesh2d()
+    grid = RasterGrid(-1.0, 3.0, 1.0, 1.0, 5, 3)
+    rasterizer = MeshRasterizer(mesh2d, grid)
+
+    # Faces are numbered column by column, from the bottom
+    assert_array_equal(
+        rasterizer.pixel_face,
+        [[-1, 2, 5, 8, -1], [-1, 1, 4, 7, -1], [-1, 0, 3, 6, -1]],
+    )
+
+    face_data = np.arange(9, dtype=np.double)
+    raster = rasterizer.rasterize(np.stack([face_data, 10.0 * face_data]))
+    assert raster.shape == (2, 3, 5)
+    assert_allclose(raster[1, 2, 1:4], [0.0, 30.0, 60.0])
+    assert np.all(np.isnan(raster[:, :, 0]))
+
+
+def test_mesh_rasterizer_node_data():
+    r"""Tests node data is interpolated linearly within the faces."""
+
+    mesh2d = create_mesh2d()
+    grid = RasterGrid.from_mesh2d(mesh2d, 0.25)
+    rasterizer = MeshRasterizer(mesh2d, grid, block_size=7)
+    raster = rasterizer.rasterize(mesh2d.node_x + 2.0 * mesh2d.node_y, "node")
+
+    x, y = grid.pixel_centers()
+    assert_allclose(raster, x[np.newaxis, :] + 2.0 * y[:, np.newaxis])
+    assert rasterizer.node_weights is rasterizer.node_weights
+
+
+def test_mesh_rasterizer_invalid_data():
+    r"""Tests data with the wrong size or location raises an InputError."""
+
+    mesh2d = create_mesh2d()
+    rasterizer = MeshRasterizer(mesh2d, RasterGrid.from_mesh2d(mesh2d, 1.0))
+
+    with pytest.raises(InputError):
+        rasterizer.rasterize(np.ones(4))
+    with pytest.raises(InputError):
+        rasterizer.rasterize(np.ones(16), "edge")
@@ -0,0 +1,101 @@
+import threading
+
+from test_contacts import create_contacts
+
+import ugrid.ugrid
+from ugrid import UGrid, fingerprint
+
+
+class ReadAllUGrid(UGrid):
+    r"""Stands for `UGrid` without the native library, with a number of topologies of every kind,
+    recording the files opened and the threads of the reads."""
+
+    counts = {"network1d": 1, "mesh1d": 2, "mesh2d": 3, "contacts": 0}
+    opened = []
+    threads = set()
+
+    def __init__(self, file_path, method, topology_cache=None):
+        self._UGrid__file_path = str(file_path)
+        self._UGrid__method = method
+        self._UGrid__topology_cache = None
+        ReadAllUGrid.opened.append((str(file_path), method))
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+    def read(self, kind, topology_id):
+        ReadAllUGrid.threads.add(threading.get_ident())
+        return (kind, topology_id)
+
+    def network1d_get_num_topologies(self):
+        return ReadAllUGrid.counts["network1d"]
+
+    def mesh1d_get_num_topologies(self):
+        return ReadAllUGrid.counts["mesh1d"]
+
+    def mesh2d_get_num_topologies(self):
+        return ReadAllUGrid.counts["mesh2d"]
+
+    def contacts_get_num_topologies(self):
+        return ReadAllUGrid.counts["contacts"]
+
+    def network1d_get(self, topology_id):
+        return self.read("network1d", topology_id)
+
+    def mesh1d_get(self, topology_id):
+        return self.read("mesh1d", topology_id)
+
+    def mesh2d_get(self, topology_id):
+        return self.read("mesh2d", topology_id)
+
+    def contacts_get(self, topology_id):
+        return self.read("contacts", topology_id)
+
+
+def test_read_all():
+    r"""Tests `read_all` reads every topology of a file, serially or with a thread pool."""
+
+    with UGrid("./data/AllUGridEntities.nc", "r") as ug:
+        topologies = ug.read_all()
+
+        assert {kind: len(values) for kind, values in topologies.items()} == {
+            "network1d": ug.network1d_get_num_topologies(),
+            "mesh1d": ug.mesh1d_get_num_topologies(),
+            "mesh2d": ug.mesh2d_get_num_topologies(),
+            "contacts": ug.contacts_get_num_topologies(),
+        }
+        assert topologies["contacts"][-1].name == create_contacts().name
+        assert fingerprint(topologies["mesh2d"][0]) == fingerprint(ug.mesh2d_get(0))
+
+        concurrent = ug.read_all(max_workers=4)
+        for kind, values in topologies.items():
+            assert [fingerprint(value) for value in concurrent[kind]] == [
+                fingerprint(value) for value in values
+            ]
+
+
+def test_read_all_serially_and_with_a_pool(monkeypatch):
+    r"""Tests `read_all` keeps the topologies in order, serially, with a thread pool and on files opened for writing."""
+
+    monkeypatch.setattr(ugrid.ugrid, "UGrid", ReadAllUGrid)
+    monkeypatch.setattr(ReadAllUGrid, "opened", [])
+    monkeypatch.setattr(ReadAllUGrid, "threads", set())
+    expected = {
+        kind: [(kind, i) for i in range(count)]
+        for kind, count in ReadAllUGrid.counts.items()
+    }
+
+    ug = ReadAllUGrid("map.nc", "r")
+    assert ug.read_all() == expected
+    assert ReadAllUGrid.threads == {threading.get_ident()}
+    assert len(ReadAllUGrid.opened) == 1
+
+    assert ug.read_all(max_workers=3) == expected
+    # Every topology is read through its own UGrid on the same file, in the pool
+    assert ReadAllUGrid.opened[1:] == [("map.nc", "r")] * 6
+    assert threading.get_ident() in ReadAllUGrid.threads
+    assert len(ReadAllUGrid.threads) > 1
+
+    writer = ReadAllUGrid("map.nc", "w")
+    assert writer.read_all(max_workers=3) == expected
+    assert len(ReadAllUGrid.opened) == 8
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from test_mesh1d import create_mesh1d
+from test_mesh2d import create_ugrid_mesh2d
+
+from ugrid import InputError
+from ugrid.renumbering import renumber_mesh1d, renumber_mesh2d
+
+
+@pytest.mark.parametrize("method", ["hilbert", "rcm"])
+def test_renumber_mesh2d_preserves_geometry(method):
+    r"""Tests `renumber_mesh2d` permutes coordinates and connectivity consistently."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    renumbered, permutation = renumber_mesh2d(mesh2d, method)
+
+    assert_array_equal(np.sort(permutation.node), np.arange(16))
+    assert_array_equal(np.sort(permutation.face), np.arange(9))
+    assert_array_equal(np.sort(permutation.edge), np.arange(24))
+
+    face_nodes = mesh2d.face_nodes.reshape(-1, 4) - 1
+    renumbered_face_nodes = renumbered.face_nodes.reshape(-1, 4) - 1
+    assert renumbered_face_nodes.min() == 0
+    assert_array_equal(
+        renumbered.node_x[renumbered_face_nodes],
+        mesh2d.node_x[face_nodes][permutation.face],
+    )
+
+    edge_nodes = mesh2d.edge_nodes.reshape(-1, 2) - 1
+    renumbered_edge_nodes = renumbered.edge_nodes.reshape(-1, 2) - 1
+    assert_array_equal(
+        renumbered.node_y[renumbered_edge_nodes],
+        mesh2d.node_y[edge_nodes][permutation.edge],
+    )
+
+    assert_array_equal(renumbered.face_x, permutation.apply(mesh2d.face_x, "face"))
+    data = np.vstack([mesh2d.face_y, 2.0 * mesh2d.face_y])
+    assert_array_equal(permutation.apply(data, "face")[1], 2.0 * renumbered.face_y)
+    assert_array_equal(permutation.inverse("node")[permutation.node], np.arange(16))
+
+
+def test_renumber_mesh2d_keeps_fill_values():
+    r"""Tests `renumber_mesh2d` leaves the fill values of mixed faces untouched."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    face_nodes = mesh2d.face_nodes.reshape(-1, 4).copy()
+    face_nodes[0, 3] = mesh2d.int_fill_value
+    mesh2d.face_nodes = face_nodes.ravel()
+
+    renumbered, permutation = renumber_mesh2d(mesh2d, "rcm")
+
+    renumbered_face_nodes = renumbered.face_nodes.reshape(-1, 4)
+    new_first_face = np.flatnonzero(permutation.face == 0)[0]
+    assert renumbered_face_nodes[new_first_face, 3] == mesh2d.int_fill_value
+    assert np.count_nonzero(renumbered_face_nodes == mesh2d.int_fill_value) == 1
+
+
+def test_renumber_mesh2d_boundary_and_volume_arrays():
+    r"""Tests `renumber_mesh2d` remaps the boundary nodes and reorders the volume coordinates."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    fill = mesh2d.int_fill_value
+    mesh2d.boundary_node_connectivity = np.array([1.0, 4.0, 16.0, fill])
+    mesh2d.volume_coordinates = np.arange(9, dtype=np.int32)
+
+    renumbered, permutation = renumber_mesh2d(mesh2d, "hilbert")
+
+    node_rank = permutation.inverse("node")
+    assert_array_equal(
+        renumbered.boundary_node_connectivity,
+        [node_rank[0] + 1, node_rank[3] + 1, node_rank[15] + 1, fill],
+    )
+    assert renumbered.boundary_node_connectivity.dtype == np.double
+    assert_array_equal(renumbered.volume_coordinates, permutation.face)
+
+
+@pytest.mark.parametrize("method", ["hilbert", "rcm"])
+def test_renumber_mesh1d(method):
+    r"""Tests `renumber_mesh1d` permutes nodes, edges and node names consistently."""
+
+    mesh1d = create_mesh1d()
+    mesh1d.node_x = mesh1d.node_edge_offset.copy()
+    mesh1d.node_y = np.sin(mesh1d.node_edge_offset)
+    mesh1d.node_name_id = [f"node{i}" for i in range(mesh1d.node_x.size)]
+    renumbered, permutation = renumber_mesh1d(mesh1d, method)
+
+    assert_array_equal(
+        renumbered.node_edge_offset, mesh1d.node_edge_offset[permutation.node]
+    )
+    assert renumbered.node_name_id == [mesh1d.node_name_id[i] for i in permutation.node]
+    edge_nodes = mesh1d.edge_node.reshape(-1, 2)
+    renumbered_edge_nodes = renumbered.edge_node.reshape(-1, 2)
+    assert_array_equal(
+        renumbered.node_x[renumbered_edge_nodes],
+        mesh1d.node_x[edge_nodes][permutation.edge],
+    )
+
+
+def test_renumber_unsupported_method():
+    r"""Tests `renumber_mesh2d` raises an error for unknown methods."""
+
+    with pytest.raises(InputError):
+        renumber_mesh2d(create_ugrid_mesh2d(), "random")
@@ -0,0 +1,236 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from scipy.io import netcdf_file
+from test_mesh2d import create_ugrid_mesh2d
+
+import ugrid.streaming
+from ugrid import InputError, UGridError, copy, subset_mesh2d
+
+
+class CopyUGrid:
+    r"""Stands for `UGrid`, reading a mesh2d and the attributes of a NetCDF classic file and recording the writes."""
+
+    attributes = {}
+    written = {}
+
+    def __init__(self, file_path, method):
+        self.method = method
+        if method == "w+":
+            CopyUGrid.written = {"topologies": [], "variables": {}}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        pass
+
+    def mesh2d_get_num_topologies(self):
+        return 1
+
+    def mesh2d_get(self, topology_id):
+        mesh2d = create_ugrid_mesh2d()
+        mesh2d.start_index = 1
+        return mesh2d
+
+    def variable_get_attributes_names(self, variable_name):
+        return list(CopyUGrid.attributes.get(variable_name, {}))
+
+    def variable_get_attributes_values(self, variable_name):
+        return [str(v) for v in CopyUGrid.attributes.get(variable_name, {}).values()]
+
+    def variable_get_data_double(self, variable_name):
+        raise AssertionError("NetCDF classic data must be streamed")
+
+    def mesh2d_define(self, mesh2d):
+        CopyUGrid.written["topologies"].append(mesh2d)
+        return len(CopyUGrid.written["topologies"]) - 1
+
+    def mesh2d_put(self, topology_id, mesh2d):
+        assert CopyUGrid.written["topologies"][topology_id] is mesh2d
+
+    def variable_int_with_attributes_define(self, variable_name, variable_dict):
+        CopyUGrid.written["variables"][variable_name] = variable_dict
+
+
+class NetCDF4UGrid(CopyUGrid):
+    r"""Stands for `UGrid` over a file in another format than NetCDF classic, reading whole variables only."""
+
+    data = {}
+
+    def variable_get_dimensions(self, variable_name):
+        if variable_name not in NetCDF4UGrid.data:
+            raise UGridError(f"{variable_name} not found")
+        return np.array(NetCDF4UGrid.data[variable_name].shape, dtype=np.int32)
+
+    def variable_get_data_double(self, variable_name):
+        return NetCDF4UGrid.data[variable_name].ravel().astype(np.double)
+
+
+def create_source(file_path, monkeypatch, num_times=5, record=True):
+    r"""Writes a NetCDF classic file with a water level on the faces and a bed level on the nodes of the test mesh2d.
+
+    scipy places variables without dimensions among the records, so the coordinate reference system
+    is only written when time is not the record dimension.
+    """
+
+    attributes = {
+        "mesh2d_s1": {"mesh": "mesh2d", "location": "face"},
+        "mesh2d_node_z": {"mesh": "mesh2d", "location": "node"},
+        "projected_coordinate_system": {"epsg": 28992, "name": "Amersfoort"},
+    }
+    with netcdf_file(file_path, "w") as file:
+        file.createDimension("time", None if record else num_times)
+        file.createDimension("nmesh2d_face", 9)
+        file.createDimension("nmesh2d_node", 16)
+        if not record:
+            file.createVariable("projected_coordinate_system", "i4", ())
+        file.createVariable("time", "f8", ("time",))[:] = np.arange(num_times)
+        s1 = file.createVariable("mesh2d_s1", "f8", ("time", "nmesh2d_face"))
+        s1[:] = np.arange(num_times)[:, np.newaxis] + np.arange(9) / 10.0
+        node_z = file.createVariable("mesh2d_node_z", "f4", ("nmesh2d_node",))
+        node_z[:] = -np.arange(16)
+        for name, values in attributes.items():
+            if name not in file.variables:
+                continue
+            for key, value in values.items():
+                setattr(file.variables[name], key, value)
+    monkeypatch.setattr(CopyUGrid, "attributes", attributes)
+    monkeypatch.setattr(ugrid.streaming, "UGrid", CopyUGrid)
+
+
+def test_subset_mesh2d():
+    r"""Tests `subset_mesh2d` keeps the selected faces with their nodes and edges, with consistent connectivity."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    faces = np.zeros(9, dtype=bool)
+    faces[[0, 3]] = True
+
+    subset, permutation = subset_mesh2d(mesh2d, faces)
+
+    assert_array_equal(permutation.face, [0, 3])
+    assert permutation.node.size == 6
+    assert permutation.edge.size == 7
+    face_nodes = subset.face_nodes.reshape(-1, 4) - 1
+    original = mesh2d.face_nodes.reshape(-1, 4)[[0, 3]] - 1
+    assert_array_equal(subset.node_x[face_nodes], mesh2d.node_x[original])
+    edge_nodes = subset.edge_nodes.reshape(-1, 2) - 1
+    assert_array_equal(
+        subset.node_y[edge_nodes],
+        mesh2d.node_y[mesh2d.edge_nodes.reshape(-1, 2)[permutation.edge] - 1],
+    )
+    assert_array_equal(subset.face_x, [0.5, 1.5])
+
+
+def test_subset_mesh2d_invalid_faces():
+    r"""Tests `subset_mesh2d` rejects face masks of the wrong size and faces out of range."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    with pytest.raises(InputError):
+        subset_mesh2d(mesh2d, np.ones(3, dtype=bool))
+    with pytest.raises(InputError):
+        subset_mesh2d(mesh2d, [0, 9])
+
+
+def test_copy_streams_a_time_range_of_a_subset(tmp_path, monkeypatch):
+    r"""Tests `copy` writes the subset mesh2d and the selected entries of the variables, in small blocks."""
+
+    source = tmp_path / "map.nc"
+    create_source(source, monkeypatch)
+
+    written = copy(
+        source,
+        tmp_path / "copy.nc",
+        topologies=["mesh2d"],
+        variables=["time", "mesh2d_s1", "mesh2d_node_z"],
+        time=slice(1, 4),
+        faces=[1, 4],
+        block_bytes=20,
+    )
+
+    assert set(written) == {"time", "mesh2d_s1", "mesh2d_node_z"}
+    assert written["mesh2d_s1"] == tmp_path / "copy.mesh2d_s1.npy"
+    assert_array_equal(np.load(written["time"]), [1.0, 2.0, 3.0])
+    s1 = np.load(written["mesh2d_s1"])
+    assert s1.dtype == np.float64
+    assert_array_equal(s1, np.arange(1, 4)[:, np.newaxis] + [0.1, 0.4])
+
+    (mesh2d,) = CopyUGrid.written["topologies"]
+    assert_array_equal(mesh2d.face_x, [0.5, 1.5])
+    node_z = np.load(written["mesh2d_node_z"])
+    assert node_z.dtype == np.float32
+    nodes = mesh2d.face_nodes.reshape(-1, 4) - 1
+    original = create_ugrid_mesh2d().face_nodes.reshape(-1, 4)[[1, 4]] - 1
+    assert_array_equal(node_z[nodes], -original)
+
+
+def test_copy_without_record_dimension(tmp_path, monkeypatch):
+    r"""Tests `copy` selects the time along the dimension of the time variable and defines the variables without data."""
+
+    source = tmp_path / "map.nc"
+    create_source(source, monkeypatch, record=False)
+
+    written = copy(
+        source,
+        tmp_path / "copy.nc",
+        topologies=["mesh2d"],
+        variables=["mesh2d_s1", "projected_coordinate_system"],
+        time=slice(-2, None),
+    )
+
+    assert set(written) == {"mesh2d_s1"}
+    s1 = np.load(written["mesh2d_s1"])
+    assert_array_equal(s1, np.arange(3, 5)[:, np.newaxis] + np.arange(9) / 10.0)
+    crs = CopyUGrid.written["variables"]["projected_coordinate_system"]
+    assert crs["name"] == "Amersfoort"
+    assert crs["epsg"].dtype == np.int32
+    assert_array_equal(crs["epsg"], [28992])
+
+
+def test_copy_time_range_of_a_netcdf4_file(tmp_path, monkeypatch):
+    r"""Tests `copy` selects the time along the axes with the length of the time variable in other formats."""
+
+    source = tmp_path / "map.nc"
+    source.write_bytes(b"\x89HDF\r\n\x1a\n" + bytes(64))
+    data = {
+        "time": np.arange(5.0),
+        "mesh2d_s1": np.arange(5)[:, np.newaxis] + np.arange(9) / 10.0,
+        "mesh2d_node_z": -np.arange(16.0),
+    }
+    monkeypatch.setattr(NetCDF4UGrid, "data", data)
+    monkeypatch.setattr(ugrid.streaming, "UGrid", NetCDF4UGrid)
+
+    written = copy(
+        source,
+        tmp_path / "copy.nc",
+        topologies=["mesh2d"],
+        variables=["time", "mesh2d_s1", "mesh2d_node_z"],
+        time=slice(1, 3),
+    )
+
+    assert_array_equal(np.load(written["time"]), [1.0, 2.0])
+    assert_array_equal(np.load(written["mesh2d_s1"]), data["mesh2d_s1"][1:3])
+    assert_array_equal(np.load(written["mesh2d_node_z"]), data["mesh2d_node_z"])
+
+    del data["time"]
+    with pytest.raises(InputError):
+        copy(
+            source,
+            tmp_path / "copy.nc",
+            topologies=["mesh2d"],
+            variables=["mesh2d_s1"],
+            time=slice(1, 3),
+        )
+
+
+def test_copy_invalid_arguments(tmp_path, monkeypatch):
+    r"""Tests `copy` rejects unknown topologies and time selections which are not slices."""
+
+    source = tmp_path / "map.nc"
+    create_source(source, monkeypatch)
+    with pytest.raises(InputError):
+        copy(source, tmp_path / "copy.nc", topologies=["mesh3d"])
+    with pytest.raises(InputError):
+        copy(source, tmp_path / "copy.nc", time=[0, 1])
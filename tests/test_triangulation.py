@@ -0,0 +1,75 @@
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+from test_mesh2d import create_ugrid_mesh2d
+
+from ugrid import FaceNodesCSR, MeshTriangulation, UGridMesh2D
+
+
+def create_mixed_mesh2d():
+    r"""Creates a mesh2d with a triangle padded with fill values and a non-convex pentagon (an arrow)"""
+
+    node_x = np.array([0.0, 2.0, 2.0, 1.0, 0.0, 3.0])
+    node_y = np.array([0.0, 0.0, 2.0, 1.0, 2.0, 0.0])
+    face_nodes = np.array([0, 1, 2, 3, 4, 1, 5, 2, -999, -999], dtype=np.int32)
+    return UGridMesh2D(
+        name="mixed",
+        node_x=node_x,
+        node_y=node_y,
+        edge_node=np.array([], dtype=np.int32),
+        face_nodes=face_nodes,
+        num_face_nodes_max=5,
+    )
+
+
+def triangle_areas(mesh2d, triangles):
+    r"""Computes the signed areas of triangles"""
+
+    x = mesh2d.node_x[triangles]
+    y = mesh2d.node_y[triangles]
+    return 0.5 * (
+        (x[:, 1] - x[:, 0]) * (y[:, 2] - y[:, 0])
+        - (x[:, 2] - x[:, 0]) * (y[:, 1] - y[:, 0])
+    )
+
+
+def test_mesh_triangulation_quads():
+    r"""Tests every quad of the test mesh2d is split in two triangles around its first node."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    triangulation = MeshTriangulation(mesh2d)
+
+    assert triangulation.num_triangles == 18
+    assert_array_equal(triangulation.triangle_face, np.repeat(np.arange(9), 2))
+    first_face = mesh2d.face_nodes[:4] - 1
+    assert_array_equal(
+        triangulation.triangles[:2], [first_face[[0, 1, 2]], first_face[[0, 2, 3]]]
+    )
+    assert triangulation.triangles is triangulation.triangles
+
+
+def test_mesh_triangulation_mixed_faces():
+    r"""Tests padded and non-convex faces are triangulated without overlaps, keeping the face areas."""
+
+    mesh2d = create_mixed_mesh2d()
+    triangulation = MeshTriangulation(mesh2d)
+
+    assert_array_equal(triangulation.triangle_face, [0, 0, 0, 1])
+    areas = triangle_areas(mesh2d, triangulation.triangles)
+    assert np.all(areas > 0.0)
+    face_areas = FaceNodesCSR.from_mesh2d(mesh2d).face_area(
+        mesh2d.node_x, mesh2d.node_y
+    )
+    assert_allclose(np.bincount(triangulation.triangle_face, weights=areas), face_areas)
+
+
+def test_mesh_triangulation_face_to_triangles():
+    r"""Tests face values of several time steps are broadcast to the triangles."""
+
+    triangulation = MeshTriangulation(create_mixed_mesh2d())
+    values = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+    assert_array_equal(
+        triangulation.face_to_triangles(values),
+        [[1.0, 1.0, 1.0, 2.0], [3.0, 3.0, 3.0, 4.0]],
+    )
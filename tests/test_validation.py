@@ -0,0 +1,146 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from test_contacts import create_contacts
+from test_mesh1d import create_mesh1d
+from test_mesh2d import create_ugrid_mesh2d
+from test_network1d import create_network1d
+
+from ugrid import (
+    InputError,
+    validate_contacts,
+    validate_mesh1d,
+    validate_mesh2d,
+    validate_network1d,
+)
+
+
+def create_valid_mesh2d():
+    r"""Creates the 3x3 test mesh2d with its one-based start index"""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    return mesh2d
+
+
+def create_valid_mesh1d():
+    r"""Creates the test mesh1d with its edges located on the single network edge"""
+
+    mesh1d = create_mesh1d()
+    offsets = mesh1d.node_edge_offset
+    mesh1d.edge_edge_id = np.zeros(mesh1d.edge_node.size // 2, dtype=np.int32)
+    mesh1d.edge_edge_offset = 0.5 * (offsets[:-1] + offsets[1:])
+    return mesh1d
+
+
+def finding(report, code):
+    r"""Gets the finding of a report with a given code"""
+
+    matches = [f for f in report.findings if f.code == code]
+    assert len(matches) == 1, str(report)
+    return matches[0]
+
+
+def test_validate_mesh2d_valid():
+    r"""Tests `validate_mesh2d` does not report errors for a valid mesh2d."""
+
+    report = validate_mesh2d(create_valid_mesh2d())
+
+    assert report.is_valid, str(report)
+    report.raise_on_error()
+
+
+def test_validate_mesh2d_edges():
+    r"""Tests `validate_mesh2d` reports out of range, degenerate and duplicated edges."""
+
+    mesh2d = create_valid_mesh2d()
+    edge_nodes = mesh2d.edge_nodes.reshape(-1, 2)
+    edge_nodes[3] = [17, 1]
+    edge_nodes[5] = [2, 2]
+    edge_nodes[7] = edge_nodes[0][::-1]
+    report = validate_mesh2d(mesh2d)
+
+    assert not report.is_valid
+    assert_array_equal(finding(report, "index_out_of_range").indices, [3])
+    assert_array_equal(finding(report, "degenerate_edge").indices, [5])
+    assert_array_equal(finding(report, "duplicate_edge").indices, [7])
+    with pytest.raises(InputError):
+        report.raise_on_error()
+
+
+def test_validate_mesh2d_faces():
+    r"""Tests `validate_mesh2d` reports invalid and clockwise faces."""
+
+    mesh2d = create_valid_mesh2d()
+    face_nodes = mesh2d.face_nodes.reshape(-1, 4)
+    face_nodes[1] = [face_nodes[1, 0], -999, face_nodes[1, 2], face_nodes[1, 3]]
+    face_nodes[4] = [face_nodes[4, 0], face_nodes[4, 1], face_nodes[4, 0], -999]
+    face_nodes[7] = face_nodes[7][::-1]
+    report = validate_mesh2d(mesh2d)
+
+    assert_array_equal(finding(report, "face_padding").indices, [1])
+    assert_array_equal(finding(report, "repeated_node").indices, [4])
+    assert_array_equal(finding(report, "clockwise_face").indices, [7])
+    assert finding(report, "clockwise_face").severity == "warning"
+
+
+def test_validate_mesh2d_start_index():
+    r"""Tests `validate_mesh2d` detects one-based indices declared as zero-based."""
+
+    mesh2d = create_valid_mesh2d()
+    mesh2d.start_index = 0
+    report = validate_mesh2d(mesh2d)
+
+    assert not report.is_valid
+    finding(report, "start_index_mismatch")
+
+
+def test_validate_mesh1d_and_network1d_valid():
+    r"""Tests the test mesh1d and network1d do not contain errors."""
+
+    network1d = create_network1d()
+    mesh1d = create_valid_mesh1d()
+
+    assert validate_network1d(network1d).is_valid, str(validate_network1d(network1d))
+    report = validate_mesh1d(mesh1d, network1d)
+    assert report.is_valid, str(report)
+
+
+def test_validate_mesh1d_offsets():
+    r"""Tests `validate_mesh1d` reports offsets beyond the network edge length."""
+
+    network1d = create_network1d()
+    mesh1d = create_valid_mesh1d()
+    mesh1d.node_edge_offset = mesh1d.node_edge_offset.copy()
+    mesh1d.node_edge_offset[2] = 1e6
+    report = validate_mesh1d(mesh1d, network1d)
+
+    assert not report.is_valid
+    assert 2 in finding(report, "offset_out_of_range").indices
+
+
+def test_validate_network1d_lengths():
+    r"""Tests `validate_network1d` reports non positive branch lengths."""
+
+    network1d = create_network1d()
+    network1d.edge_length = network1d.edge_length.copy()
+    network1d.edge_length[0] = 0.0
+    report = validate_network1d(network1d)
+
+    assert not report.is_valid
+    assert_array_equal(finding(report, "non_positive_length").indices, [0])
+
+
+def test_validate_contacts():
+    r"""Tests `validate_contacts` reports out of range and duplicated contacts."""
+
+    contacts = create_contacts()
+    assert validate_contacts(contacts).is_valid
+
+    edges = contacts.edges.reshape(-1, 2)
+    edges[1] = edges[0]
+    edges[2, 1] = 1000
+    report = validate_contacts(contacts, num_to_entities=100)
+
+    assert_array_equal(finding(report, "index_out_of_range").indices, [2])
+    assert_array_equal(finding(report, "duplicate_contact").indices, [1])
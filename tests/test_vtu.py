@@ -0,0 +1,156 @@
+import xml.etree.ElementTree as ElementTree
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from test_arrow_export import ParquetUGrid, create_source
+from test_mesh1d import create_mesh1d
+from test_mesh2d import create_ugrid_mesh2d
+
+import ugrid.file_inventory
+import ugrid.vtu
+from ugrid import InputError, VtuGeometry, VtuSeriesWriter, export_vtu, write_vtu
+from ugrid.vtu import VTK_LINE, VTK_QUAD, VTK_TRIANGLE
+
+
+def read_vtu(path):
+    r"""Reads the arrays of a .vtu file with binary appended data, keyed by name."""
+
+    content = path.read_bytes()
+    marker = b'<AppendedData encoding="raw">\n_'
+    header, appended = content.split(marker)
+    root = ElementTree.fromstring(header.decode() + "</VTKFile>")
+    types = {
+        "Float32": "<f4",
+        "Float64": "<f8",
+        "Int32": "<i4",
+        "Int64": "<i8",
+        "UInt8": "u1",
+    }
+    arrays = {}
+    for element in root.iter("DataArray"):
+        offset = int(element.get("offset"))
+        num_bytes = int(np.frombuffer(appended, "<u8", 1, offset)[0])
+        dtype = np.dtype(types[element.get("type")])
+        values = np.frombuffer(appended, dtype, num_bytes // dtype.itemsize, offset + 8)
+        components = int(element.get("NumberOfComponents", "1"))
+        arrays[element.get("Name", "points")] = values.reshape(-1, components).squeeze()
+    return root.find("UnstructuredGrid/Piece").attrib, arrays
+
+
+def test_vtu_geometry_of_mixed_faces():
+    r"""Tests `VtuGeometry.from_topology` drops the fill values of a mesh2d and chooses the cell types."""
+
+    mesh2d = create_ugrid_mesh2d()
+    mesh2d.start_index = 1
+    face_nodes = mesh2d.face_nodes.reshape(-1, 4).copy()
+    face_nodes[0, 3] = mesh2d.int_fill_value
+    mesh2d.face_nodes = face_nodes.ravel()
+
+    geometry = VtuGeometry.from_topology(mesh2d)
+
+    assert geometry.num_points == 16
+    assert geometry.num_cells == 9
+    assert_array_equal(geometry.offsets[:3], [3, 7, 11])
+    assert_array_equal(geometry.connectivity[:3], face_nodes[0, :3] - 1)
+    assert geometry.types[0] == VTK_TRIANGLE
+    assert np.all(geometry.types[1:] == VTK_QUAD)
+
+    mesh1d = VtuGeometry.from_topology(create_mesh1d())
+    assert np.all(mesh1d.types == VTK_LINE)
+    assert mesh1d.offsets[-1] == mesh1d.connectivity.size
+
+    face_nodes[4] = mesh2d.int_fill_value
+    mesh2d.face_nodes = face_nodes.ravel()
+    with pytest.raises(InputError):
+        VtuGeometry.from_topology(mesh2d)
+
+
+def test_write_vtu(tmp_path):
+    r"""Tests `write_vtu` writes the geometry and the data as binary appended arrays."""
+
+    mesh2d = create_ugrid_mesh2d()
+    geometry = VtuGeometry.from_topology(mesh2d)
+    velocity = np.arange(27, dtype=np.float32).reshape(9, 3)
+
+    write_vtu(
+        tmp_path / "mesh.vtu",
+        geometry,
+        cell_data={"s1": np.arange(9.0), "velocity": velocity},
+        point_data={"z": -np.arange(16, dtype=np.int32)},
+    )
+
+    piece, arrays = read_vtu(tmp_path / "mesh.vtu")
+    assert piece == {"NumberOfPoints": "16", "NumberOfCells": "9"}
+    assert_array_equal(arrays["points"][:, 0], mesh2d.node_x)
+    assert_array_equal(arrays["connectivity"], geometry.connectivity)
+    assert_array_equal(arrays["types"], geometry.types)
+    assert_array_equal(arrays["s1"], np.arange(9.0))
+    assert_array_equal(arrays["velocity"], velocity)
+    assert_array_equal(arrays["z"], -np.arange(16))
+
+    with pytest.raises(InputError):
+        write_vtu(tmp_path / "mesh.vtu", geometry, cell_data={"s1": np.zeros(3)})
+
+
+def test_vtu_series_writer(tmp_path):
+    r"""Tests `VtuSeriesWriter` writes a file per step and a collection listing them with their times."""
+
+    with VtuSeriesWriter(tmp_path, "map", create_ugrid_mesh2d()) as writer:
+        for step in range(3):
+            writer.write(60.0 * step, cell_data={"s1": np.full(9, float(step))})
+
+    collection = ElementTree.parse(tmp_path / "map.pvd").getroot()
+    datasets = collection.findall("Collection/DataSet")
+    assert [d.get("timestep") for d in datasets] == ["0.0", "60.0", "120.0"]
+    assert datasets[2].get("file") == "map_0002.vtu"
+    _, arrays = read_vtu(tmp_path / "map_0002.vtu")
+    assert_array_equal(arrays["s1"], np.full(9, 2.0))
+
+
+class NineStepsUGrid(ParquetUGrid):
+    r"""Stands for `UGrid` over the file of `create_source` with as many time steps as faces."""
+
+    def variable_get_dimensions(self, variable_name):
+        shape = [9, 9] if variable_name == "mesh2d_s1" else [9, 9, 3]
+        return np.array(shape, dtype=np.int32)
+
+
+def test_export_vtu_as_many_times_as_faces(tmp_path, monkeypatch):
+    r"""Tests `export_vtu` finds the time axis by its dimension name when the lengths cannot tell it."""
+
+    create_source(tmp_path / "map.nc", monkeypatch, num_times=9)
+    monkeypatch.setattr(ugrid.file_inventory, "UGrid", NineStepsUGrid)
+    monkeypatch.setattr(ugrid.vtu, "UGrid", NineStepsUGrid)
+
+    collection = export_vtu(tmp_path / "map.nc", tmp_path / "vtk", time=slice(7, 9))
+
+    datasets = ElementTree.parse(collection).getroot().findall("Collection/DataSet")
+    assert [d.get("timestep") for d in datasets] == ["420.0", "480.0"]
+    _, arrays = read_vtu(tmp_path / "vtk" / "map_0001.vtu")
+    assert_array_equal(
+        arrays["mesh2d_s1"], (8 + np.arange(9) / 10.0).astype(np.float32)
+    )
+    assert arrays["mesh2d_ucx"].shape == (9, 3)
+
+
+def test_export_vtu(tmp_path, monkeypatch):
+    r"""Tests `export_vtu` writes the selected time steps with layers as components."""
+
+    create_source(tmp_path / "map.nc", monkeypatch)
+    monkeypatch.setattr(ugrid.vtu, "UGrid", ParquetUGrid)
+
+    collection = export_vtu(tmp_path / "map.nc", tmp_path / "vtk", time=slice(2, 4))
+
+    assert collection == tmp_path / "vtk" / "map.pvd"
+    datasets = ElementTree.parse(collection).getroot().findall("Collection/DataSet")
+    assert [d.get("timestep") for d in datasets] == ["120.0", "180.0"]
+    _, arrays = read_vtu(tmp_path / "vtk" / "map_0001.vtu")
+    assert arrays["mesh2d_s1"].dtype == np.float32
+    assert_array_equal(
+        arrays["mesh2d_s1"], (3 + np.arange(9) / 10.0).astype(np.float32)
+    )
+    assert arrays["mesh2d_ucx"].shape == (9, 3)
+
+    with pytest.raises(InputError):
+        export_vtu(tmp_path / "map.nc", tmp_path / "vtk", topology="contacts")
@@ -0,0 +1,179 @@
+import sys
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from scipy.io import netcdf_file
+from test_inventory import InquiryUGrid
+from test_mesh2d import create_ugrid_mesh2d
+
+import ugrid.file_inventory
+import ugrid.zarr_export
+from ugrid import InputError, export_zarr
+
+
+class ExportUGrid(InquiryUGrid):
+    r"""Stands for `UGrid` over a NetCDF classic file with the test mesh2d and a water level on its faces."""
+
+    def topology_inquire(self, topology, topology_id):
+        return {"num_nodes": 16, "num_edges": 24, "num_faces": 9}
+
+    def variable_get_dimensions(self, variable_name):
+        return np.array([6, 9], dtype=np.int32)
+
+    def read_all(self, max_workers=None):
+        mesh2d = create_ugrid_mesh2d()
+        mesh2d.start_index = 1
+        return {"network1d": [], "mesh1d": [], "mesh2d": [mesh2d], "contacts": []}
+
+
+class NetCDF4ExportUGrid(ExportUGrid):
+    r"""Stands for `UGrid` over a NetCDF-4 file with a time and a water level without a "mesh" attribute."""
+
+    attributes = {
+        "time": {"units": "seconds since 2000-01-01", "calendar": "gregorian"},
+        "mesh2d_s1": {"location": "face"},
+    }
+
+    def variable_get_dimensions(self, variable_name):
+        shape = [6] if variable_name == "time" else [6, 9]
+        return np.array(shape, dtype=np.int32)
+
+    def variable_get_attributes_names(self, variable_name):
+        return list(NetCDF4ExportUGrid.attributes[variable_name])
+
+    def variable_get_attributes_values(self, variable_name):
+        return list(NetCDF4ExportUGrid.attributes[variable_name].values())
+
+    def variable_get_data_double(self, variable_name):
+        return np.arange(6.0) if variable_name == "time" else np.arange(54.0)
+
+
+def create_source(file_path, monkeypatch, num_times=6):
+    r"""Writes a NetCDF classic file with a water level on the faces of the test mesh2d."""
+
+    with netcdf_file(file_path, "w") as file:
+        file.institution = "Deltares"
+        file.createDimension("time", None)
+        file.createDimension("nmesh2d_face", 9)
+        time = file.createVariable("time", "f8", ("time",))
+        time[:] = np.arange(num_times)
+        time.units = "seconds since 2000-01-01"
+        s1 = file.createVariable("mesh2d_s1", "f8", ("time", "nmesh2d_face"))
+        s1[:] = np.arange(num_times)[:, np.newaxis] + np.arange(9) / 10.0
+        s1.mesh = "mesh2d"
+        s1.location = "face"
+        s1._FillValue = -999.0
+    monkeypatch.setattr(ugrid.file_inventory, "UGrid", ExportUGrid)
+    monkeypatch.setattr(ugrid.zarr_export, "UGrid", ExportUGrid)
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_export_zarr(tmp_path, monkeypatch, max_workers):
+    r"""Tests `export_zarr` writes the mesh2d with its UGRID attributes and the data variables in chunks."""
+
+    zarr = pytest.importorskip("zarr")
+    create_source(tmp_path / "map.nc", monkeypatch)
+
+    written = export_zarr(
+        tmp_path / "map.nc",
+        tmp_path / "map.zarr",
+        time_chunk=4,
+        face_chunk=5,
+        block_bytes=100,
+        max_workers=max_workers,
+    )
+
+    assert written[0] == "mesh2d"
+    assert {"mesh2d_face_nodes", "time", "mesh2d_s1"} <= set(written)
+    root = zarr.open_group(str(tmp_path / "map.zarr"), mode="r")
+    assert root.attrs["institution"] == "Deltares"
+    assert root.attrs["Conventions"] == "CF-1.8 UGRID-1.0"
+
+    topology = root["mesh2d"].attrs
+    assert topology["cf_role"] == "mesh_topology"
+    assert topology["topology_dimension"] == 2
+    assert topology["face_node_connectivity"] == "mesh2d_face_nodes"
+    face_nodes = root["mesh2d_face_nodes"]
+    assert face_nodes.shape == (9, 4)
+    assert face_nodes.attrs["start_index"] == 1
+    assert face_nodes.attrs["_ARRAY_DIMENSIONS"] == [
+        "nmesh2d_face",
+        "nmesh2d_max_face_nodes",
+    ]
+    assert_array_equal(face_nodes[:], create_ugrid_mesh2d().face_nodes.reshape(-1, 4))
+
+    s1 = root["mesh2d_s1"]
+    assert s1.chunks == (4, 5)
+    assert s1.fill_value == -999.0
+    assert s1.attrs["location"] == "face"
+    assert s1.attrs["_ARRAY_DIMENSIONS"] == ["time", "nmesh2d_face"]
+    assert_array_equal(s1[:], np.arange(6)[:, np.newaxis] + np.arange(9) / 10.0)
+    assert root["time"].attrs["units"] == "seconds since 2000-01-01"
+    assert_array_equal(root["time"][:], np.arange(6))
+
+
+def test_export_zarr_from_netcdf4(tmp_path, monkeypatch):
+    r"""Tests `export_zarr` keeps the time attributes and names the dimensions after the topology in other formats."""
+
+    zarr = pytest.importorskip("zarr")
+    source = tmp_path / "map.nc"
+    source.write_bytes(b"\x89HDF\r\n\x1a\n" + bytes(64))
+    monkeypatch.setattr(ugrid.file_inventory, "UGrid", NetCDF4ExportUGrid)
+    monkeypatch.setattr(ugrid.zarr_export, "UGrid", NetCDF4ExportUGrid)
+
+    written = export_zarr(source, tmp_path / "map.zarr", time_chunk=4)
+
+    assert {"time", "mesh2d_s1"} <= set(written)
+    root = zarr.open_group(str(tmp_path / "map.zarr"), mode="r")
+    assert root["time"].attrs["units"] == "seconds since 2000-01-01"
+    assert root["time"].attrs["calendar"] == "gregorian"
+    assert_array_equal(root["time"][:], np.arange(6.0))
+    s1 = root["mesh2d_s1"]
+    assert s1.attrs["_ARRAY_DIMENSIONS"] == ["time", "nmesh2d_face"]
+    assert_array_equal(s1[:], np.arange(54.0).reshape(6, 9))
+
+
+def test_export_zarr_with_a_scalar_time(tmp_path, monkeypatch):
+    r"""Tests `export_zarr` exports a classic file whose time variable has no dimensions, for a single time."""
+
+    zarr = pytest.importorskip("zarr")
+    with netcdf_file(tmp_path / "map.nc", "w") as file:
+        file.createDimension("nmesh2d_face", 9)
+        time = file.createVariable("time", "f8", ())
+        time.data[...] = 3600.0
+        time.units = "seconds since 2000-01-01"
+        s1 = file.createVariable("mesh2d_s1", "f8", ("nmesh2d_face",))
+        s1[:] = np.arange(9) / 10.0
+        s1.mesh = "mesh2d"
+        s1.location = "face"
+    monkeypatch.setattr(ugrid.file_inventory, "UGrid", ExportUGrid)
+    monkeypatch.setattr(ugrid.zarr_export, "UGrid", ExportUGrid)
+
+    export_zarr(tmp_path / "map.nc", tmp_path / "map.zarr", face_chunk=5)
+
+    root = zarr.open_group(str(tmp_path / "map.zarr"), mode="r")
+    assert root["time"].shape == ()
+    assert root["time"][()] == 3600.0
+    assert root["time"].attrs["units"] == "seconds since 2000-01-01"
+    s1 = root["mesh2d_s1"]
+    assert s1.chunks == (5,)
+    assert s1.attrs["_ARRAY_DIMENSIONS"] == ["nmesh2d_face"]
+    assert_array_equal(s1[:], np.arange(9) / 10.0)
+
+
+def test_export_zarr_invalid_variables(tmp_path, monkeypatch):
+    r"""Tests `export_zarr` rejects variables which are not data variables of the file."""
+
+    pytest.importorskip("zarr")
+    create_source(tmp_path / "map.nc", monkeypatch)
+    with pytest.raises(InputError):
+        export_zarr(tmp_path / "map.nc", tmp_path / "map.zarr", variables=["bed"])
+
+
+def test_export_zarr_without_zarr(tmp_path, monkeypatch):
+    r"""Tests `export_zarr` explains how to install the optional zarr package when it is missing."""
+
+    monkeypatch.setitem(sys.modules, "zarr", None)
+    with pytest.raises(ImportError, match="UGrid\\[zarr\\]"):
+        export_zarr(tmp_path / "map.nc", tmp_path / "map.zarr")
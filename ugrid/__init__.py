@@ -1,6 +1,38 @@
 # If you change these imports,
 # do not forget to sync the docs at "docs/api"
+from ugrid.aio import AsyncUGrid
+from ugrid.arrow_export import data_to_arrow, export_parquet, mesh2d_to_arrow
+from ugrid.boundary import MeshBoundary, extract_mesh2d_boundary
+from ugrid.cache import DiskCache, TopologyCache, default_topology_cache
+from ugrid.connectivity import FaceNodesCSR
+from ugrid.contacts import ContactIndex, generate_contacts
+from ugrid.dataset import MultiFileDataset, read_many
 from ugrid.errors import InputError, UGridError
+from ugrid.file_inventory import (
+    FileInventory,
+    TopologySummary,
+    VariableSummary,
+    inventory,
+)
+from ugrid.fingerprint import fingerprint
+from ugrid.graph import NetworkGraph
+from ugrid.interpolation import MeshInterpolator
+from ugrid.network import NetworkPolylines, fill_mesh1d_coordinates
 from ugrid.py_structures import UGridContacts, UGridMesh1D, UGridMesh2D, UGridNetwork1D
+from ugrid.raster import MeshRasterizer, RasterGrid
+from ugrid.renumbering import MeshPermutation, renumber_mesh1d, renumber_mesh2d
+from ugrid.streaming import copy
+from ugrid.subset import subset_contacts, subset_mesh2d
+from ugrid.triangulation import MeshTriangulation
 from ugrid.ugrid import UGrid
+from ugrid.validation import (
+    ValidationFinding,
+    ValidationReport,
+    validate_contacts,
+    validate_mesh1d,
+    validate_mesh2d,
+    validate_network1d,
+)
 from ugrid.version import __version__
+from ugrid.vtu import VtuGeometry, VtuSeriesWriter, export_vtu, write_vtu
+from ugrid.zarr_export import export_zarr
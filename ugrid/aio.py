@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from ugrid.py_structures import UGridContacts, UGridMesh1D, UGridMesh2D, UGridNetwork1D
+from ugrid.ugrid import UGrid
+
+DEFAULT_MAX_WORKERS = 1
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+_file_locks = {}
+_file_locks_lock = threading.Lock()
+
+
+def default_executor() -> Executor:
+    """Gets the thread pool shared by the AsyncUGrid created without an executor.
+
+    The pool is created when first needed, with DEFAULT_MAX_WORKERS threads, which bounds
+    the number of blocking UGrid calls running at once. With the default of a single thread,
+    the calls on different files do not overlap either, see `AsyncUGrid`.
+
+    Returns:
+        Executor: The shared thread pool.
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="ugrid"
+            )
+    return _default_executor
+
+
+class AsyncUGrid:
+    """An asyncio interface to a UGrid file, for event loops that must not block on file reads.
+
+    Every call runs the blocking UGrid call in a bounded executor, so the event loop keeps serving
+    other requests meanwhile. The calls on the same file are serialized, also between different AsyncUGrid
+    of that file, because the native library cannot use a file from two threads at once. A call keeps the file
+    until the native call returns, even when the task awaiting it is cancelled.
+
+    Calls on different files run concurrently up to the size of the executor. The shared `default_executor`
+    has a single thread, so concurrency is opt-in by passing an executor with more threads. The UGrid library
+    keeps a single last error for the whole process, so when calls fail concurrently, the message of an error
+    may be the one of another file.
+
+    Usage::
+
+        async with AsyncUGrid("map.nc") as ug:
+            mesh2d = await ug.mesh2d_get(0)
+            water_level = await ug.variable_get_data_double("mesh2d_s1")
+
+    Attributes:
+        file_path (str): The path of the file.
+        method (str): The opening method ("r" for read, "w" for write, and "w+" for replace).
+    """
+
+    def __init__(self, file_path, method: str = "r", executor: Executor = None):
+        """Constructor of AsyncUGrid, the file is opened by `open` or when entering the context.
+
+        Args:
+            file_path (str): The path of the file.
+            method (str): The opening method ("r" for read, "w" for write, and "w+" for replace).
+            executor (Executor): The executor of the blocking calls, the shared `default_executor` when not given.
+        """
+        self.file_path: str = str(file_path)
+        self.method: str = method
+        self.__executor = executor
+        self.__ugrid = None
+        self.__lock = None
+        self.__file_lock = _file_lock(self.file_path)
+
+    @property
+    def is_open(self) -> bool:
+        """True if the file is open."""
+        return self.__ugrid is not None
+
+    async def open(self) -> AsyncUGrid:
+        """Opens the file without blocking the event loop.
+
+        Returns:
+            AsyncUGrid: This object.
+        """
+        if self.__lock is None:
+            # Created here, as the lock must belong to the running event loop
+            self.__lock = asyncio.Lock()
+
+        def open_file():
+            if self.__ugrid is None:
+                self.__ugrid = UGrid(self.file_path, self.method)
+
+        await self.__serialized(open_file)
+        return self
+
+    async def close(self) -> None:
+        """Closes the file without blocking the event loop, after the pending calls."""
+        if self.__lock is None:
+            return
+
+        def close_file():
+            if self.__ugrid is not None:
+                ugrid, self.__ugrid = self.__ugrid, None
+                ugrid.__exit__(None, None, None)
+
+        await self.__serialized(close_file)
+
+    async def __aenter__(self) -> AsyncUGrid:
+        return await self.open()
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    async def network1d_get(self, topology_id: int) -> UGridNetwork1D:
+        """Awaitable `UGrid.network1d_get`."""
+        return await self.__call("network1d_get", topology_id)
+
+    async def mesh1d_get(self, topology_id: int) -> UGridMesh1D:
+        """Awaitable `UGrid.mesh1d_get`."""
+        return await self.__call("mesh1d_get", topology_id)
+
+    async def mesh2d_get(self, topology_id: int) -> UGridMesh2D:
+        """Awaitable `UGrid.mesh2d_get`."""
+        return await self.__call("mesh2d_get", topology_id)
+
+    async def contacts_get(self, topology_id: int) -> UGridContacts:
+        """Awaitable `UGrid.contacts_get`."""
+        return await self.__call("contacts_get", topology_id)
+
+    async def network1d_get_num_topologies(self) -> int:
+        """Awaitable `UGrid.network1d_get_num_topologies`."""
+        return await self.__call("network1d_get_num_topologies")
+
+    async def mesh1d_get_num_topologies(self) -> int:
+        """Awaitable `UGrid.mesh1d_get_num_topologies`."""
+        return await self.__call("mesh1d_get_num_topologies")
+
+    async def mesh2d_get_num_topologies(self) -> int:
+        """Awaitable `UGrid.mesh2d_get_num_topologies`."""
+        return await self.__call("mesh2d_get_num_topologies")
+
+    async def contacts_get_num_topologies(self) -> int:
+        """Awaitable `UGrid.contacts_get_num_topologies`."""
+        return await self.__call("contacts_get_num_topologies")
+
+    async def variable_get_dimensions(self, variable_name: str) -> np.ndarray:
+        """Awaitable `UGrid.variable_get_dimensions`."""
+        return await self.__call("variable_get_dimensions", variable_name)
+
+    async def variable_get_data_double(self, variable_name: str) -> np.ndarray:
+        """Awaitable `UGrid.variable_get_data_double`."""
+        return await self.__call("variable_get_data_double", variable_name)
+
+    async def variable_get_data_int(self, variable_name: str) -> np.ndarray:
+        """Awaitable `UGrid.variable_get_data_int`."""
+        return await self.__call("variable_get_data_int", variable_name)
+
+    async def variable_get_attributes_names(self, variable_name: str) -> list:
+        """Awaitable `UGrid.variable_get_attributes_names`."""
+        return await self.__call("variable_get_attributes_names", variable_name)
+
+    async def variable_get_attributes_values(self, variable_name: str) -> list:
+        """Awaitable `UGrid.variable_get_attributes_values`."""
+        return await self.__call("variable_get_attributes_values", variable_name)
+
+    async def variable_get_attributes(self, variable_name: str) -> dict:
+        """Gets the attribute names and values of a variable with a single executor call.
+
+        Args:
+            variable_name (str): The variable name.
+
+        Returns:
+            dict: The attribute values keyed by name.
+        """
+
+        def get(ugrid):
+            names = ugrid.variable_get_attributes_names(variable_name)
+            values = ugrid.variable_get_attributes_values(variable_name)
+            return dict(zip(names, values))
+
+        return await self.__call(get)
+
+    async def __call(self, function, *args):
+        """Runs a UGrid method, given by name or as a function of the UGrid, once the previous calls are done."""
+        if self.__lock is None or self.__ugrid is None:
+            raise ValueError(f"{self.file_path} is not open")
+
+        def call():
+            if self.__ugrid is None:
+                raise ValueError(f"{self.file_path} is closed")
+            if isinstance(function, str):
+                return getattr(self.__ugrid, function)(*args)
+            return function(self.__ugrid, *args)
+
+        return await self.__serialized(call)
+
+    async def __serialized(self, function):
+        """Runs a blocking function in the executor once the previous calls on this object and its file are done.
+
+        The object stays locked until the function returns, not until the awaiting task stops waiting:
+        a cancelled task leaves the function running in its thread, shielded, and the next calls wait for it.
+        """
+        await self.__lock.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                self.__executor or default_executor(), self.__run_locked, function
+            )
+        except BaseException:
+            self.__lock.release()
+            raise
+        future.add_done_callback(self.__release)
+        return await asyncio.shield(future)
+
+    def __run_locked(self, function):
+        """Runs a blocking function holding the lock of the file, in an executor thread."""
+        with self.__file_lock:
+            return function()
+
+    def __release(self, future) -> None:
+        """Unlocks the object once a call is done, retrieving its error when nobody awaits it anymore."""
+        self.__lock.release()
+        if not future.cancelled():
+            future.exception()
+
+
+def _file_lock(file_path) -> threading.Lock:
+    """Gets the lock serializing the native calls on a file, shared by all the AsyncUGrid of that file."""
+    key = str(Path(file_path).resolve())
+    with _file_locks_lock:
+        return _file_locks.setdefault(key, threading.Lock())
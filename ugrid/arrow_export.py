@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+
+from ugrid.errors import InputError, UGridError
+from ugrid.file_inventory import inventory
+from ugrid.netcdf_classic import read_classic_header
+from ugrid.py_structures import UGridMesh2D
+from ugrid.ugrid import UGrid
+
+DEFAULT_ROW_GROUP_ROWS = 1 << 20
+
+
+def mesh2d_to_arrow(mesh2d: UGridMesh2D) -> dict:
+    """Converts the nodes, edges and faces of a mesh2d to Arrow tables, one row per entity.
+
+    Requires the optional `pyarrow` package, installed with `pip install UGrid[arrow]`.
+
+    Every table has an index column ("node", "edge" or "face") followed by the coordinates.
+    The connectivity arrays are fixed-size list columns ("nodes", "faces" or "edges"), sharing the memory
+    of the mesh2d arrays: the tables must not outlive modifications of the mesh2d. The connectivity keeps
+    the start index and fill value of the mesh2d, which are stored in the schema metadata.
+
+    Args:
+        mesh2d (UGridMesh2D): The mesh2d.
+
+    Returns:
+        dict: The tables keyed by "nodes", "edges" and "faces".
+    """
+    pa = _import_pyarrow()
+    num_nodes = mesh2d.node_x.size
+    num_edges = mesh2d.edge_nodes.size // 2
+    num_faces = mesh2d.face_nodes.size // mesh2d.num_face_nodes_max
+    metadata = {
+        "mesh": mesh2d.name,
+        "start_index": str(mesh2d.start_index),
+        "int_fill_value": str(mesh2d.int_fill_value),
+    }
+
+    def table(location, count, columns, lists):
+        arrays = {location: _column(pa, np.arange(count, dtype=np.int64))}
+        for name, values in columns.items():
+            if values.size == count:
+                arrays[name] = _column(pa, values)
+        for name, (values, row_size) in lists.items():
+            if values.size == count * row_size:
+                arrays[name] = _fixed_size_list(pa, values, row_size)
+        return pa.table(arrays, metadata=metadata)
+
+    return {
+        "nodes": table(
+            "node",
+            num_nodes,
+            {"x": mesh2d.node_x, "y": mesh2d.node_y, "z": mesh2d.node_z},
+            {},
+        ),
+        "edges": table(
+            "edge",
+            num_edges,
+            {"x": mesh2d.edge_x, "y": mesh2d.edge_y, "z": mesh2d.edge_z},
+            {"nodes": (mesh2d.edge_nodes, 2), "faces": (mesh2d.edge_faces, 2)},
+        ),
+        "faces": table(
+            "face",
+            num_faces,
+            {"x": mesh2d.face_x, "y": mesh2d.face_y, "z": mesh2d.face_z},
+            {
+                "nodes": (mesh2d.face_nodes, mesh2d.num_face_nodes_max),
+                "edges": (mesh2d.face_edges, mesh2d.num_face_nodes_max),
+                "faces": (mesh2d.face_faces, mesh2d.num_face_nodes_max),
+            },
+        ),
+    }
+
+
+def data_to_arrow(name: str, data: np.ndarray, location: str, times: np.ndarray = None):
+    """Converts a data variable to an Arrow table in long format, one row per time and entity.
+
+    Requires the optional `pyarrow` package, installed with `pip install UGrid[arrow]`.
+
+    Args:
+        name (str): The name of the variable, used as the name of the value column.
+        data (ndarray): The values, with a shape (num_times, num_entities), or (num_entities,) without times.
+        location (str): The location of the variable ("node", "edge" or "face"), used as the name of the index column.
+        times (ndarray): The time of every row of the data, required when the data has two dimensions.
+
+    Returns:
+        pyarrow.Table: The table with the columns "time" (only with times), `location` and `name`.
+    """
+    pa = _import_pyarrow()
+    data = np.asarray(data)
+    if data.ndim == 1 and times is None:
+        entities = np.arange(data.size, dtype=np.int64)
+        return pa.table({location: _column(pa, entities), name: _column(pa, data)})
+    if data.ndim != 2 or times is None or len(times) != data.shape[0]:
+        raise InputError(
+            "The data must have a shape (num_times, num_entities) with a time per row"
+        )
+
+    num_times, num_entities = data.shape
+    columns = {
+        "time": _column(pa, np.repeat(np.asarray(times), num_entities)),
+        location: _column(
+            pa, np.tile(np.arange(num_entities, dtype=np.int64), num_times)
+        ),
+        name: _column(pa, data.reshape(-1)),
+    }
+    return pa.table(columns)
+
+
+def export_parquet(
+    source,
+    directory,
+    topology_id: int = 0,
+    variables: Iterable[str] = None,
+    row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+) -> Dict[str, Path]:
+    """Exports a mesh2d of a UGrid file and the data variables defined on it to Parquet files.
+
+    Requires the optional `pyarrow` package, installed with `pip install UGrid[arrow]`.
+
+    The nodes, edges and faces are written to `<mesh>_nodes.parquet`, `<mesh>_edges.parquet` and
+    `<mesh>_faces.parquet`, as described by `mesh2d_to_arrow`. Every data variable is written to
+    `<variable>.parquet` in long format, as described by `data_to_arrow`, with the values of the "time" variable.
+    Variables are written a row group of whole time steps at a time, of about `row_group_rows` rows.
+    From a file in a NetCDF classic format, every row group is read through a memory mapped view of the file,
+    so a variable is never held in memory as a whole. From other formats, the UGrid library can only read
+    whole variables.
+
+    Only data variables with one value per entity, or per time and entity, can be exported. When `variables`
+    is not given, the other data variables, such as the variables with layers, are left out.
+
+    Args:
+        source (str): The UGrid file.
+        directory (str): The directory of the Parquet files, created if needed.
+        topology_id (int): The index of the mesh2d in the file.
+        variables (Iterable[str]): The data variables to export, all the data variables of the mesh2d when not given.
+        row_group_rows (int): The number of rows of a row group, rounded to whole time steps.
+
+    Returns:
+        Dict[str, Path]: The files written, keyed by "nodes", "edges", "faces" and the variable names.
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+
+    if row_group_rows <= 0:
+        raise InputError("The number of rows of a row group must be positive")
+
+    source = str(source)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    header = read_classic_header(source)
+    summary = inventory(source)
+    counts = next(
+        (
+            t.counts
+            for t in summary.topologies
+            if (t.topology, t.topology_id) == ("mesh2d", topology_id)
+        ),
+        None,
+    )
+    if counts is None:
+        raise InputError(f"{source} has no mesh2d {topology_id}")
+    described = {
+        v.name: v
+        for v in summary.variables
+        if (v.topology, v.topology_id) == ("mesh2d", topology_id)
+    }
+
+    with UGrid(source, "r") as ug:
+        mesh2d = ug.mesh2d_get(topology_id)
+        if header is not None and "time" in header.variables:
+            times = header.view("time")
+        else:
+            try:
+                times = ug.variable_get_data_double("time")
+            except UGridError:
+                times = None
+    times = None if times is None else times.astype(times.dtype.newbyteorder("="))
+
+    def supported(variable):
+        count = counts.get(f"num_{variable.location}s")
+        shape = variable.shape
+        if len(shape) == 1:
+            return shape[0] == count
+        return len(shape) == 2 and times is not None and shape == (times.size, count)
+
+    if variables is None:
+        names = [name for name, variable in described.items() if supported(variable)]
+    else:
+        names = list(dict.fromkeys(variables))
+        for name in names:
+            if name not in described:
+                raise InputError(f"{name} is not a data variable of the mesh2d")
+            if not supported(described[name]):
+                raise InputError(
+                    f"{name} does not have one value per entity or per time and entity"
+                )
+
+    written = {}
+    for key, table in mesh2d_to_arrow(mesh2d).items():
+        path = directory / f"{mesh2d.name}_{key}.parquet"
+        pq.write_table(table, path)
+        written[key] = path
+
+    for name in names:
+        variable = described[name]
+        if header is not None and name in header.variables:
+            data = header.view(name)
+        else:
+            with UGrid(source, "r") as ug:
+                data = ug.variable_get_data_double(name).reshape(variable.shape)
+
+        path = directory / f"{name}.parquet"
+        metadata = {key: str(value) for key, value in variable.attributes.items()}
+        if data.ndim == 1:
+            table = data_to_arrow(
+                name, data.astype(data.dtype.newbyteorder("=")), variable.location
+            )
+            pq.write_table(table.replace_schema_metadata(metadata), path)
+        else:
+            num_times, num_entities = data.shape
+            rows = max(1, row_group_rows // max(1, num_entities))
+            native = data.dtype.newbyteorder("=")
+            empty = data_to_arrow(
+                name, data[:0].astype(native), variable.location, times[:0]
+            )
+            with pq.ParquetWriter(path, empty.schema.with_metadata(metadata)) as writer:
+                for start in range(0, num_times, rows):
+                    stop = min(start + rows, num_times)
+                    block = data[start:stop].astype(native)
+                    writer.write_table(
+                        data_to_arrow(name, block, variable.location, times[start:stop])
+                    )
+        written[name] = path
+    return written
+
+
+def _import_pyarrow():
+    """Imports the optional pyarrow package."""
+    try:
+        import pyarrow
+    except ImportError as error:
+        raise ImportError(
+            "Exporting to Arrow requires the pyarrow package, install it with `pip install UGrid[arrow]`"
+        ) from error
+    return pyarrow
+
+
+def _column(pa, values: np.ndarray):
+    """Wraps a one-dimensional array of numbers in an Arrow array without copying it when it is contiguous."""
+    values = np.ascontiguousarray(values)
+    if values.dtype.byteorder not in "=|":
+        values = values.astype(values.dtype.newbyteorder("="))
+    buffer = pa.py_buffer(values)
+    return pa.Array.from_buffers(
+        pa.from_numpy_dtype(values.dtype), values.size, [None, buffer]
+    )
+
+
+def _fixed_size_list(pa, values: np.ndarray, row_size: int):
+    """Wraps a flat array of rows of `row_size` entries in an Arrow fixed-size list array, without copying it."""
+    return pa.FixedSizeListArray.from_arrays(_column(pa, values.ravel()), row_size)
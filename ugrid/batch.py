@@ -0,0 +1,454 @@
+"""Runs an extraction or a conversion over many UGrid files with a pool of processes.
+
+Usage, from a shell::
+
+    python -m ugrid.batch statistics DIRECTORY --variables mesh2d_s1 mesh2d_ucmag
+    python -m ugrid.batch stations DIRECTORY --variables mesh2d_s1 --stations stations.csv --output OUTPUT
+    python -m ugrid.batch convert DIRECTORY --variables mesh2d_s1 --output OUTPUT
+
+Every file is processed by a single worker process, the files are handed to the workers in chunks.
+A file that fails is reported and does not stop the others, even when it kills its worker process.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ugrid.connectivity import FaceNodesCSR
+from ugrid.ugrid import UGrid
+
+OPERATIONS = ("statistics", "stations", "convert")
+
+
+class BatchResult:
+    """The outcome of the processing of a file.
+
+    Attributes:
+        file_path (str): The processed file.
+        num_bytes (int): The size of the file.
+        seconds (float): The time spent processing the file.
+        value (object): What the task returned, None if it failed.
+        error (str): The error raised by the task, None if it succeeded.
+    """
+
+    def __init__(self, file_path, num_bytes, seconds, value=None, error=None):
+        self.file_path: str = file_path
+        self.num_bytes: int = num_bytes
+        self.seconds: float = seconds
+        self.value = value
+        self.error: str = error
+
+    @property
+    def ok(self) -> bool:
+        """True if the task succeeded."""
+        return self.error is None
+
+
+class BatchReport:
+    """The outcome of a batch, with its throughput.
+
+    Attributes:
+        results (list): The BatchResult of every file, in the order of the files.
+        seconds (float): The wall-clock time of the batch.
+    """
+
+    def __init__(self, results, seconds):
+        self.results: List[BatchResult] = results
+        self.seconds: float = seconds
+
+    @property
+    def failed(self) -> List[BatchResult]:
+        """The results of the files that failed."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def num_bytes(self) -> int:
+        """The total size of the files."""
+        return sum(result.num_bytes for result in self.results)
+
+    @property
+    def files_per_second(self) -> float:
+        """The number of files processed per second."""
+        return len(self.results) / self.seconds if self.seconds > 0.0 else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """The number of megabytes processed per second."""
+        return self.num_bytes / 1e6 / self.seconds if self.seconds > 0.0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.results)} files, {len(self.failed)} failed, {self.num_bytes / 1e6:.1f} MB "
+            f"in {self.seconds:.2f} s: {self.files_per_second:.2f} files/s, {self.megabytes_per_second:.2f} MB/s"
+        )
+
+
+def find_files(directory, pattern: str = "*.nc") -> List[str]:
+    """Finds the files of a directory matching a pattern, in name order.
+
+    Args:
+        directory (str): The directory to search.
+        pattern (str): The glob pattern of the file names.
+
+    Returns:
+        List[str]: The sorted file paths.
+    """
+    return sorted(str(path) for path in Path(directory).glob(pattern) if path.is_file())
+
+
+def run_batch(
+    file_paths,
+    task: Callable,
+    max_workers: int = None,
+    chunksize: int = None,
+    progress: Callable = None,
+) -> BatchReport:
+    """Applies a task to many files with a pool of processes.
+
+    The files are handed to the workers in chunks, to amortize the cost of the communication between processes.
+    An exception raised by the task for a file is recorded in the result of that file only.
+    A worker process may also die, for instance on a crash of the native UGrid library. The pool of processes
+    is then restarted, and the files that were being processed are run again, in smaller and smaller groups,
+    until the file that killed its worker is found and recorded as failed.
+
+    Args:
+        file_paths (List[str]): The files to process.
+        task (Callable): A picklable function of a file path, such as a module-level function or a
+            functools.partial of one. Its return value is sent back to the calling process.
+        max_workers (int): The number of processes, the number of CPUs when not given.
+        chunksize (int): The number of files per chunk, about four chunks per worker when not given.
+        progress (Callable): Called with the number of files done, the number of files and the latest BatchResult,
+            as the results arrive.
+
+    Returns:
+        BatchReport: The results, in the order of the files, and the throughput.
+    """
+    file_paths = [str(file_path) for file_path in file_paths]
+    max_workers = max_workers or os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(file_paths)))
+    if chunksize is None:
+        chunksize = max(1, len(file_paths) // (4 * max_workers))
+
+    results: Dict[int, BatchResult] = {}
+
+    def record(index, result):
+        results[index] = result
+        if progress is not None:
+            progress(len(results), len(file_paths), result)
+
+    begin = time.perf_counter()
+    run = functools.partial(_run_task, task)
+    if max_workers == 1:
+        for index, result in map(run, enumerate(file_paths)):
+            record(index, result)
+    else:
+        _run_isolating(run, list(enumerate(file_paths)), max_workers, chunksize, record)
+    seconds = time.perf_counter() - begin
+    return BatchReport([results[i] for i in range(len(file_paths))], seconds)
+
+
+def statistics_task(file_path: str, variables) -> Dict[str, Dict[str, float]]:
+    """Computes the minimum, maximum and mean of data variables, ignoring NaN values and `_FillValue` entries.
+
+    Args:
+        file_path (str): The file to read.
+        variables (List[str]): The names of the data variables.
+
+    Returns:
+        dict: For every variable, its "min", "max", "mean" and the "count" of values that are not missing.
+    """
+    statistics = {}
+    with UGrid(file_path, "r") as ug:
+        for variable_name in variables:
+            data = ug.variable_get_data_double(variable_name)
+            missing = np.isnan(data)
+            fill_value = _fill_value(ug, variable_name)
+            if fill_value is not None:
+                # The data are read as double, a fill value of a float variable only matches in single precision
+                missing |= np.isclose(data, fill_value, rtol=1e-6, atol=0.0)
+            valid = data[~missing]
+            empty = valid.size == 0
+            statistics[variable_name] = {
+                "min": np.nan if empty else float(valid.min()),
+                "max": np.nan if empty else float(valid.max()),
+                "mean": np.nan if empty else float(valid.mean()),
+                "count": int(valid.size),
+            }
+    return statistics
+
+
+def stations_task(
+    file_path: str, variables, station_x, station_y, output_directory: str
+) -> str:
+    """Extracts face data variables at stations, from the face with the nearest center, and saves them.
+
+    The variables are saved with the station faces and coordinates in `<output_directory>/<name>_stations.npz`,
+    with the faces along their last axis.
+
+    Args:
+        file_path (str): The file to read, with a mesh2d.
+        variables (List[str]): The names of the data variables, located on the faces of the first mesh2d.
+        station_x (ndarray): The x-coordinates of the stations.
+        station_y (ndarray): The y-coordinates of the stations.
+        output_directory (str): The directory of the output file.
+
+    Returns:
+        str: The output file.
+    """
+    arrays = {}
+    with UGrid(file_path, "r") as ug:
+        mesh2d = ug.mesh2d_get(0)
+        num_faces = mesh2d.face_nodes.size // mesh2d.num_face_nodes_max
+        if mesh2d.face_x.size == num_faces and mesh2d.face_y.size == num_faces:
+            face_x, face_y = mesh2d.face_x, mesh2d.face_y
+        else:
+            face_x, face_y = FaceNodesCSR.from_mesh2d(mesh2d).face_centroid(
+                mesh2d.node_x, mesh2d.node_y
+            )
+        _, faces = cKDTree(np.column_stack([face_x, face_y])).query(
+            np.column_stack([station_x, station_y])
+        )
+        for variable_name in variables:
+            data = _read_shaped(ug, variable_name)
+            if data.shape[-1] != num_faces:
+                raise ValueError(f"{variable_name} is not located on the faces")
+            arrays[variable_name] = np.take(data, faces, axis=-1)
+
+    output = Path(output_directory) / f"{Path(file_path).stem}_stations.npz"
+    np.savez(
+        output,
+        station_x=np.asarray(station_x, dtype=np.double),
+        station_y=np.asarray(station_y, dtype=np.double),
+        face=faces,
+        **arrays,
+    )
+    return str(output)
+
+
+def convert_task(file_path: str, variables, output_directory: str) -> str:
+    """Converts the first mesh2d and data variables of a file to a NumPy archive.
+
+    The mesh2d attributes are saved with a "mesh2d_" prefix and the variables with their shape,
+    in `<output_directory>/<name>.npz`.
+
+    Args:
+        file_path (str): The file to read, with a mesh2d.
+        variables (List[str]): The names of the data variables.
+        output_directory (str): The directory of the output file.
+
+    Returns:
+        str: The output file.
+    """
+    arrays = {}
+    with UGrid(file_path, "r") as ug:
+        mesh2d = ug.mesh2d_get(0)
+        for name, value in vars(mesh2d).items():
+            arrays[f"mesh2d_{name}"] = np.asarray(value)
+        for variable_name in variables:
+            arrays[variable_name] = _read_shaped(ug, variable_name)
+
+    output = Path(output_directory) / f"{Path(file_path).stem}.npz"
+    np.savez(output, **arrays)
+    return str(output)
+
+
+def main(argv=None) -> int:
+    """Runs the command line interface.
+
+    Args:
+        argv (List[str]): The arguments, those of the command line when not given.
+
+    Returns:
+        int: The exit status, 1 if any file failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m ugrid.batch",
+        description="Runs an extraction or a conversion over a directory of UGrid files with a pool of processes.",
+    )
+    parser.add_argument("operation", choices=OPERATIONS)
+    parser.add_argument("directory", help="The directory of the UGrid files.")
+    parser.add_argument(
+        "--pattern", default="*.nc", help="The glob pattern of the files."
+    )
+    parser.add_argument(
+        "--variables", nargs="+", default=[], help="The data variables."
+    )
+    parser.add_argument(
+        "--stations",
+        help="A text file with the x and y coordinates of a station per line, for the stations operation.",
+    )
+    parser.add_argument("--output", default=".", help="The output directory.")
+    parser.add_argument("--workers", type=int, help="The number of processes.")
+    parser.add_argument(
+        "--chunksize", type=int, help="The number of files per task chunk."
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="Do not report the progress."
+    )
+    args = parser.parse_args(argv)
+
+    file_paths = find_files(args.directory, args.pattern)
+    if not file_paths:
+        parser.error(f"No file matches {args.pattern} in {args.directory}")
+    if args.operation != "statistics":
+        os.makedirs(args.output, exist_ok=True)
+
+    if args.operation == "statistics":
+        task = functools.partial(statistics_task, variables=args.variables)
+    elif args.operation == "stations":
+        if args.stations is None:
+            parser.error("The stations operation needs --stations")
+        stations = np.atleast_2d(
+            np.loadtxt(
+                args.stations, delimiter="," if args.stations.endswith(".csv") else None
+            )
+        )
+        task = functools.partial(
+            stations_task,
+            variables=args.variables,
+            station_x=stations[:, 0],
+            station_y=stations[:, 1],
+            output_directory=args.output,
+        )
+    else:
+        task = functools.partial(
+            convert_task, variables=args.variables, output_directory=args.output
+        )
+
+    def report(done, total, result):
+        status = "ok" if result.ok else f"failed: {result.error}"
+        print(f"[{done}/{total}] {result.file_path}: {status}", file=sys.stderr)
+
+    batch = run_batch(
+        file_paths,
+        task,
+        max_workers=args.workers,
+        chunksize=args.chunksize,
+        progress=None if args.quiet else report,
+    )
+
+    if args.operation == "statistics":
+        for result in batch.results:
+            for variable_name, values in (result.value or {}).items():
+                print(
+                    f"{result.file_path}\t{variable_name}\t{values['min']}\t{values['max']}"
+                    f"\t{values['mean']}\t{values['count']}"
+                )
+    for result in batch.failed:
+        print(f"{result.file_path}: {result.error}", file=sys.stderr)
+    print(batch, file=sys.stderr)
+    return 1 if batch.failed else 0
+
+
+def _run_task(task: Callable, indexed_file_path) -> tuple:
+    """Runs a task on a file in a worker, turning any exception in a failed result."""
+    index, file_path = indexed_file_path
+    begin = time.perf_counter()
+    try:
+        num_bytes = os.path.getsize(file_path)
+        value = task(file_path)
+        error = None
+    except Exception as exception:
+        num_bytes = 0 if not os.path.exists(file_path) else os.path.getsize(file_path)
+        value = None
+        error = f"{type(exception).__name__}: {exception}"
+    seconds = time.perf_counter() - begin
+    return index, BatchResult(file_path, num_bytes, seconds, value, error)
+
+
+def _run_chunk(run: Callable, chunk) -> list:
+    """Runs a task on a chunk of files in a worker."""
+    return [run(indexed_file_path) for indexed_file_path in chunk]
+
+
+def _run_pool(
+    run: Callable, chunks: deque, max_workers: int, record: Callable
+) -> Tuple[deque, list]:
+    """Runs chunks of files in a new pool of processes, until they are all done or a worker process dies.
+
+    At most one chunk per worker is submitted at a time, so that the files being processed when a worker dies
+    are known.
+
+    Returns:
+        Tuple[deque, list]: The chunks not submitted yet and the files of the chunks lost with the pool.
+    """
+    in_flight = {}
+    with ProcessPoolExecutor(max_workers) as executor:
+        while chunks or in_flight:
+            while chunks and len(in_flight) < max_workers:
+                chunk = chunks.popleft()
+                in_flight[executor.submit(_run_chunk, run, chunk)] = chunk
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            if any(isinstance(f.exception(), BrokenProcessPool) for f in done):
+                # The other chunks in flight end with the pool, unless they were done just before
+                done, _ = wait(in_flight)
+            lost = []
+            for future in done:
+                chunk = in_flight.pop(future)
+                if isinstance(future.exception(), BrokenProcessPool):
+                    lost.extend(chunk)
+                    continue
+                for index, result in future.result():
+                    record(index, result)
+            if lost:
+                return chunks, lost
+    return chunks, []
+
+
+def _run_isolating(
+    run: Callable, items: list, max_workers: int, chunksize: int, record: Callable
+) -> None:
+    """Runs a task on files in chunks with a pool of processes, restarting the pool whenever a worker dies.
+
+    The files lost with a pool are run again in chunks of one file, then one file at a time,
+    so that only the file that killed its worker is recorded as failed.
+    """
+    chunks = deque(items[i : i + chunksize] for i in range(0, len(items), chunksize))
+    while chunks:
+        chunks, lost = _run_pool(run, chunks, max_workers, record)
+        if len(lost) == 1:
+            index, file_path = lost[0]
+            num_bytes = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+            error = (
+                "BrokenProcessPool: the worker process died while processing the file"
+            )
+            record(index, BatchResult(file_path, num_bytes, 0.0, error=error))
+        elif lost:
+            _run_isolating(run, lost, max_workers if chunksize > 1 else 1, 1, record)
+
+
+def _fill_value(ug: UGrid, variable_name: str):
+    """Reads the `_FillValue` attribute of a data variable, None if it has none."""
+    attributes = dict(
+        zip(
+            ug.variable_get_attributes_names(variable_name),
+            ug.variable_get_attributes_values(variable_name),
+        )
+    )
+    try:
+        # The attribute values of the UGrid library are text
+        return float(attributes["_FillValue"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _read_shaped(ug: UGrid, variable_name: str) -> np.ndarray:
+    """Reads a data variable, shaped with its dimensions."""
+    dimensions = tuple(int(d) for d in ug.variable_get_dimensions(variable_name))
+    return ug.variable_get_data_double(variable_name).reshape(dimensions)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
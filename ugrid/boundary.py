@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ugrid.connectivity import FaceNodesCSR
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridMesh2D
+from ugrid.utils import find_edges, valid_index_mask
+
+
+class MeshBoundary:
+    """The boundary of a mesh2d. All indices are zero-based.
+
+    Boundary edges are oriented with the domain on their left,
+    so outer rings run counterclockwise and holes run clockwise.
+    The nodes of ring `i` are `ring_nodes[ring_offsets[i]:ring_offsets[i + 1]]`, the first node is not repeated.
+    Rings are sorted by decreasing signed area: outer rings come first, holes last.
+
+    Attributes:
+        edges (ndarray): The index of each boundary edge in the mesh2d edges, -1 if the mesh2d has no such edge.
+        edge_nodes (ndarray): The oriented nodes of each boundary edge, with shape (num_boundary_edges, 2).
+        nodes (ndarray): The sorted unique boundary nodes.
+        ring_nodes (ndarray): The nodes of all rings, stored one ring after the other.
+        ring_edges (ndarray): The position in `edges` of the edge starting at each entry of `ring_nodes`.
+        ring_offsets (ndarray): The position of the first node of each ring in `ring_nodes`, with num_rings + 1 entries.
+        ring_area (ndarray): The signed area enclosed by each ring, negative for holes.
+    """
+
+    def __init__(
+        self, edges, edge_nodes, nodes, ring_nodes, ring_edges, ring_offsets, ring_area
+    ):
+        self.edges: np.ndarray = edges
+        self.edge_nodes: np.ndarray = edge_nodes
+        self.nodes: np.ndarray = nodes
+        self.ring_nodes: np.ndarray = ring_nodes
+        self.ring_edges: np.ndarray = ring_edges
+        self.ring_offsets: np.ndarray = ring_offsets
+        self.ring_area: np.ndarray = ring_area
+
+    @property
+    def num_rings(self) -> int:
+        """The number of boundary rings."""
+        return self.ring_offsets.size - 1
+
+    @property
+    def ring_is_hole(self) -> np.ndarray:
+        """True for the rings enclosing a hole in the domain."""
+        return self.ring_area < 0.0
+
+    def ring_coordinates(
+        self, node_x: np.ndarray, node_y: np.ndarray, closed: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Gets the coordinates of the ring polylines.
+
+        Args:
+            node_x (ndarray): The x-coordinates of the mesh2d nodes.
+            node_y (ndarray): The y-coordinates of the mesh2d nodes.
+            closed (bool): Whether to repeat the first node at the end of every ring.
+
+        Returns:
+            Tuple[ndarray, ndarray, ndarray]: The x and y coordinates of all rings and their offsets.
+        """
+        if not closed:
+            return node_x[self.ring_nodes], node_y[self.ring_nodes], self.ring_offsets
+        nodes = np.insert(
+            self.ring_nodes,
+            self.ring_offsets[1:],
+            self.ring_nodes[self.ring_offsets[:-1]],
+        )
+        offsets = self.ring_offsets + np.arange(self.num_rings + 1)
+        return node_x[nodes], node_y[nodes], offsets
+
+
+def _boundary_from_edge_faces(mesh2d: UGridMesh2D) -> Tuple[np.ndarray, np.ndarray]:
+    """Finds the boundary edges and their face from the edge faces of a mesh2d."""
+    edge_faces = mesh2d.edge_faces.reshape(-1, 2)
+    valid = valid_index_mask(edge_faces, mesh2d.start_index, mesh2d.int_fill_value)
+    edges = np.flatnonzero(valid[:, 0] != valid[:, 1])
+    faces = np.where(valid[edges, 0], edge_faces[edges, 0], edge_faces[edges, 1])
+    return edges, faces.astype(np.int64) - mesh2d.start_index
+
+
+def _boundary_from_face_nodes(
+    mesh2d: UGridMesh2D, face_nodes: FaceNodesCSR
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Derives the boundary edges and their face from the face nodes of a mesh2d.
+    A boundary edge is a face side whose nodes are not joined by the side of any other face.
+    """
+    first = face_nodes.indices.astype(np.int64) - face_nodes.start_index
+    second = first[face_nodes.next_position()]
+    num_nodes = max(int(first.max(initial=0)) + 1, mesh2d.node_x.size)
+    edge_nodes = np.empty((0, 2), dtype=np.int64)
+    if mesh2d.edge_nodes.size > 0:
+        edge_nodes = mesh2d.edge_nodes.reshape(-1, 2).astype(np.int64)
+        edge_nodes -= mesh2d.start_index
+        num_nodes = max(num_nodes, int(edge_nodes.max()) + 1)
+
+    keys = np.minimum(first, second) * num_nodes + np.maximum(first, second)
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+    single = np.ones(order.size, dtype=bool)
+    single[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    single[:-1] &= sorted_keys[:-1] != sorted_keys[1:]
+    sides = np.sort(order[single])
+
+    boundary_nodes = np.stack([first[sides], second[sides]], axis=1)
+    faces = face_nodes.face_of_index()[sides]
+
+    # Locate the derived boundary edges among the mesh2d edges
+    edges = find_edges(first[sides], second[sides], edge_nodes, num_nodes)
+
+    return edges, faces, boundary_nodes
+
+
+def _orient(
+    first: np.ndarray,
+    second: np.ndarray,
+    faces: np.ndarray,
+    mesh2d: UGridMesh2D,
+    node_x: np.ndarray,
+    node_y: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Orients each boundary edge as it appears in its counterclockwise face."""
+    num_face_nodes_max = mesh2d.num_face_nodes_max
+    rows = mesh2d.face_nodes.reshape(-1, num_face_nodes_max)[faces]
+    valid = valid_index_mask(rows, mesh2d.start_index, mesh2d.int_fill_value)
+    rows = np.where(valid, rows.astype(np.int64) - mesh2d.start_index, 0)
+    counts = np.maximum(valid.sum(axis=1), 1)
+    columns = np.arange(num_face_nodes_max)
+    following = rows[
+        np.arange(rows.shape[0])[:, np.newaxis], (columns + 1) % counts[:, np.newaxis]
+    ]
+
+    # Signed area of the faces owning a boundary edge, to detect clockwise faces
+    x, y = node_x[rows], node_y[rows]
+    x_next, y_next = node_x[following], node_y[following]
+    area = np.sum(np.where(valid, x * y_next - x_next * y, 0.0), axis=1)
+
+    match = valid & (rows == first[:, np.newaxis])
+    column = np.argmax(match, axis=1)
+    forward = following[np.arange(rows.shape[0]), column] == second
+    forward ^= area < 0.0
+    return np.where(forward, first, second), np.where(forward, second, first)
+
+
+def _successors(
+    start: np.ndarray, end: np.ndarray, node_x: np.ndarray, node_y: np.ndarray
+) -> np.ndarray:
+    """Finds the boundary edge following each boundary edge.
+    Where several boundary edges leave the same node, the domain wedge is followed clockwise.
+    """
+    num_edges = start.size
+    by_start = np.argsort(start, kind="stable")
+    sorted_start = start[by_start]
+    first = np.searchsorted(sorted_start, end, side="left")
+    count = np.searchsorted(sorted_start, end, side="right") - first
+    if np.any(count == 0):
+        raise InputError(
+            "The mesh2d boundary is not closed, check for inconsistent faces."
+        )
+
+    successors = by_start[first]
+    pinched = np.flatnonzero(count > 1)
+    if pinched.size > 0:
+        # Pair every incoming edge with each candidate outgoing edge of its end node
+        candidates = np.repeat(first[pinched], count[pinched])
+        incoming = np.repeat(pinched, count[pinched])
+        group_start = np.cumsum(count[pinched]) - count[pinched]
+        candidates += np.arange(candidates.size) - np.repeat(
+            group_start, count[pinched]
+        )
+        outgoing = by_start[candidates]
+
+        node = end[incoming]
+        back_angle = np.arctan2(
+            node_y[start[incoming]] - node_y[node],
+            node_x[start[incoming]] - node_x[node],
+        )
+        out_angle = np.arctan2(
+            node_y[end[outgoing]] - node_y[node], node_x[end[outgoing]] - node_x[node]
+        )
+        clockwise = np.mod(back_angle - out_angle, 2.0 * np.pi)
+        order = np.lexsort((clockwise, incoming))
+        is_first = np.ones(order.size, dtype=bool)
+        is_first[1:] = incoming[order[1:]] != incoming[order[:-1]]
+        successors[incoming[order[is_first]]] = outgoing[order[is_first]]
+
+    if np.unique(successors).size != num_edges:
+        raise InputError("The mesh2d boundary is not made of closed rings.")
+    return successors
+
+
+def _rings(successors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Splits the cycles of the successor permutation into rings with pointer jumping.
+
+    Returns:
+        Tuple[ndarray, ndarray]: The ring label (smallest edge of the ring) and the position along the ring of every edge.
+    """
+    num_edges = successors.size
+    label = np.arange(num_edges)
+    jump = successors.copy()
+    steps = 1
+    while steps < num_edges:
+        np.minimum(label, label[jump], out=label)
+        jump = jump[jump]
+        steps *= 2
+
+    # Cut every ring before its smallest edge and rank the edges along the resulting list
+    following = successors.copy()
+    terminal = successors == label
+    following[terminal] = np.flatnonzero(terminal)
+    distance = (~terminal).astype(np.int64)
+    while True:
+        next_following = following[following]
+        if np.array_equal(next_following, following):
+            break
+        distance += distance[following]
+        following = next_following
+
+    ring_length = distance[label] + 1
+    return label, ring_length - 1 - distance
+
+
+def extract_mesh2d_boundary(mesh2d: UGridMesh2D) -> MeshBoundary:
+    """Extracts the boundary edges, nodes and ordered boundary rings of a mesh2d.
+
+    The boundary edges are taken from `edge_faces` when present, otherwise they are derived from `face_nodes`.
+
+    Args:
+        mesh2d (UGridMesh2D): The mesh2d.
+
+    Returns:
+        MeshBoundary: The mesh2d boundary.
+    """
+    num_edges = mesh2d.edge_nodes.size // 2
+    if mesh2d.face_nodes.size == 0:
+        raise InputError("The boundary of a mesh2d can only be computed with faces.")
+
+    node_x = np.asarray(mesh2d.node_x, dtype=np.double)
+    node_y = np.asarray(mesh2d.node_y, dtype=np.double)
+    if num_edges > 0 and mesh2d.edge_faces.size == 2 * num_edges:
+        edges, faces = _boundary_from_edge_faces(mesh2d)
+        nodes = mesh2d.edge_nodes.reshape(-1, 2)[edges].astype(np.int64)
+        nodes -= mesh2d.start_index
+    else:
+        edges, faces, nodes = _boundary_from_face_nodes(
+            mesh2d, FaceNodesCSR.from_mesh2d(mesh2d)
+        )
+
+    start, end = _orient(nodes[:, 0], nodes[:, 1], faces, mesh2d, node_x, node_y)
+
+    if start.size == 0:
+        empty = np.array([], dtype=np.int64)
+        return MeshBoundary(
+            edges,
+            np.empty((0, 2), dtype=np.int64),
+            empty,
+            empty,
+            empty,
+            np.zeros(1, dtype=np.int64),
+            np.array([], dtype=np.double),
+        )
+
+    successors = _successors(start, end, node_x, node_y)
+    label, position = _rings(successors)
+
+    order = np.lexsort((position, label))
+    ring_start = np.flatnonzero(position[order] == 0)
+    ring_offsets = np.append(ring_start, order.size)
+
+    # Signed area of every ring, with the shoelace formula
+    cross = node_x[start] * node_y[end] - node_x[end] * node_y[start]
+    ring_area = 0.5 * np.add.reduceat(cross[order], ring_start)
+
+    # Sort the rings by decreasing signed area
+    num_rings = ring_start.size
+    ring_order = np.argsort(-ring_area, kind="stable")
+    ring_rank = np.empty(num_rings, dtype=np.int64)
+    ring_rank[ring_order] = np.arange(num_rings)
+    ring_lengths = np.diff(ring_offsets)
+    ring_offsets = np.zeros(num_rings + 1, dtype=np.int64)
+    np.cumsum(ring_lengths[ring_order], out=ring_offsets[1:])
+    ring_of_edge = ring_rank[np.repeat(np.arange(num_rings), ring_lengths)]
+    ring_edges = np.empty(order.size, dtype=np.int64)
+    ring_edges[ring_offsets[ring_of_edge] + position[order]] = order
+
+    return MeshBoundary(
+        edges=edges,
+        edge_nodes=np.stack([start, end], axis=1),
+        nodes=np.unique(start),
+        ring_nodes=start[ring_edges],
+        ring_edges=ring_edges,
+        ring_offsets=ring_offsets,
+        ring_area=ring_area[ring_order],
+    )
@@ -32,8 +32,12 @@ def pad_and_join_list_of_strings(string_list: list, str_size: int):
 
 
 def numpy_array_to_ctypes(arr):
-    """Cast an array to ctypes only if its len is not 0"""
+    """Cast an array to ctypes only if its len is not 0.
+    Read-only arrays, such as cached or memory mapped topologies, are copied since ctypes only wraps writable memory
+    """
     if arr is not None and len(arr) > 0:
+        if not arr.flags.writeable:
+            arr = np.array(arr)
         return as_ctypes(arr)
     return None
 
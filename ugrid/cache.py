@@ -0,0 +1,338 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Tuple
+
+import numpy as np
+
+from ugrid.errors import InputError
+from ugrid.fingerprint import fingerprint
+from ugrid.py_structures import UGridContacts, UGridMesh1D, UGridMesh2D, UGridNetwork1D
+from ugrid.ugrid import UGrid
+
+TOPOLOGY_TYPES = {
+    "network1d": UGridNetwork1D,
+    "mesh1d": UGridMesh1D,
+    "mesh2d": UGridMesh2D,
+    "contacts": UGridContacts,
+}
+
+DEFAULT_CACHE_BYTES = 1 << 30
+
+# Changing how topologies are stored must change this, to leave the previous entries unused
+CACHE_FORMAT_VERSION = 1
+
+
+class DiskCache:
+    """A persistent cache of the topologies read from UGrid files, stored as uncompressed `.npy` files.
+
+    An entry is keyed by the absolute path, the size and the modification time of the file it was read from,
+    so rewriting the file invalidates its entries. Every array attribute of a topology is stored in its own
+    `.npy` file and loaded back with memory mapping, so loading a cached topology reads almost nothing
+    until the arrays are used. The other attributes and the topology fingerprint are stored as JSON.
+    Entries are written to a temporary directory first and renamed, so readers never see a partial entry.
+
+    Arrays loaded with memory mapping are read-only, copy them before modifying them.
+
+    Attributes:
+        directory (Path): The directory of the cache entries.
+        mmap (bool): Whether to load the arrays with memory mapping.
+        hits (int): The number of topologies served from the cache.
+        misses (int): The number of topologies read from their file.
+    """
+
+    def __init__(self, directory, mmap: bool = True):
+        self.directory: Path = Path(directory)
+        self.mmap: bool = mmap
+        self.hits: int = 0
+        self.misses: int = 0
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, file_path, topology: str = "mesh2d", topology_id: int = 0) -> str:
+        """Computes the key of a topology of a file from the identity of the file.
+
+        Args:
+            file_path (str): The UGrid file.
+            topology (str): The kind of topology ("network1d", "mesh1d", "mesh2d" or "contacts").
+            topology_id (int): The index of the topology in the file.
+
+        Returns:
+            str: The hexadecimal key.
+        """
+        identity = (CACHE_FORMAT_VERSION,) + _file_identity(
+            file_path, topology, topology_id
+        )
+        identity = "\0".join(str(part) for part in identity)
+        return hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+
+    def get(self, file_path, topology: str = "mesh2d", topology_id: int = 0):
+        """Gets a topology of a file, from the cache if present, otherwise from the file, storing it in the cache.
+
+        Args:
+            file_path (str): The UGrid file.
+            topology (str): The kind of topology ("network1d", "mesh1d", "mesh2d" or "contacts").
+            topology_id (int): The index of the topology in the file.
+
+        Returns:
+            The topology, a UGridNetwork1D, UGridMesh1D, UGridMesh2D or UGridContacts.
+        """
+        key = self.key(file_path, topology, topology_id)
+        cached = self.load(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        with UGrid(str(file_path), "r") as ug:
+            value = getattr(ug, f"{topology}_get")(topology_id)
+        self.store(key, value)
+        return value
+
+    def load(self, key: str):
+        """Loads a cached topology.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            The topology, None if there is no entry for the key.
+        """
+        entry = self.directory / key
+        try:
+            with open(entry / "meta.json", "r") as file:
+                meta = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        values = dict(meta["values"])
+        for name in meta["arrays"]:
+            path = entry / f"{name}.npy"
+            # Empty files cannot be memory mapped
+            mmap_mode = "r" if self.mmap and meta["arrays"][name] > 0 else None
+            values[name] = np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+
+        # The attributes do not all match the constructor arguments, they are restored as they were stored
+        topology = TOPOLOGY_TYPES[meta["topology"]].__new__(
+            TOPOLOGY_TYPES[meta["topology"]]
+        )
+        vars(topology).update(values)
+        return topology
+
+    def fingerprint(self, key: str) -> str:
+        """Gets the fingerprint of a cached topology without loading its arrays.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            str: The fingerprint, None if there is no entry for the key.
+        """
+        try:
+            with open(self.directory / key / "meta.json", "r") as file:
+                return json.load(file)["fingerprint"]
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, topology) -> None:
+        """Stores a topology in the cache, unless an entry with the same key exists.
+
+        Args:
+            key (str): The key of the entry.
+            topology: A UGridNetwork1D, UGridMesh1D, UGridMesh2D or UGridContacts.
+        """
+        kinds = [k for k, t in TOPOLOGY_TYPES.items() if isinstance(topology, t)]
+        if not kinds:
+            raise InputError(f"Cannot cache a {type(topology).__name__}")
+
+        entry = self.directory / key
+        if entry.exists():
+            return
+        temporary = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.directory))
+        try:
+            values = {}
+            arrays = {}
+            for name, value in vars(topology).items():
+                if isinstance(value, np.ndarray):
+                    np.save(temporary / f"{name}.npy", value, allow_pickle=False)
+                    arrays[name] = int(value.size)
+                elif isinstance(value, np.generic):
+                    values[name] = value.item()
+                else:
+                    values[name] = value
+            meta = {
+                "topology": kinds[0],
+                "fingerprint": fingerprint(topology),
+                "arrays": arrays,
+                "values": values,
+            }
+            # The metadata is written last, an entry without it is incomplete
+            with open(temporary / "meta.json", "w") as file:
+                json.dump(meta, file)
+            os.rename(temporary, entry)
+        except OSError:
+            # Another process stored the same entry first
+            if not (entry / "meta.json").exists():
+                raise
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    def clear(self) -> None:
+        """Removes all the entries of the cache."""
+        for path in self.directory.iterdir():
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+
+
+class TopologyCache:
+    """A process-wide least recently used cache of the topologies read from UGrid files, with a size budget in bytes.
+
+    An entry is keyed by the absolute path, the size and the modification time of its file,
+    the kind of topology and its index, so rewriting a file makes its previous entries unused.
+    The arrays of the cached topologies are made read-only and every get returns a new topology object
+    sharing them, so callers can neither modify the cached arrays nor replace the attributes of a cached object.
+    The cache can be shared between threads.
+
+    Pass the cache to UGrid to serve `*_get` from it::
+
+        with UGrid(file_path, "r", topology_cache=default_topology_cache()) as ug:
+            mesh2d = ug.mesh2d_get(0)
+
+    Attributes:
+        max_bytes (int): The largest total size of the cached arrays.
+        hits (int): The number of topologies served from the cache.
+        misses (int): The number of topologies read from their file.
+        evictions (int): The number of entries removed to respect the size budget.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.__entries = OrderedDict()
+        self.__num_bytes = 0
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def num_bytes(self) -> int:
+        """The total size of the cached arrays."""
+        return self.__num_bytes
+
+    def get(
+        self,
+        file_path,
+        topology: str = "mesh2d",
+        topology_id: int = 0,
+        reader: Callable = None,
+    ):
+        """Gets a topology of a file, from the cache if present, otherwise by reading it and caching it.
+
+        Args:
+            file_path (str): The UGrid file.
+            topology (str): The kind of topology ("network1d", "mesh1d", "mesh2d" or "contacts").
+            topology_id (int): The index of the topology in the file.
+            reader (Callable): Reads the topology on a miss, a new UGrid opened for reading when not given.
+
+        Returns:
+            The topology, a UGridNetwork1D, UGridMesh1D, UGridMesh2D or UGridContacts, with read-only arrays.
+        """
+        key = _file_identity(file_path, topology, topology_id)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return _shallow_copy(entry[0])
+            self.misses += 1
+
+        # Read outside of the lock, so that reads of other files are not serialized
+        if reader is None:
+            with UGrid(str(file_path), "r") as ug:
+                value = getattr(ug, f"{topology}_get")(topology_id)
+        else:
+            value = reader()
+        num_bytes = 0
+        for attribute in vars(value).values():
+            if isinstance(attribute, np.ndarray):
+                attribute.setflags(write=False)
+                num_bytes += attribute.nbytes
+
+        with self.__lock:
+            if key not in self.__entries and num_bytes <= self.max_bytes:
+                self.__entries[key] = (value, num_bytes)
+                self.__num_bytes += num_bytes
+                while self.__num_bytes > self.max_bytes:
+                    _, (_, evicted_bytes) = self.__entries.popitem(last=False)
+                    self.__num_bytes -= evicted_bytes
+                    self.evictions += 1
+        return _shallow_copy(value)
+
+    def invalidate(self, file_path=None) -> int:
+        """Removes the entries of a file, whatever its size and modification time, or all the entries.
+
+        Args:
+            file_path (str): The file whose entries are removed, all the entries are removed when not given.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self.__lock:
+            if file_path is None:
+                removed = list(self.__entries)
+            else:
+                path = str(Path(file_path).resolve())
+                removed = [key for key in self.__entries if key[0] == path]
+            for key in removed:
+                _, num_bytes = self.__entries.pop(key)
+                self.__num_bytes -= num_bytes
+        return len(removed)
+
+
+_default_topology_cache = None
+_default_topology_cache_lock = threading.Lock()
+
+
+def default_topology_cache() -> TopologyCache:
+    """Gets the TopologyCache shared by the whole process, created when first needed with DEFAULT_CACHE_BYTES.
+
+    Returns:
+        TopologyCache: The shared cache.
+    """
+    global _default_topology_cache
+    with _default_topology_cache_lock:
+        if _default_topology_cache is None:
+            _default_topology_cache = TopologyCache()
+    return _default_topology_cache
+
+
+def _file_identity(file_path, topology: str, topology_id: int) -> Tuple:
+    """Identifies a topology of a file by the absolute path, size and modification time of the file."""
+    if topology not in TOPOLOGY_TYPES:
+        raise InputError(
+            f"Unsupported topology: {topology}. Use one of {tuple(TOPOLOGY_TYPES)}."
+        )
+    path = Path(file_path).resolve()
+    status = path.stat()
+    return str(path), status.st_size, status.st_mtime_ns, topology, int(topology_id)
+
+
+def _shallow_copy(topology):
+    """Creates a new topology object sharing the arrays of another, with copies of its lists."""
+    copy = type(topology).__new__(type(topology))
+    vars(copy).update(
+        {
+            name: list(value) if isinstance(value, list) else value
+            for name, value in vars(topology).items()
+        }
+    )
+    return copy
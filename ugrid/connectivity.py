@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridMesh2D
+from ugrid.utils import valid_index_mask
+
+
+class FaceNodesCSR:
+    """Compressed sparse row (ragged) representation of the face nodes connectivity.
+
+    The nodes of face `i` are `indices[offsets[i]:offsets[i + 1]]`, in the same order as in the padded array.
+    Index values keep the start index of the mesh they come from.
+
+    Attributes:
+        offsets (ndarray): The position of the first node of each face in `indices`, with num_faces + 1 entries.
+        indices (ndarray): The nodes of all faces, stored one face after the other.
+        start_index (int): The start index used in `indices`.
+        int_fill_value (int): The fill value used when converting back to the padded form.
+    """
+
+    def __init__(self, offsets, indices, start_index=0, int_fill_value=-999):
+        self.offsets: np.ndarray = offsets
+        self.indices: np.ndarray = indices
+        self.start_index: int = start_index
+        self.int_fill_value: int = int_fill_value
+
+    @property
+    def num_faces(self) -> int:
+        """The number of faces."""
+        return self.offsets.size - 1
+
+    @property
+    def nodes_per_face(self) -> np.ndarray:
+        """The number of nodes of each face."""
+        return np.diff(self.offsets)
+
+    @property
+    def is_uniform(self) -> bool:
+        """True if all faces have the same number of nodes."""
+        counts = self.nodes_per_face
+        return counts.size == 0 or bool(np.all(counts == counts[0]))
+
+    @staticmethod
+    def from_padded(
+        face_nodes: np.ndarray,
+        num_face_nodes_max: int,
+        start_index: int = 0,
+        int_fill_value: int = -999,
+        out_offsets: np.ndarray = None,
+        out_indices: np.ndarray = None,
+    ) -> FaceNodesCSR:
+        """Creates the ragged representation from a padded face nodes array.
+
+        The valid nodes of each face must precede its fill values, as prescribed by the UGRID conventions.
+        If no face is padded, `indices` is a view of `face_nodes` and no index data is copied.
+        Otherwise the result is written in `out_offsets` and `out_indices` when provided,
+        which allows reusing buffers across calls.
+
+        Args:
+            face_nodes (ndarray): The flat padded face nodes, with num_faces * num_face_nodes_max entries.
+            num_face_nodes_max (int): The maximum number of face nodes.
+            start_index (int): The start index used in `face_nodes`.
+            int_fill_value (int): The fill value used in `face_nodes`.
+            out_offsets (ndarray): Optional buffer with num_faces + 1 entries for the offsets.
+            out_indices (ndarray): Optional buffer for the indices, at least as large as the number of valid nodes.
+
+        Returns:
+            FaceNodesCSR: The ragged face nodes.
+        """
+        padded = face_nodes.reshape(-1, num_face_nodes_max)
+        num_faces = padded.shape[0]
+
+        offsets = out_offsets
+        if offsets is None:
+            offsets = np.empty(num_faces + 1, dtype=np.int64)
+        elif offsets.size != num_faces + 1:
+            raise InputError("out_offsets must have num_faces + 1 entries")
+
+        valid = valid_index_mask(padded, start_index, int_fill_value)
+        offsets[0] = 0
+        np.sum(valid, axis=1, out=offsets[1:])
+        np.cumsum(offsets[1:], out=offsets[1:])
+        num_indices = int(offsets[-1])
+
+        if num_indices == padded.size:
+            indices = padded.reshape(-1)
+        else:
+            if out_indices is None:
+                out_indices = np.empty(num_indices, dtype=face_nodes.dtype)
+            elif out_indices.size < num_indices:
+                raise InputError("out_indices is too small for the valid face nodes")
+            indices = out_indices[:num_indices]
+            np.compress(valid.reshape(-1), face_nodes, out=indices)
+
+        return FaceNodesCSR(offsets, indices, start_index, int_fill_value)
+
+    @staticmethod
+    def from_mesh2d(mesh2d: UGridMesh2D) -> FaceNodesCSR:
+        """Creates the ragged representation of the face nodes of a mesh2d.
+
+        Args:
+            mesh2d (UGridMesh2D): The mesh2d.
+
+        Returns:
+            FaceNodesCSR: The ragged face nodes.
+        """
+        face_nodes = mesh2d.face_nodes
+        if face_nodes.size == 0:
+            face_nodes = face_nodes.astype(np.int32)
+        return FaceNodesCSR.from_padded(
+            face_nodes,
+            mesh2d.num_face_nodes_max,
+            mesh2d.start_index,
+            mesh2d.int_fill_value,
+        )
+
+    def to_padded(
+        self, num_face_nodes_max: int = None, out: np.ndarray = None
+    ) -> np.ndarray:
+        """Converts back to the flat padded face nodes array.
+
+        If all faces have `num_face_nodes_max` nodes, the result is a view of `indices`.
+        Otherwise the result is written in `out` when provided.
+
+        Args:
+            num_face_nodes_max (int): The width of the padded array, by default the largest face size.
+            out (ndarray): Optional flat buffer with num_faces * num_face_nodes_max entries.
+
+        Returns:
+            ndarray: The flat padded face nodes, filled with `int_fill_value`.
+        """
+        counts = self.nodes_per_face
+        largest = int(counts.max()) if counts.size > 0 else 0
+        if num_face_nodes_max is None:
+            num_face_nodes_max = largest
+        elif num_face_nodes_max < largest:
+            raise InputError("num_face_nodes_max is smaller than the largest face")
+
+        if self.indices.size == self.num_faces * num_face_nodes_max:
+            return self.indices
+
+        if out is None:
+            out = np.empty(
+                self.num_faces * num_face_nodes_max, dtype=self.indices.dtype
+            )
+        elif out.size != self.num_faces * num_face_nodes_max:
+            raise InputError("out must have num_faces * num_face_nodes_max entries")
+
+        padded = out.reshape(-1, num_face_nodes_max)
+        padded.fill(self.int_fill_value)
+        padded[np.arange(num_face_nodes_max) < counts[:, np.newaxis]] = self.indices
+        return out
+
+    def face_of_index(self) -> np.ndarray:
+        """Gets the face owning each entry of `indices`.
+
+        Returns:
+            ndarray: The zero-based face index of every entry of `indices`.
+        """
+        return np.repeat(np.arange(self.num_faces), self.nodes_per_face)
+
+    def next_position(self) -> np.ndarray:
+        """Gets, for each entry of `indices`, the position of the following node of the same face.
+        The last node of a face is followed by its first node.
+
+        Returns:
+            ndarray: The positions in `indices` of the next node around each face.
+        """
+        following = np.arange(1, self.indices.size + 1)
+        counts = self.nodes_per_face
+        closed = counts > 0
+        following[self.offsets[1:][closed] - 1] = self.offsets[:-1][closed]
+        return following
+
+    def face_area(self, node_x: np.ndarray, node_y: np.ndarray) -> np.ndarray:
+        """Computes the signed area of every face, positive for counterclockwise faces.
+
+        Args:
+            node_x (ndarray): The x-coordinates of the nodes.
+            node_y (ndarray): The y-coordinates of the nodes.
+
+        Returns:
+            ndarray: The signed face areas.
+        """
+        x, y, x_next, y_next = self.__ring_coordinates(node_x, node_y)
+        return 0.5 * self.__sum_per_face(x * y_next - x_next * y)
+
+    def face_centroid(
+        self, node_x: np.ndarray, node_y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes the centroid of every face. Degenerate faces get the mean of their nodes.
+
+        Args:
+            node_x (ndarray): The x-coordinates of the nodes.
+            node_y (ndarray): The y-coordinates of the nodes.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The x and y coordinates of the face centroids.
+        """
+        x, y, x_next, y_next = self.__ring_coordinates(node_x, node_y)
+
+        # Work relative to the first node of each face to limit round-off errors
+        non_empty = self.nodes_per_face > 0
+        origin_x = np.zeros(self.num_faces)
+        origin_y = np.zeros(self.num_faces)
+        origin_x[non_empty] = x[self.offsets[:-1][non_empty]]
+        origin_y[non_empty] = y[self.offsets[:-1][non_empty]]
+        face = self.face_of_index()
+        x = x - origin_x[face]
+        y = y - origin_y[face]
+        x_next = x_next - origin_x[face]
+        y_next = y_next - origin_y[face]
+
+        cross = x * y_next - x_next * y
+        area = 0.5 * self.__sum_per_face(cross)
+        counts = np.maximum(self.nodes_per_face, 1)
+        degenerate = np.abs(area) <= np.finfo(np.double).eps * (
+            self.__sum_per_face(np.abs(cross)) + np.finfo(np.double).tiny
+        )
+        safe_area = np.where(degenerate, 1.0, area)
+
+        centroid_x = np.where(
+            degenerate,
+            self.__sum_per_face(x) / counts,
+            self.__sum_per_face((x + x_next) * cross) / (6.0 * safe_area),
+        )
+        centroid_y = np.where(
+            degenerate,
+            self.__sum_per_face(y) / counts,
+            self.__sum_per_face((y + y_next) * cross) / (6.0 * safe_area),
+        )
+        return centroid_x + origin_x, centroid_y + origin_y
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Derives the unique edges of the faces.
+
+        Returns:
+            Tuple[ndarray, ndarray, ndarray]:
+                The zero-based edge nodes with shape (num_edges, 2),
+                the zero-based edge faces with shape (num_edges, 2), using -1 where an edge has a single face,
+                and the zero-based edge following each entry of `indices` (the face edges in ragged form).
+        """
+        first = self.indices.astype(np.int64) - self.start_index
+        second = first[self.next_position()]
+        low = np.minimum(first, second)
+        high = np.maximum(first, second)
+        num_nodes = int(high.max()) + 1 if high.size > 0 else 0
+
+        key = low * num_nodes + high
+        unique_keys, face_edges = np.unique(key, return_inverse=True)
+        face_edges = face_edges.reshape(-1)
+        edge_nodes = np.stack(np.divmod(unique_keys, max(num_nodes, 1)), axis=1)
+
+        # The first and last face seen for every edge are its two neighbours
+        face = self.face_of_index()
+        num_edges = unique_keys.size
+        edge_faces = np.full((num_edges, 2), -1, dtype=np.int64)
+        order = np.argsort(face_edges, kind="stable")
+        sorted_edges = face_edges[order]
+        is_first = np.ones(order.size, dtype=bool)
+        is_first[1:] = sorted_edges[1:] != sorted_edges[:-1]
+        is_last = np.ones(order.size, dtype=bool)
+        is_last[:-1] = is_first[1:]
+        edge_faces[sorted_edges[is_first], 0] = face[order[is_first]]
+        second_face = is_last & ~is_first
+        edge_faces[sorted_edges[second_face], 1] = face[order[second_face]]
+
+        return edge_nodes, edge_faces, face_edges
+
+    def __ring_coordinates(self, node_x, node_y):
+        nodes = self.indices - self.start_index
+        following = nodes[self.next_position()]
+        return node_x[nodes], node_y[nodes], node_x[following], node_y[following]
+
+    def __sum_per_face(self, values: np.ndarray) -> np.ndarray:
+        """Sums values stored per entry of `indices` over every face, empty faces sum to zero."""
+        result = np.zeros(self.num_faces, dtype=values.dtype)
+        non_empty = self.nodes_per_face > 0
+        if values.size > 0:
+            result[non_empty] = np.add.reduceat(values, self.offsets[:-1][non_empty])
+        return result
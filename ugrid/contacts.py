@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from ugrid.connectivity import FaceNodesCSR
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridContacts, UGridMesh1D, UGridMesh2D
+from ugrid.utils import face_vertex_coordinates, hilbert_index, points_in_polygons
+
+SIDES = ("from", "to")
+CONTACT_METHODS = ("containing", "nearest")
+
+
+class ContactIndex:
+    """Compressed sparse row indexes of the contacts, by the entity at either side of the contacts.
+
+    The "from" side refers to the entities at `mesh_from_location` of the mesh `mesh_from_name`,
+    the "to" side to the entities at `mesh_to_location` of the mesh `mesh_to_name`.
+    The contacts of entity `i` on a side are `contacts[offsets[i]:offsets[i + 1]]`.
+    Each index is built when first needed and cached.
+
+    Attributes:
+        contacts (UGridContacts): The indexed contacts.
+        edges (ndarray): The zero-based from and to entity of every contact, with shape (num_contacts, 2).
+    """
+
+    def __init__(
+        self,
+        contacts: UGridContacts,
+        num_from_entities: int = None,
+        num_to_entities: int = None,
+    ):
+        self.contacts: UGridContacts = contacts
+        self.edges: np.ndarray = np.asarray(contacts.edges, dtype=np.int64).reshape(
+            -1, 2
+        )
+        if self.edges.size > 0 and self.edges.min() < 0:
+            raise InputError("Contacts must refer to non negative entity indices")
+        self.__num_entities = {}
+        self.__indexes = {}
+        for column, (side, count) in enumerate(
+            zip(SIDES, (num_from_entities, num_to_entities))
+        ):
+            largest = int(self.edges[:, column].max(initial=-1)) + 1
+            if count is not None and count < largest:
+                raise InputError(f"Contacts refer to {side} entities beyond {count}")
+            self.__num_entities[side] = largest if count is None else count
+
+    @property
+    def num_contacts(self) -> int:
+        """The number of contacts."""
+        return self.edges.shape[0]
+
+    def num_entities(self, side: str) -> int:
+        """Gets the number of entities on a side of the contacts.
+
+        Args:
+            side (str): The side of the contacts ("from" or "to").
+
+        Returns:
+            int: The number of entities.
+        """
+        self.__check_side(side)
+        return self.__num_entities[side]
+
+    def index(self, side: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the index of the contacts by their entity on one side.
+
+        Args:
+            side (str): The side of the contacts ("from" or "to").
+
+        Returns:
+            Tuple[ndarray, ndarray]: The offsets, with num_entities + 1 entries, and the contacts sorted by entity.
+        """
+        self.__check_side(side)
+        if side not in self.__indexes:
+            entities = self.edges[:, SIDES.index(side)]
+            contacts = np.argsort(entities, kind="stable")
+            offsets = np.zeros(self.__num_entities[side] + 1, dtype=np.int64)
+            np.cumsum(
+                np.bincount(entities, minlength=self.__num_entities[side]),
+                out=offsets[1:],
+            )
+            self.__indexes[side] = offsets, contacts
+        return self.__indexes[side]
+
+    def contacts_of(self, entities, side: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the contacts of many entities at once.
+
+        Args:
+            entities (ndarray): The zero-based entities.
+            side (str): The side of the contacts the entities are on ("from" or "to").
+
+        Returns:
+            Tuple[ndarray, ndarray]: The offsets into the contacts of each requested entity and the contacts.
+        """
+        offsets, contacts = self.index(side)
+        entities = np.asarray(entities, dtype=np.int64)
+        if entities.size > 0 and (
+            entities.min() < 0 or entities.max() >= offsets.size - 1
+        ):
+            raise InputError(f"Entities must lie in [0, {offsets.size - 1})")
+        counts = offsets[entities + 1] - offsets[entities]
+        result_offsets = np.zeros(entities.size + 1, dtype=np.int64)
+        np.cumsum(counts, out=result_offsets[1:])
+        positions = np.repeat(offsets[entities] - result_offsets[:-1], counts)
+        positions += np.arange(positions.size)
+        return result_offsets, contacts[positions]
+
+    def linked(self, entities, side: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the entities on the other side of the contacts of many entities at once,
+        such as all the mesh2d faces linked to some mesh1d nodes.
+
+        Args:
+            entities (ndarray): The zero-based entities.
+            side (str): The side of the contacts the entities are on ("from" or "to").
+
+        Returns:
+            Tuple[ndarray, ndarray]: The offsets into the linked entities of each requested entity and the linked entities.
+        """
+        offsets, contacts = self.contacts_of(entities, side)
+        return offsets, self.edges[contacts, 1 - SIDES.index(side)]
+
+    def reduce(
+        self, values: np.ndarray, side: str, ufunc=np.add, fill_value=0
+    ) -> np.ndarray:
+        """Reduces values defined on the contacts over the contacts of every entity on one side.
+
+        Args:
+            values (ndarray): The values, with the contacts along the last axis.
+            side (str): The side of the contacts to reduce to ("from" or "to").
+            ufunc (numpy.ufunc): The reduction, such as np.add or np.maximum.
+            fill_value: The value of the entities without contacts.
+
+        Returns:
+            ndarray: The reduced values, with the entities of `side` along the last axis.
+        """
+        values = np.asarray(values)
+        if values.ndim == 0 or values.shape[-1] != self.num_contacts:
+            raise InputError(
+                f"The last axis of the values must have one entry per contact ({self.num_contacts})"
+            )
+        offsets, contacts = self.index(side)
+        return self.__reduce_sorted(
+            np.take(values, contacts, axis=-1), offsets, ufunc, fill_value
+        )
+
+    def transfer(
+        self, values: np.ndarray, source: str, ufunc=np.add, fill_value=0
+    ) -> np.ndarray:
+        """Transfers values defined on the entities of one side to the entities of the other side.
+        Each contact carries the value of its source entity, which are then reduced per target entity,
+        such as summing the mesh2d face fluxes over the contacts of every mesh1d node.
+
+        Args:
+            values (ndarray): The values, with the entities of `source` along the last axis.
+            source (str): The side of the contacts the values are defined on ("from" or "to").
+            ufunc (numpy.ufunc): The reduction, such as np.add or np.maximum.
+            fill_value: The value of the target entities without contacts.
+
+        Returns:
+            ndarray: The values on the entities of the other side, along the last axis.
+        """
+        self.__check_side(source)
+        values = np.asarray(values)
+        if values.ndim == 0 or values.shape[-1] != self.__num_entities[source]:
+            raise InputError(
+                f"The last axis of the values must have one entry per {source} entity"
+            )
+        column = SIDES.index(source)
+        offsets, contacts = self.index(SIDES[1 - column])
+        # Gather the source values directly in the order of the target index
+        sorted_values = np.take(values, self.edges[contacts, column], axis=-1)
+        return self.__reduce_sorted(sorted_values, offsets, ufunc, fill_value)
+
+    @staticmethod
+    def __reduce_sorted(sorted_values, offsets, ufunc, fill_value) -> np.ndarray:
+        """Reduces values sorted by entity over the contacts of every entity, with a single reduceat."""
+        result = np.full(
+            sorted_values.shape[:-1] + (offsets.size - 1,),
+            fill_value,
+            dtype=np.result_type(sorted_values, np.min_scalar_type(fill_value)),
+        )
+        non_empty = offsets[1:] > offsets[:-1]
+        if sorted_values.shape[-1] > 0:
+            result[..., non_empty] = ufunc.reduceat(
+                sorted_values, offsets[:-1][non_empty], axis=-1
+            )
+        return result
+
+    @staticmethod
+    def __check_side(side: str) -> None:
+        if side not in SIDES:
+            raise InputError(f"Unsupported side: {side}. Use one of {SIDES}.")
+
+
+def generate_contacts(
+    mesh1d: UGridMesh1D,
+    mesh2d: UGridMesh2D,
+    method: str = "containing",
+    max_distance: float = np.inf,
+    polygon: Tuple[np.ndarray, np.ndarray] = None,
+    name: str = "contacts",
+    contact_type: int = 3,
+    mesh_from_location: int = 0,
+    mesh_to_location: int = 0,
+) -> UGridContacts:
+    """Generates contacts from the mesh1d nodes to the mesh2d faces.
+
+    With `method="containing"` every mesh1d node is connected to the face containing it.
+    With `method="nearest"` every mesh1d node is connected to the face with the nearest center.
+    In both cases nodes farther than `max_distance` from the face center, or outside `polygon`, get no contact.
+    The faces are searched with a k-d tree on their centers, all nodes at once.
+    The mesh1d node coordinates are required, see `fill_mesh1d_coordinates`.
+
+    Args:
+        mesh1d (UGridMesh1D): The mesh1d, with node_x and node_y.
+        mesh2d (UGridMesh2D): The mesh2d.
+        method (str): The method ("containing" or "nearest").
+        max_distance (float): The largest distance between a mesh1d node and the center of its face.
+        polygon (Tuple[ndarray, ndarray]): The x and y coordinates of a polygon limiting the mesh1d nodes to connect.
+        name (str): The name of the contacts.
+        contact_type (int): The type of all contacts.
+        mesh_from_location (int): The location of the mesh1d nodes, see `UGrid.entity_get_node_location_enum`.
+        mesh_to_location (int): The location of the mesh2d faces, see `UGrid.entity_get_face_location_enum`.
+
+    Returns:
+        UGridContacts: The contacts, from the zero-based mesh1d nodes to the zero-based mesh2d faces.
+    """
+    if method not in CONTACT_METHODS:
+        raise InputError(
+            f"Unsupported contact method: {method}. Use one of {CONTACT_METHODS}."
+        )
+    num_nodes = mesh1d.node_edge_id.size
+    if mesh1d.node_x.size != num_nodes or mesh1d.node_y.size != num_nodes:
+        raise InputError("The mesh1d node coordinates are required")
+
+    node_x = np.asarray(mesh1d.node_x, dtype=np.double)
+    node_y = np.asarray(mesh1d.node_y, dtype=np.double)
+    nodes = np.arange(num_nodes)
+    if polygon is not None:
+        polygon_x = np.asarray(polygon[0], dtype=np.double)[np.newaxis, :]
+        polygon_y = np.asarray(polygon[1], dtype=np.double)[np.newaxis, :]
+        nodes = nodes[
+            points_in_polygons(
+                node_x,
+                node_y,
+                np.zeros(num_nodes, dtype=np.int64),
+                polygon_x,
+                polygon_y,
+            )
+        ]
+
+    num_faces = mesh2d.face_nodes.size // mesh2d.num_face_nodes_max
+    if mesh2d.face_x.size == num_faces and mesh2d.face_y.size == num_faces:
+        face_x, face_y = mesh2d.face_x, mesh2d.face_y
+    else:
+        face_x, face_y = FaceNodesCSR.from_mesh2d(mesh2d).face_centroid(
+            mesh2d.node_x, mesh2d.node_y
+        )
+
+    faces = np.full(nodes.size, -1, dtype=np.int64)
+    if num_faces > 0 and nodes.size > 0:
+        tree = cKDTree(np.column_stack([face_x, face_y]))
+        # Nodes close along a Hilbert curve visit the same branches of the tree
+        order = np.argsort(hilbert_index(node_x[nodes], node_y[nodes]))
+        points = np.column_stack([node_x[nodes[order]], node_y[nodes[order]]])
+        if method == "nearest":
+            distance, nearest = tree.query(points, distance_upper_bound=max_distance)
+            faces[order] = np.where(np.isfinite(distance), nearest, -1)
+        else:
+            faces[order] = _containing_faces(mesh2d, tree, points, max_distance)
+
+    found = faces >= 0
+    edges = np.column_stack([nodes[found], faces[found]]).astype(np.int32)
+    names = [f"{node}_{face}" for node, face in edges.tolist()]
+    return UGridContacts(
+        name=name,
+        edges=edges.ravel(),
+        mesh_from_name=mesh1d.name,
+        mesh_to_name=mesh2d.name,
+        contact_type=np.full(edges.shape[0], contact_type, dtype=np.int32),
+        contact_name_id=names,
+        contact_name_long=list(names),
+        mesh_from_location=mesh_from_location,
+        mesh_to_location=mesh_to_location,
+    )
+
+
+def _containing_faces(
+    mesh2d: UGridMesh2D, tree: cKDTree, points: np.ndarray, max_distance: float
+) -> np.ndarray:
+    """Finds the face containing every point, testing more and more of the faces with the nearest centers.
+
+    A face only contains points within the distance of its farthest vertex from its center, so the search of
+    a point stops at the largest of these radii: points outside the mesh2d only test the faces around them.
+    Every round only tests the candidates found beyond those of the previous rounds.
+    """
+    _, vertex_x, vertex_y, _ = face_vertex_coordinates(mesh2d)
+    num_faces = vertex_x.shape[0]
+    radius = np.sqrt(
+        np.max(
+            (vertex_x - tree.data[:, :1]) ** 2 + (vertex_y - tree.data[:, 1:]) ** 2,
+            axis=1,
+        )
+    )
+    # Keep the points on the farthest vertices within reach despite rounding
+    radius *= 1.0 + 1e-9
+    reach = min(max_distance, radius.max())
+
+    faces = np.full(points.shape[0], -1, dtype=np.int64)
+    in_bounds = (
+        (points[:, 0] >= vertex_x.min())
+        & (points[:, 0] <= vertex_x.max())
+        & (points[:, 1] >= vertex_y.min())
+        & (points[:, 1] <= vertex_y.max())
+    )
+    unresolved = np.flatnonzero(in_bounds)
+    num_tested = 0
+    num_candidates = 4
+    while unresolved.size > 0:
+        k = min(num_candidates, num_faces)
+        distance, candidates = tree.query(
+            points[unresolved], k=k, distance_upper_bound=reach
+        )
+        distance = distance.reshape(unresolved.size, k)[:, num_tested:]
+        candidates = candidates.reshape(unresolved.size, k)[:, num_tested:]
+        valid = np.isfinite(distance)
+        candidates = np.where(valid, candidates, 0)
+        width = k - num_tested
+        x = np.repeat(points[unresolved, 0], width)
+        y = np.repeat(points[unresolved, 1], width)
+        inside = (valid & (distance <= radius[candidates])).ravel()
+        inside[inside] = points_in_polygons(
+            x[inside], y[inside], candidates.ravel()[inside], vertex_x, vertex_y
+        )
+        inside = inside.reshape(unresolved.size, width)
+        resolved = inside.any(axis=1)
+        faces[unresolved[resolved]] = candidates[
+            resolved, inside[resolved].argmax(axis=1)
+        ]
+
+        # Stop for the points with no face left within reach
+        exhausted = ~valid[:, -1] | (k == num_faces)
+        unresolved = unresolved[~resolved & ~exhausted]
+        num_tested = k
+        num_candidates *= 4
+    return faces
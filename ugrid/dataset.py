@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from ugrid.errors import InputError
+from ugrid.fingerprint import fingerprint
+from ugrid.ugrid import UGrid
+
+TOPOLOGIES = ("network1d", "mesh1d", "mesh2d", "contacts")
+
+
+class MultiFileDataset:
+    """A virtual dataset over model output split in time chunks, one file per chunk, sharing the same topology.
+
+    The files are opened once on construction to read their times and their topology.
+    The topologies must have the same fingerprint, only the one of the first file given is kept.
+    Data variables are read with time as their first dimension and concatenated along time.
+    Reads only open the files whose times overlap the requested time range.
+
+    Attributes:
+        file_paths (List[str]): The files, sorted by their first time.
+        topology (object): The topology shared by the files, read from the first file of `file_paths` as given.
+        time_variable (str): The name of the time variable.
+    """
+
+    def __init__(
+        self,
+        file_paths,
+        topology: str = "mesh2d",
+        topology_id: int = 0,
+        time_variable: str = "time",
+        check_topology: bool = True,
+    ):
+        """Constructor of MultiFileDataset
+
+        Args:
+            file_paths (List[str]): The files of the time chunks, in any order.
+            topology (str): The kind of topology shared by the files ("network1d", "mesh1d", "mesh2d" or "contacts").
+            topology_id (int): The index of the topology in every file.
+            time_variable (str): The name of the time variable.
+            check_topology (bool): Whether to read the topology of every file and compare its fingerprint,
+                instead of only reading the topology of the first file.
+
+        Raises:
+            InputError: If the topologies do not match or the times of the files overlap.
+        """
+        if topology not in TOPOLOGIES:
+            raise InputError(
+                f"Unsupported topology: {topology}. Use one of {TOPOLOGIES}."
+            )
+        file_paths = [str(file_path) for file_path in file_paths]
+        if len(file_paths) == 0:
+            raise InputError("A dataset needs at least one file")
+
+        self.time_variable: str = time_variable
+        self.topology: object = None
+        reference = None
+        file_times = []
+        for position, file_path in enumerate(file_paths):
+            with UGrid(file_path, "r") as ug:
+                times = np.asarray(
+                    ug.variable_get_data_double(time_variable), dtype=np.double
+                )
+                if position == 0:
+                    self.topology = getattr(ug, f"{topology}_get")(topology_id)
+                    if check_topology:
+                        reference = fingerprint(self.topology)
+                elif check_topology:
+                    # Only the fingerprint of the other topologies is kept, not the topologies themselves
+                    other = getattr(ug, f"{topology}_get")(topology_id)
+                    if fingerprint(other) != reference:
+                        raise InputError(
+                            f"The {topology} of {file_path} does not match the one of {file_paths[0]}"
+                        )
+            if times.size == 0:
+                raise InputError(f"{file_path} has no times")
+            if np.any(np.diff(times) <= 0.0):
+                raise InputError(f"The times of {file_path} are not increasing")
+            file_times.append(times)
+
+        first = np.array([times[0] for times in file_times])
+        order = np.argsort(first, kind="stable")
+        self.file_paths: List[str] = [file_paths[i] for i in order]
+        self.__file_times: List[np.ndarray] = [file_times[i] for i in order]
+        self.__first = first[order]
+        self.__last = np.array([times[-1] for times in self.__file_times])
+        overlapping = np.flatnonzero(self.__first[1:] <= self.__last[:-1])
+        if overlapping.size > 0:
+            i = overlapping[0]
+            raise InputError(
+                f"The times of {self.file_paths[i]} and {self.file_paths[i + 1]} overlap"
+            )
+        self.__times = None
+
+    @property
+    def num_files(self) -> int:
+        """The number of files."""
+        return len(self.file_paths)
+
+    @property
+    def times(self) -> np.ndarray:
+        """The times of all files, concatenated."""
+        if self.__times is None:
+            self.__times = np.concatenate(self.__file_times)
+        return self.__times
+
+    def file_times(self, index: int) -> np.ndarray:
+        """Gets the times of a file.
+
+        Args:
+            index (int): The zero-based index of the file in `file_paths`.
+
+        Returns:
+            ndarray: The times of the file.
+        """
+        return self.__file_times[index]
+
+    def files_in_range(
+        self, time_start: float = None, time_end: float = None
+    ) -> np.ndarray:
+        """Finds the files with at least one time in a time range.
+
+        Args:
+            time_start (float): The first time of the range, unbounded when not given.
+            time_end (float): The last time of the range, included, unbounded when not given.
+
+        Returns:
+            ndarray: The sorted zero-based indices of the files in `file_paths`.
+        """
+        time_start, time_end = _bounds(time_start, time_end)
+        # The files are sorted and do not overlap, so their first and last times are both sorted
+        begin = np.searchsorted(self.__last, time_start, side="left")
+        end = np.searchsorted(self.__first, time_end, side="right")
+        files = np.arange(begin, max(begin, end))
+        # Files in the range may still have no time in it, when the range falls between two times
+        return np.array(
+            [
+                i
+                for i in files
+                if np.any(
+                    (self.__file_times[i] >= time_start)
+                    & (self.__file_times[i] <= time_end)
+                )
+            ],
+            dtype=np.int64,
+        )
+
+    def get(
+        self, variable_name: str, time_start: float = None, time_end: float = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Reads a data variable over a time range, from the files overlapping the range only.
+
+        Args:
+            variable_name (str): The name of a data variable with time as its first dimension.
+            time_start (float): The first time to read, from the first time when not given.
+            time_end (float): The last time to read, included, up to the last time when not given.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The times read and the data, with shape (num_times, ...).
+
+        Raises:
+            InputError: If time is not the first dimension of the variable or its shape changes between files.
+        """
+        time_start, time_end = _bounds(time_start, time_end)
+        files = self.files_in_range(time_start, time_end)
+        if files.size == 0:
+            # The shape of an empty result still comes from the variable, without reading its data
+            with UGrid(self.file_paths[0], "r") as ug:
+                dimensions = ug.variable_get_dimensions(variable_name)
+            shape = tuple(int(d) for d in dimensions[1:])
+            return np.empty(0), np.empty((0,) + shape)
+
+        times = []
+        blocks = []
+        for i in files:
+            data = self.__read(i, variable_name)
+            if blocks and data.shape[1:] != blocks[0].shape[1:]:
+                raise InputError(
+                    f"The shape of {variable_name} in {self.file_paths[i]} does not match the other files"
+                )
+            selected = (self.__file_times[i] >= time_start) & (
+                self.__file_times[i] <= time_end
+            )
+            times.append(self.__file_times[i][selected])
+            blocks.append(data if selected.all() else data[selected])
+        return np.concatenate(times), np.concatenate(blocks)
+
+    def __read(self, index: int, variable_name: str) -> np.ndarray:
+        """Reads a data variable of a file, shaped with its dimensions."""
+        file_path = self.file_paths[index]
+        with UGrid(file_path, "r") as ug:
+            dimensions = tuple(
+                int(d) for d in ug.variable_get_dimensions(variable_name)
+            )
+            data = ug.variable_get_data_double(variable_name)
+        if len(dimensions) == 0 or dimensions[0] != self.__file_times[index].size:
+            raise InputError(
+                f"Time is not the first dimension of {variable_name} in {file_path}"
+            )
+        return data.reshape(dimensions)
+
+
+def read_many(
+    file_paths, variables=(), topologies=(), max_workers: int = 1
+) -> List[Dict[object, object]]:
+    """Reads the same variables and topologies from many files, optionally with the files read concurrently
+    by a thread pool.
+
+    By default, the files are read one after the other in the calling thread, without a pool.
+    Concurrency is opt-in with `max_workers` other than 1: every file is then opened by its own UGrid,
+    used by a single worker from opening to closing, so no UGrid is shared between threads. The native calls
+    release the GIL, so reads of different files overlap as far as the netCDF and HDF5 builds linked to the
+    UGrid library allow. The UGrid library keeps a single last error for the whole process, so when reads
+    fail concurrently, the message of an error may be the one of another file.
+
+    Args:
+        file_paths (List[str]): The files to read.
+        variables (List[str]): The names of the data variables to read, as flat arrays of double.
+        topologies (list): The topologies to read, as names ("network1d", "mesh1d", "mesh2d" or "contacts")
+            for the first topology of a kind, or as (name, topology_id) pairs.
+        max_workers (int): The number of threads, 1 to read without a pool, or None to let ThreadPoolExecutor choose.
+
+    Returns:
+        List[dict]: For every file, in the order of `file_paths`, the data and topologies keyed as requested.
+
+    Raises:
+        InputError: If a topology name is not supported. Errors raised by a read are raised again once all
+            the workers are done.
+    """
+    requested = []
+    for item in topologies:
+        name, topology_id = (item, 0) if isinstance(item, str) else item
+        if name not in TOPOLOGIES:
+            raise InputError(f"Unsupported topology: {name}. Use one of {TOPOLOGIES}.")
+        requested.append((item, name, topology_id))
+    file_paths = [str(file_path) for file_path in file_paths]
+
+    def read(file_path):
+        result = {}
+        with UGrid(file_path, "r") as ug:
+            for variable_name in variables:
+                result[variable_name] = ug.variable_get_data_double(variable_name)
+            for key, name, topology_id in requested:
+                result[key] = getattr(ug, f"{name}_get")(topology_id)
+        return result
+
+    if max_workers == 1 or len(file_paths) <= 1:
+        return [read(file_path) for file_path in file_paths]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map keeps the order of the files whatever the order in which the reads finish
+        return list(executor.map(read, file_paths))
+
+
+def _bounds(time_start, time_end) -> Tuple[float, float]:
+    """Replaces missing bounds of a time range by infinite ones."""
+    time_start = -np.inf if time_start is None else float(time_start)
+    time_end = np.inf if time_end is None else float(time_end)
+    if time_start > time_end:
+        raise InputError("time_start must not be after time_end")
+    return time_start, time_end
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ugrid.netcdf_classic import read_classic_header
+from ugrid.ugrid import UGrid
+
+LOCATIONS = ("node", "edge", "face")
+
+
+class TopologySummary:
+    """The dimensions of a topology of a file.
+
+    Attributes:
+        topology (str): The kind of topology ("network1d", "mesh1d", "mesh2d" or "contacts").
+        topology_id (int): The index of the topology among the topologies of its kind.
+        name (str): The name of the topology, taken from the "mesh" attribute of its data variables,
+            None when it has no data variables.
+        counts (dict): The entity counts from the inquiry, such as "num_nodes" or "num_faces".
+    """
+
+    def __init__(self, topology, topology_id, name, counts):
+        self.topology: str = topology
+        self.topology_id: int = topology_id
+        self.name: Optional[str] = name
+        self.counts: Dict[str, int] = counts
+
+    def __str__(self) -> str:
+        counts = ", ".join(f"{key[4:]}={value}" for key, value in self.counts.items())
+        return f"{self.topology} {self.topology_id} ({self.name or '?'}): {counts}"
+
+
+class VariableSummary:
+    """The metadata of a data variable, without its data.
+
+    Attributes:
+        name (str): The name of the variable.
+        topology (str): The kind of topology the variable is defined on.
+        topology_id (int): The index of that topology among the topologies of its kind.
+        location (str): The location of the variable ("node", "edge" or "face").
+        shape (tuple): The length of every dimension.
+        dimensions (tuple): The names of the dimensions, None when the file format is not NetCDF classic.
+        dtype (dtype): The type of the values in the file, in native byte order,
+            None when the file format is not NetCDF classic.
+        attributes (dict): The attribute values keyed by name.
+    """
+
+    def __init__(
+        self,
+        name,
+        topology,
+        topology_id,
+        location,
+        shape,
+        dimensions,
+        dtype,
+        attributes,
+    ):
+        self.name: str = name
+        self.topology: str = topology
+        self.topology_id: int = topology_id
+        self.location: str = location
+        self.shape: Tuple[int, ...] = shape
+        self.dimensions: Optional[Tuple[str, ...]] = dimensions
+        self.dtype: Optional[np.dtype] = dtype
+        self.attributes: Dict[str, str] = attributes
+
+    @property
+    def num_bytes(self) -> Optional[int]:
+        """The size of the data in the file, None when the type is unknown."""
+        if self.dtype is None:
+            return None
+        return int(np.prod(self.shape, dtype=np.int64)) * self.dtype.itemsize
+
+    def __str__(self) -> str:
+        dimensions = self.dimensions or self.shape
+        dtype = "?" if self.dtype is None else self.dtype.name
+        return f"{self.name} {dtype}{tuple(dimensions)} on {self.topology} {self.topology_id} {self.location}s"
+
+
+class FileInventory:
+    """A summary of the content of a UGrid file, gathered without reading any array data.
+
+    Attributes:
+        file_path (str): The path of the file.
+        num_bytes (int): The size of the file.
+        file_format (str): "classic", "64-bit offset" or "64-bit data" for the NetCDF classic formats,
+            "netcdf4" otherwise.
+        topologies (list): A TopologySummary per topology.
+        variables (list): A VariableSummary per data variable.
+        global_attributes (dict): The global attributes, only available for the NetCDF classic formats.
+    """
+
+    def __init__(
+        self,
+        file_path,
+        num_bytes,
+        file_format,
+        topologies,
+        variables,
+        global_attributes,
+    ):
+        self.file_path: str = file_path
+        self.num_bytes: int = num_bytes
+        self.file_format: str = file_format
+        self.topologies: List[TopologySummary] = topologies
+        self.variables: List[VariableSummary] = variables
+        self.global_attributes: Dict[str, object] = global_attributes
+
+    def __str__(self) -> str:
+        lines = [
+            f"{self.file_path} ({self.file_format}, {self.num_bytes / 1e6:.1f} MB)"
+        ]
+        lines += [f"  {topology}" for topology in self.topologies]
+        lines += [f"  {variable}" for variable in self.variables]
+        lines += [
+            f"  :{key} = {value}" for key, value in self.global_attributes.items()
+        ]
+        return "\n".join(lines)
+
+
+def inventory(file_path) -> FileInventory:
+    """Summarizes the topologies, data variables and global attributes of a UGrid file without reading array data.
+
+    Topologies are described by the counts of their inquiry calls, data variables by their dimensions and
+    attributes. For the NetCDF classic formats, the types, the dimension names and the global attributes are
+    read from the file header, which the UGrid library does not expose. The time spent does not depend on
+    the size of the arrays.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        FileInventory: The summary.
+    """
+    file_path = str(file_path)
+    header = read_classic_header(file_path)
+    topologies = []
+    variables = []
+
+    with UGrid(file_path, "r") as ug:
+        locations = {
+            "node": ug.entity_get_node_location_enum(),
+            "edge": ug.entity_get_edge_location_enum(),
+            "face": ug.entity_get_face_location_enum(),
+        }
+        kinds = {
+            "network1d": (
+                ug.topology_get_network1d_enum(),
+                ug.network1d_get_num_topologies(),
+            ),
+            "mesh1d": (ug.topology_get_mesh1d_enum(), ug.mesh1d_get_num_topologies()),
+            "mesh2d": (ug.topology_get_mesh2d_enum(), ug.mesh2d_get_num_topologies()),
+            "contacts": (
+                ug.topology_get_contacts_enum(),
+                ug.contacts_get_num_topologies(),
+            ),
+        }
+        for topology, (topology_type, num_topologies) in kinds.items():
+            for topology_id in range(num_topologies):
+                counts = ug.topology_inquire(topology, topology_id)
+                name = None
+                for location in LOCATIONS:
+                    names = ug.topology_get_data_variables(
+                        topology_id, topology_type, locations[location]
+                    )
+                    for variable_name in names:
+                        attributes = dict(
+                            zip(
+                                ug.variable_get_attributes_names(variable_name),
+                                ug.variable_get_attributes_values(variable_name),
+                            )
+                        )
+                        name = name or attributes.get("mesh")
+                        shape = tuple(
+                            int(d) for d in ug.variable_get_dimensions(variable_name)
+                        )
+                        dimensions, dtype = None, None
+                        if header is not None and variable_name in header.variables:
+                            classic = header.variables[variable_name]
+                            dimensions = classic.dimensions
+                            dtype = classic.dtype.newbyteorder("=")
+                        variables.append(
+                            VariableSummary(
+                                variable_name,
+                                topology,
+                                topology_id,
+                                location,
+                                shape,
+                                dimensions,
+                                dtype,
+                                attributes,
+                            )
+                        )
+                topologies.append(TopologySummary(topology, topology_id, name, counts))
+
+    return FileInventory(
+        file_path,
+        os.path.getsize(file_path),
+        "netcdf4" if header is None else header.file_format,
+        topologies,
+        variables,
+        {} if header is None else header.global_attributes,
+    )
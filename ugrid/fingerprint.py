@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridContacts, UGridMesh1D, UGridMesh2D, UGridNetwork1D
+
+FINGERPRINT_CHUNK_SIZE = 1 << 24
+
+
+def fingerprint(topology) -> str:
+    """Computes a stable hash of the content of a topology, to key caches of derived products.
+
+    All attributes are hashed in name order: arrays by dtype, shape and data, strings and lists of strings
+    by their characters, other values by their representation. Two topologies with the same content
+    have the same fingerprint, in any process and on any platform with the same byte order.
+    Contiguous arrays are hashed in place, by chunks, without copies.
+
+    Args:
+        topology: A UGridMesh2D, UGridMesh1D, UGridNetwork1D or UGridContacts.
+
+    Returns:
+        str: The hexadecimal BLAKE2b digest, 32 characters long.
+    """
+    if not isinstance(
+        topology, (UGridMesh2D, UGridMesh1D, UGridNetwork1D, UGridContacts)
+    ):
+        raise InputError(f"Cannot fingerprint a {type(topology).__name__}")
+
+    digest = hashlib.blake2b(digest_size=16)
+    _update(digest, type(topology).__name__)
+    for name, value in sorted(vars(topology).items()):
+        _update(digest, name)
+        _update(digest, value)
+    return digest.hexdigest()
+
+
+def _update(digest, value) -> None:
+    """Feeds a value to the digest, with a tag and a length so that consecutive values cannot be confused."""
+    if isinstance(value, np.ndarray):
+        header = f"ndarray:{value.dtype.str}:{value.shape}"
+        digest.update(f"{len(header)}:{header}".encode())
+        if not value.flags.c_contiguous:
+            value = np.ascontiguousarray(value)
+        buffer = memoryview(value.reshape(-1)).cast("B")
+        for begin in range(0, buffer.nbytes, FINGERPRINT_CHUNK_SIZE):
+            digest.update(buffer[begin : begin + FINGERPRINT_CHUNK_SIZE])
+    elif isinstance(value, str):
+        encoded = value.encode()
+        digest.update(f"str:{len(encoded)}:".encode())
+        digest.update(encoded)
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"list:{len(value)}:".encode())
+        if all(isinstance(item, str) for item in value):
+            # Names are hashed at once, their lengths separate them
+            encoded = [item.encode() for item in value]
+            _update(digest, np.array([len(item) for item in encoded], dtype="<i8"))
+            digest.update(b"".join(encoded))
+        else:
+            for item in value:
+                _update(digest, item)
+    elif isinstance(value, np.generic):
+        _update(digest, value.item())
+    else:
+        _update(digest, repr(value))
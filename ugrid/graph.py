@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components, dijkstra
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridNetwork1D
+
+DIRECTIONS = ("downstream", "upstream")
+
+
+class NetworkGraph:
+    """A weighted graph over the nodes and branches of a network1d, for routing and tracing.
+
+    Branches are directed from their first to their second node, which defines downstream.
+    The weight of a branch is its edge_length, or 1 when the network1d has no edge lengths.
+    When several branches join the same pair of nodes in the same direction, the shortest one is used for routing.
+    The sparse matrices are built when first needed and cached.
+
+    Attributes:
+        network1d (UGridNetwork1D): The network1d the graph is built for.
+        edge_nodes (ndarray): The zero-based nodes of every branch, with shape (num_branches, 2).
+        weights (ndarray): The weight of every branch.
+    """
+
+    def __init__(self, network1d: UGridNetwork1D):
+        self.network1d: UGridNetwork1D = network1d
+        self.edge_nodes: np.ndarray = (
+            network1d.edge_node.reshape(-1, 2).astype(np.int64) - network1d.start_index
+        )
+        num_edges = self.edge_nodes.shape[0]
+        if network1d.edge_length.size == num_edges:
+            self.weights: np.ndarray = np.asarray(
+                network1d.edge_length, dtype=np.double
+            )
+        else:
+            self.weights: np.ndarray = np.ones(num_edges)
+        self.__num_nodes = max(
+            network1d.node_x.size, int(self.edge_nodes.max(initial=-1)) + 1
+        )
+        self.__matrix = None
+        self.__reversed = None
+        self.__pair_keys = None
+        self.__pair_edges = None
+
+    @property
+    def num_nodes(self) -> int:
+        """The number of nodes."""
+        return self.__num_nodes
+
+    @property
+    def num_edges(self) -> int:
+        """The number of branches."""
+        return self.edge_nodes.shape[0]
+
+    @property
+    def matrix(self) -> csr_matrix:
+        """The directed weighted adjacency matrix, with shape (num_nodes, num_nodes)."""
+        if self.__matrix is None:
+            self.__build()
+        return self.__matrix
+
+    def distances(
+        self, sources, directed: bool = False, limit: float = np.inf
+    ) -> np.ndarray:
+        """Computes the shortest distances from many source nodes to all nodes at once.
+
+        Args:
+            sources (ndarray): The zero-based source nodes.
+            directed (bool): Whether to only follow the branches downstream.
+            limit (float): The largest distance to compute, farther nodes get an infinite distance.
+
+        Returns:
+            ndarray: The distances, with shape (num_sources, num_nodes).
+        """
+        sources = self.__check_nodes(sources)
+        return dijkstra(self.matrix, directed=directed, indices=sources, limit=limit)
+
+    def nearest_source(
+        self, sources, directed: bool = False, limit: float = np.inf
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds, for every node, the closest of many source nodes in a single traversal.
+
+        Args:
+            sources (ndarray): The zero-based source nodes.
+            directed (bool): Whether to only follow the branches downstream.
+            limit (float): The largest distance to search.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The distance to the closest source and that source, -1 when unreachable.
+        """
+        sources = self.__check_nodes(sources)
+        distance, _, closest = dijkstra(
+            self.matrix,
+            directed=directed,
+            indices=sources,
+            limit=limit,
+            min_only=True,
+            return_predecessors=True,
+        )
+        closest = np.where(np.isfinite(distance), closest, -1)
+        return distance, closest
+
+    def shortest_path(
+        self, source: int, target: int, directed: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes the shortest path between two nodes.
+
+        Args:
+            source (int): The zero-based start node.
+            target (int): The zero-based end node.
+            directed (bool): Whether to only follow the branches downstream.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The nodes and the branches along the path, empty if the target is unreachable.
+        """
+        self.__check_nodes([source, target])
+        _, predecessors = dijkstra(
+            self.matrix, directed=directed, indices=source, return_predecessors=True
+        )
+        if source != target and predecessors[target] < 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        nodes = [target]
+        while nodes[-1] != source:
+            nodes.append(predecessors[nodes[-1]])
+        nodes = np.array(nodes[::-1], dtype=np.int64)
+        return nodes, self.__edges_between(nodes[:-1], nodes[1:], directed)
+
+    def trace(
+        self, nodes, direction: str = "downstream", limit: float = np.inf
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Finds all the nodes and branches downstream or upstream of many nodes at once.
+
+        Args:
+            nodes (ndarray): The zero-based nodes to start from.
+            direction (str): The direction to trace ("downstream" or "upstream").
+            limit (float): The largest distance to trace.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The sorted zero-based nodes and branches reached, including the start nodes.
+        """
+        if direction not in DIRECTIONS:
+            raise InputError(
+                f"Unsupported direction: {direction}. Use one of {DIRECTIONS}."
+            )
+        nodes = self.__check_nodes(nodes)
+        matrix = self.matrix
+        if direction == "upstream":
+            if self.__reversed is None:
+                self.__reversed = self.matrix.T.tocsr()
+            matrix = self.__reversed
+        distance = dijkstra(
+            matrix, directed=True, indices=nodes, limit=limit, min_only=True
+        )
+        reached = np.isfinite(distance)
+        edges = np.flatnonzero(
+            reached[self.edge_nodes[:, 0]] & reached[self.edge_nodes[:, 1]]
+        )
+        return np.flatnonzero(reached), edges
+
+    def connected_components(self) -> Tuple[int, np.ndarray, np.ndarray]:
+        """Labels the connected parts of the network, ignoring the branch directions.
+
+        Returns:
+            Tuple[int, ndarray, ndarray]: The number of components, the component of every node and of every branch.
+        """
+        count, labels = connected_components(self.matrix, directed=False)
+        return count, labels, labels[self.edge_nodes[:, 0]]
+
+    def strahler_order(self) -> np.ndarray:
+        """Computes the Strahler order of every branch, following the branch directions.
+
+        Branches without upstream branches have order 1. Where branches join, the downstream branch gets
+        the highest upstream order, plus one if at least two upstream branches have that order.
+        The nodes are processed one topological level at a time, with array operations over each level.
+        Branches on a cycle or downstream of one get order 0.
+
+        Returns:
+            ndarray: The order of every branch.
+        """
+        num_nodes = self.num_nodes
+        sources, targets = self.edge_nodes[:, 0], self.edge_nodes[:, 1]
+        outgoing = np.argsort(sources, kind="stable")
+        first_outgoing = np.searchsorted(sources[outgoing], np.arange(num_nodes + 1))
+        remaining = np.bincount(targets, minlength=num_nodes)
+        highest = np.zeros(num_nodes, dtype=np.int64)
+        count_highest = np.zeros(num_nodes, dtype=np.int64)
+        edge_order = np.zeros(self.num_edges, dtype=np.int64)
+
+        frontier = np.flatnonzero(remaining == 0)
+        while frontier.size > 0:
+            node_order = np.where(
+                highest[frontier] == 0,
+                1,
+                highest[frontier] + (count_highest[frontier] >= 2),
+            )
+
+            # The branches leaving the frontier
+            counts = first_outgoing[frontier + 1] - first_outgoing[frontier]
+            begin = np.repeat(
+                first_outgoing[frontier] - np.cumsum(counts) + counts, counts
+            )
+            edges = outgoing[begin + np.arange(begin.size)]
+            order = np.repeat(node_order, counts)
+            edge_order[edges] = order
+
+            # Update the highest incoming order of the nodes downstream
+            downstream = targets[edges]
+            previous = highest[downstream]
+            np.maximum.at(highest, downstream, order)
+            count_highest[downstream[highest[downstream] > previous]] = 0
+            np.add.at(count_highest, downstream[order == highest[downstream]], 1)
+            np.subtract.at(remaining, downstream, 1)
+            candidates = np.unique(downstream)
+            frontier = candidates[remaining[candidates] == 0]
+
+        return edge_order
+
+    def __build(self) -> None:
+        sources, targets = self.edge_nodes[:, 0], self.edge_nodes[:, 1]
+        keys = sources * self.num_nodes + targets
+        # The shortest branch comes first among the branches joining the same nodes
+        order = np.lexsort((self.weights, keys))
+        sorted_keys = keys[order]
+        first = np.ones(order.size, dtype=bool)
+        first[1:] = sorted_keys[1:] != sorted_keys[:-1]
+        kept = order[first]
+
+        # Zero weights would be dropped as missing entries of the sparse matrix
+        weights = np.maximum(self.weights[kept], np.finfo(np.double).tiny)
+        self.__matrix = csr_matrix(
+            (weights, (sources[kept], targets[kept])),
+            shape=(self.num_nodes, self.num_nodes),
+        )
+        self.__pair_keys = sorted_keys[first]
+        self.__pair_edges = kept
+
+    def __edges_between(self, first, second, directed: bool) -> np.ndarray:
+        """Finds the shortest branch between consecutive nodes of a path, in either direction unless directed."""
+        if self.__pair_keys is None:
+            self.__build()
+        keys = self.__pair_keys
+        num_nodes = self.num_nodes
+
+        def lookup(source, target):
+            wanted = source * num_nodes + target
+            position = np.minimum(np.searchsorted(keys, wanted), max(keys.size - 1, 0))
+            found = keys[position] == wanted
+            return np.where(found, self.__pair_edges[position], -1)
+
+        forward = lookup(first, second)
+        if directed:
+            return forward
+        backward = lookup(second, first)
+        use_backward = (forward < 0) | (
+            (backward >= 0) & (self.weights[backward] < self.weights[forward])
+        )
+        return np.where(use_backward, backward, forward)
+
+    def __check_nodes(self, nodes) -> np.ndarray:
+        nodes = np.atleast_1d(np.asarray(nodes, dtype=np.int64))
+        if nodes.size > 0 and (nodes.min() < 0 or nodes.max() >= self.num_nodes):
+            raise InputError(f"Nodes must lie in [0, {self.num_nodes})")
+        return nodes
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ugrid.connectivity import FaceNodesCSR
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridMesh2D
+from ugrid.utils import find_edges, valid_index_mask
+
+LOCATIONS = ("node", "edge", "face")
+WEIGHTINGS = ("uniform", "area", "distance")
+
+
+class MeshInterpolator:
+    """Sparse interpolation operators between the node, edge and face locations of a mesh2d.
+
+    Every operator is a row-normalized sparse matrix with shape (num_target, num_source),
+    built from the connectivity of the mesh2d the first time it is requested and cached afterwards.
+    A target entity receives the weighted average of the source entities it is connected to:
+    the nodes of a face, the faces around a node, the faces on both sides of an edge, and so on.
+
+    The available weightings are:
+        - "uniform": all connected source entities have the same weight.
+        - "area": source entities are weighted by their size, the area of faces or the length of edges.
+          This weighting is not available for node sources.
+        - "distance": source entities are weighted by the inverse distance between their location and the target.
+
+    The operators are built for the mesh2d as it is when they are first requested.
+    Create a new interpolator if the mesh2d is modified.
+
+    Attributes:
+        mesh2d (UGridMesh2D): The mesh2d the operators are built for.
+    """
+
+    def __init__(self, mesh2d: UGridMesh2D):
+        self.mesh2d: UGridMesh2D = mesh2d
+        self.__operators: Dict[Tuple[str, str, str], csr_matrix] = {}
+        self.__face_nodes = None
+        self.__face_edges = None
+        self.__coordinates: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def operator(
+        self, source: str, target: str, weighting: str = "uniform"
+    ) -> csr_matrix:
+        """Gets the sparse operator interpolating data from the `source` to the `target` location.
+
+        Args:
+            source (str): The location of the data ("node", "edge" or "face").
+            target (str): The location to interpolate to ("node", "edge" or "face").
+            weighting (str): The weighting ("uniform", "area" or "distance").
+
+        Returns:
+            csr_matrix: The operator, with shape (num_target, num_source).
+        """
+        if source not in LOCATIONS or target not in LOCATIONS:
+            raise InputError(f"Unsupported locations: {source} to {target}")
+        if source == target:
+            raise InputError("The source and target locations must differ")
+        if weighting not in WEIGHTINGS:
+            raise InputError(
+                f"Unsupported weighting: {weighting}. Use one of {WEIGHTINGS}."
+            )
+        if weighting == "area" and source == "node":
+            raise InputError("The area weighting is not available for node data")
+
+        key = (source, target, weighting)
+        if key not in self.__operators:
+            self.__operators[key] = self.__build(source, target, weighting)
+        return self.__operators[key]
+
+    def interpolate(
+        self,
+        data: np.ndarray,
+        source: str,
+        target: str,
+        weighting: str = "uniform",
+        axis: int = -1,
+    ) -> np.ndarray:
+        """Interpolates data from the `source` to the `target` location.
+
+        All other axes, such as time or layers, are interpolated with a single sparse matrix product.
+        Fill values must be replaced by NaN beforehand, since they would be averaged with the valid values.
+
+        Args:
+            data (ndarray): The data, with the source entities along `axis`.
+            source (str): The location of the data ("node", "edge" or "face").
+            target (str): The location to interpolate to ("node", "edge" or "face").
+            weighting (str): The weighting ("uniform", "area" or "distance").
+            axis (int): The axis along which the source entities are stored.
+
+        Returns:
+            ndarray: The interpolated data, with the target entities along `axis`.
+        """
+        operator = self.operator(source, target, weighting)
+        data = np.asarray(data)
+        if data.shape[axis] != operator.shape[1]:
+            raise InputError(
+                f"The data has {data.shape[axis]} entries along axis {axis}, "
+                f"but the mesh2d has {operator.shape[1]} {source}s"
+            )
+
+        moved = np.moveaxis(data, axis, 0)
+        result = operator @ moved.reshape(moved.shape[0], -1)
+        result = result.reshape((operator.shape[0],) + moved.shape[1:])
+        return np.moveaxis(result, 0, axis)
+
+    def __build(self, source: str, target: str, weighting: str) -> csr_matrix:
+        rows, columns = self.__incidence(target, source)
+        num_target = self.__count(target)
+        num_source = self.__count(source)
+
+        if weighting == "uniform":
+            weights = np.ones(rows.size)
+        elif weighting == "area":
+            weights = self.__size(source)[columns]
+        else:
+            source_x, source_y = self.__location_coordinates(source)
+            target_x, target_y = self.__location_coordinates(target)
+            distance = np.hypot(
+                source_x[columns] - target_x[rows], source_y[columns] - target_y[rows]
+            )
+            # Coinciding locations get a weight much larger than any other, without dividing by zero
+            extent = distance.max(initial=0.0)
+            weights = 1.0 / np.maximum(distance, 1e-12 * extent + np.finfo(float).tiny)
+
+        totals = np.bincount(rows, weights=weights, minlength=num_target)
+        weights = weights / np.where(totals > 0.0, totals, 1.0)[rows]
+        return csr_matrix((weights, (rows, columns)), shape=(num_target, num_source))
+
+    def __incidence(self, target: str, source: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the (target, source) pairs of connected entities, as zero-based indices."""
+        pairs = {
+            ("face", "node"): self.__face_node_pairs,
+            ("edge", "node"): self.__edge_node_pairs,
+            ("face", "edge"): self.__face_edge_pairs,
+        }
+        if (target, source) in pairs:
+            return pairs[(target, source)]()
+        rows, columns = pairs[(source, target)]()
+        return columns, rows
+
+    def __face_node_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        face_nodes = self.__get_face_nodes()
+        nodes = face_nodes.indices.astype(np.int64) - face_nodes.start_index
+        return face_nodes.face_of_index(), nodes
+
+    def __edge_node_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        edge_nodes = self.__edge_nodes()
+        edges = np.repeat(np.arange(edge_nodes.shape[0]), 2)
+        return edges, edge_nodes.ravel()
+
+    def __face_edge_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self.__face_edges is None:
+            self.__face_edges = self.__derive_face_edge_pairs()
+        return self.__face_edges
+
+    def __derive_face_edge_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        mesh2d = self.mesh2d
+        start_index = mesh2d.start_index
+        fill = mesh2d.int_fill_value
+        num_edges = self.__count("edge")
+
+        if num_edges > 0 and mesh2d.edge_faces.size == 2 * num_edges:
+            edge_faces = mesh2d.edge_faces.reshape(-1, 2)
+            valid = valid_index_mask(edge_faces, start_index, fill)
+            edges = np.repeat(np.arange(num_edges), 2).reshape(-1, 2)
+            return edge_faces[valid].astype(np.int64) - start_index, edges[valid]
+
+        num_faces = self.__count("face")
+        if num_faces > 0 and mesh2d.face_edges.size == mesh2d.face_nodes.size:
+            face_edges = mesh2d.face_edges.reshape(num_faces, -1)
+            valid = valid_index_mask(face_edges, start_index, fill)
+            faces = np.repeat(np.arange(num_faces), face_edges.shape[1])
+            return (
+                faces[valid.ravel()],
+                face_edges[valid].astype(np.int64) - start_index,
+            )
+
+        # Locate the sides of every face among the mesh2d edges
+        face_nodes = self.__get_face_nodes()
+        first = face_nodes.indices.astype(np.int64) - face_nodes.start_index
+        second = first[face_nodes.next_position()]
+        edge_nodes = self.__edge_nodes()
+        if num_edges == 0 or first.size == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        num_nodes = max(int(first.max()), int(edge_nodes.max())) + 1
+        edges = find_edges(first, second, edge_nodes, num_nodes)
+        found = edges >= 0
+        return face_nodes.face_of_index()[found], edges[found]
+
+    def __get_face_nodes(self) -> FaceNodesCSR:
+        if self.__face_nodes is None:
+            self.__face_nodes = FaceNodesCSR.from_mesh2d(self.mesh2d)
+        return self.__face_nodes
+
+    def __edge_nodes(self) -> np.ndarray:
+        return self.mesh2d.edge_nodes.reshape(-1, 2).astype(np.int64) - (
+            self.mesh2d.start_index
+        )
+
+    def __count(self, location: str) -> int:
+        if location == "node":
+            return self.mesh2d.node_x.size
+        if location == "edge":
+            return self.mesh2d.edge_nodes.size // 2
+        return self.mesh2d.face_nodes.size // max(self.mesh2d.num_face_nodes_max, 1)
+
+    def __size(self, location: str) -> np.ndarray:
+        """The area of the faces or the length of the edges."""
+        node_x = self.mesh2d.node_x
+        node_y = self.mesh2d.node_y
+        if location == "face":
+            return np.abs(self.__get_face_nodes().face_area(node_x, node_y))
+        edge_nodes = self.__edge_nodes()
+        return np.hypot(
+            node_x[edge_nodes[:, 1]] - node_x[edge_nodes[:, 0]],
+            node_y[edge_nodes[:, 1]] - node_y[edge_nodes[:, 0]],
+        )
+
+    def __location_coordinates(self, location: str) -> Tuple[np.ndarray, np.ndarray]:
+        """The coordinates of the nodes, edges or faces, derived from the nodes when absent."""
+        if location in self.__coordinates:
+            return self.__coordinates[location]
+
+        mesh2d = self.mesh2d
+        count = self.__count(location)
+        if location == "node":
+            coordinates = mesh2d.node_x, mesh2d.node_y
+        elif location == "edge":
+            if mesh2d.edge_x.size == count and mesh2d.edge_y.size == count:
+                coordinates = mesh2d.edge_x, mesh2d.edge_y
+            else:
+                edge_nodes = self.__edge_nodes()
+                coordinates = (
+                    mesh2d.node_x[edge_nodes].mean(axis=1),
+                    mesh2d.node_y[edge_nodes].mean(axis=1),
+                )
+        elif mesh2d.face_x.size == count and mesh2d.face_y.size == count:
+            coordinates = mesh2d.face_x, mesh2d.face_y
+        else:
+            coordinates = self.__get_face_nodes().face_centroid(
+                mesh2d.node_x, mesh2d.node_y
+            )
+
+        self.__coordinates[location] = coordinates
+        return coordinates
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import os
+import struct
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# The types of the NetCDF classic formats, as stored in the file
+CLASSIC_TYPES = {
+    1: np.dtype("i1"),
+    2: np.dtype("S1"),
+    3: np.dtype(">i2"),
+    4: np.dtype(">i4"),
+    5: np.dtype(">f4"),
+    6: np.dtype(">f8"),
+    7: np.dtype("u1"),
+    8: np.dtype(">u2"),
+    9: np.dtype(">u4"),
+    10: np.dtype(">i8"),
+    11: np.dtype(">u8"),
+}
+CLASSIC_FORMATS = {1: "classic", 2: "64-bit offset", 5: "64-bit data"}
+
+_NC_DIMENSION = 10
+_NC_VARIABLE = 11
+_NC_ATTRIBUTE = 12
+_STREAMING = 0xFFFFFFFF
+
+
+class ClassicVariable:
+    """A variable described by the header of a NetCDF classic file.
+
+    Attributes:
+        name (str): The name of the variable.
+        dimensions (tuple): The names of the dimensions.
+        shape (tuple): The length of every dimension, the number of records for the record dimension.
+        dtype (dtype): The type of the values, as stored in the file (big-endian).
+        attributes (dict): The attribute values keyed by name.
+        begin (int): The position of the data in the file.
+        is_record (bool): Whether the first dimension is the record dimension, whose entries are interleaved
+            with the records of the other record variables.
+    """
+
+    def __init__(self, name, dimensions, shape, dtype, attributes, begin, is_record):
+        self.name: str = name
+        self.dimensions: Tuple[str, ...] = dimensions
+        self.shape: Tuple[int, ...] = shape
+        self.dtype: np.dtype = dtype
+        self.attributes: Dict[str, object] = attributes
+        self.begin: int = begin
+        self.is_record: bool = is_record
+
+
+class ClassicHeader:
+    """The header of a file in a NetCDF classic format (CDF-1, CDF-2 or CDF-5).
+
+    Attributes:
+        file_path (str): The path of the file.
+        file_format (str): "classic", "64-bit offset" or "64-bit data".
+        num_records (int): The length of the record dimension.
+        record_size (int): The distance in bytes between consecutive records of a record variable.
+        dimensions (dict): The length of every dimension, the number of records for the record dimension.
+        global_attributes (dict): The global attributes.
+        variables (dict): The ClassicVariable of every variable, keyed by name.
+    """
+
+    def __init__(
+        self,
+        file_path,
+        file_format,
+        num_records,
+        record_size,
+        dimensions,
+        global_attributes,
+        variables,
+    ):
+        self.file_path: str = file_path
+        self.file_format: str = file_format
+        self.num_records: int = num_records
+        self.record_size: int = record_size
+        self.dimensions: Dict[str, int] = dimensions
+        self.global_attributes: Dict[str, object] = global_attributes
+        self.variables: Dict[str, ClassicVariable] = variables
+
+    def view(self, variable_name: str) -> np.ndarray:
+        """Maps the data of a variable without reading it.
+
+        Slicing the view along the first axis reads only the selected entries, which allows reading
+        variables larger than memory in blocks. Record variables are mapped with the stride of the records.
+
+        Args:
+            variable_name (str): The name of the variable.
+
+        Returns:
+            ndarray: A read-only view on the file, with the variable shape and big-endian type.
+        """
+        variable = self.variables[variable_name]
+        if int(np.prod(variable.shape, dtype=np.int64)) == 0:
+            return np.empty(variable.shape, dtype=variable.dtype)
+
+        buffer = np.memmap(self.file_path, dtype=np.uint8, mode="r")
+        strides = None
+        if variable.is_record:
+            row_strides = np.empty(variable.shape[1:], dtype=variable.dtype).strides
+            strides = (self.record_size,) + row_strides
+        return np.ndarray(
+            variable.shape,
+            dtype=variable.dtype,
+            buffer=buffer,
+            offset=variable.begin,
+            strides=strides,
+        )
+
+
+def read_classic_header(file_path) -> Optional[ClassicHeader]:
+    """Reads the header of a file in a NetCDF classic format, without reading any variable data.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        ClassicHeader: The header, None if the file is not in a NetCDF classic format, such as NetCDF-4 files.
+    """
+    file_path = str(file_path)
+    with open(file_path, "rb") as file:
+        magic = file.read(4)
+        if len(magic) < 4 or magic[:3] != b"CDF" or magic[3] not in CLASSIC_FORMATS:
+            return None
+        version = magic[3]
+        size_format = ">q" if version == 5 else ">i"
+        offset_format = ">i" if version == 1 else ">q"
+
+        def read(size):
+            data = file.read(size)
+            if len(data) != size:
+                raise EOFError(f"{file_path} has a truncated header")
+            return data
+
+        def read_int(fmt=">i"):
+            return struct.unpack(fmt, read(struct.calcsize(fmt)))[0]
+
+        def read_name():
+            length = read_int(size_format)
+            return read((length + 3) // 4 * 4)[:length].decode("utf-8")
+
+        def read_list(tag, read_item):
+            found = read_int()
+            count = read_int(size_format)
+            if found not in (0, tag) or (found == 0 and count != 0):
+                raise ValueError(f"{file_path} has an invalid header")
+            return [read_item() for _ in range(count)]
+
+        def read_attribute():
+            name = read_name()
+            dtype = CLASSIC_TYPES[read_int()]
+            count = read_int(size_format)
+            size = count * dtype.itemsize
+            data = read((size + 3) // 4 * 4)[:size]
+            if dtype.kind == "S":
+                value = data.decode("utf-8", errors="replace").rstrip("\0")
+            else:
+                value = np.frombuffer(data, dtype=dtype).astype(dtype.newbyteorder("="))
+                value = value.item() if value.size == 1 else value
+            return name, value
+
+        num_records = read_int(">I" if version != 5 else ">Q")
+        dimensions = read_list(
+            _NC_DIMENSION, lambda: (read_name(), read_int(size_format))
+        )
+        global_attributes = dict(read_list(_NC_ATTRIBUTE, read_attribute))
+
+        def read_variable():
+            name = read_name()
+            num_dimensions = read_int(size_format)
+            dimension_ids = [read_int(size_format) for _ in range(num_dimensions)]
+            attributes = dict(read_list(_NC_ATTRIBUTE, read_attribute))
+            dtype = CLASSIC_TYPES[read_int()]
+            size = read_int(size_format)
+            begin = read_int(offset_format)
+            is_record = num_dimensions > 0 and dimensions[dimension_ids[0]][1] == 0
+            return name, dimension_ids, dtype, attributes, size, begin, is_record
+
+        raw_variables = read_list(_NC_VARIABLE, read_variable)
+
+    records = [v for v in raw_variables if v[6]]
+    if len(records) == 1:
+        # A single record variable is not padded
+        _, dimension_ids, dtype, _, _, _, _ = records[0]
+        lengths = [dimensions[i][1] for i in dimension_ids[1:]]
+        record_size = int(np.prod(lengths, dtype=np.int64)) * dtype.itemsize
+    else:
+        record_size = sum(v[4] for v in records)
+    if num_records == _STREAMING and record_size > 0:
+        first = min(v[5] for v in records)
+        num_records = (os.path.getsize(file_path) - first) // record_size
+    elif num_records == _STREAMING:
+        num_records = 0
+
+    lengths = {name: length or num_records for name, length in dimensions}
+    variables = {}
+    for name, dimension_ids, dtype, attributes, _, begin, is_record in raw_variables:
+        names = tuple(dimensions[i][0] for i in dimension_ids)
+        shape = tuple(lengths[n] for n in names)
+        variables[name] = ClassicVariable(
+            name, names, shape, dtype, attributes, begin, is_record
+        )
+
+    return ClassicHeader(
+        file_path,
+        CLASSIC_FORMATS[version],
+        num_records,
+        record_size,
+        lengths,
+        global_attributes,
+        variables,
+    )
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridMesh1D, UGridNetwork1D
+
+
+class NetworkPolylines:
+    """The branch geometries of a network1d, stored as polylines with precomputed offsets and chainages.
+
+    The geometry of branch `k` is made of the geometry nodes `node_offsets[k]:node_offsets[k + 1]`.
+
+    Attributes:
+        x (ndarray): The x-coordinates of the geometry nodes of all branches, one branch after the other.
+        y (ndarray): The y-coordinates of the geometry nodes of all branches, one branch after the other.
+        node_offsets (ndarray): The position of the first geometry node of each branch, with num_branches + 1 entries.
+        chainage (ndarray): The distance along its branch from the first geometry node to every geometry node.
+    """
+
+    def __init__(self, x, y, node_offsets):
+        if x.size != y.size or node_offsets[-1] != x.size:
+            raise InputError("The geometry nodes do not match the node offsets")
+        self.x: np.ndarray = x
+        self.y: np.ndarray = y
+        self.node_offsets: np.ndarray = node_offsets
+
+        # Distances accumulated over all branches, segments joining two branches are skipped
+        segments = np.hypot(np.diff(x), np.diff(y))
+        junctions = node_offsets[1:-1]
+        segments[junctions[(junctions > 0) & (junctions < x.size)] - 1] = 0.0
+        self.__cumulative = np.zeros(x.size)
+        np.cumsum(segments, out=self.__cumulative[1:])
+        branch_start = np.repeat(
+            self.__cumulative[np.minimum(node_offsets[:-1], max(x.size - 1, 0))],
+            self.nodes_per_branch,
+        )
+        self.chainage: np.ndarray = self.__cumulative - branch_start
+
+    @property
+    def num_branches(self) -> int:
+        """The number of branches."""
+        return self.node_offsets.size - 1
+
+    @property
+    def nodes_per_branch(self) -> np.ndarray:
+        """The number of geometry nodes of each branch."""
+        return np.diff(self.node_offsets)
+
+    @staticmethod
+    def from_network1d(network1d: UGridNetwork1D) -> NetworkPolylines:
+        """Creates the polylines of the branches of a network1d.
+
+        Args:
+            network1d (UGridNetwork1D): The network1d.
+
+        Returns:
+            NetworkPolylines: The branch polylines.
+        """
+        counts = np.asarray(network1d.num_edge_geometry_nodes, dtype=np.int64)
+        node_offsets = np.zeros(counts.size + 1, dtype=np.int64)
+        np.cumsum(counts, out=node_offsets[1:])
+        return NetworkPolylines(
+            np.asarray(network1d.geometry_nodes_x, dtype=np.double),
+            np.asarray(network1d.geometry_nodes_y, dtype=np.double),
+            node_offsets,
+        )
+
+    def branch(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the geometry of a branch, without copying.
+
+        Args:
+            index (int): The zero-based branch index.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The x and y coordinates of the geometry nodes of the branch.
+        """
+        begin, end = self.node_offsets[index], self.node_offsets[index + 1]
+        return self.x[begin:end], self.y[begin:end]
+
+    def lengths(self) -> np.ndarray:
+        """Computes the geometric length of every branch, to be compared with the network1d edge_length.
+
+        Returns:
+            ndarray: The length of each branch, zero for branches with less than two geometry nodes.
+        """
+        lengths = np.zeros(self.num_branches)
+        non_empty = self.nodes_per_branch > 0
+        lengths[non_empty] = self.chainage[self.node_offsets[1:][non_empty] - 1]
+        return lengths
+
+    def interpolate(
+        self, branch_ids, chainage, edge_length: np.ndarray = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes the coordinates of many locations along the branches at once.
+
+        Chainages beyond the ends of a branch are clipped to its first or last geometry node.
+
+        Args:
+            branch_ids (ndarray): The zero-based branch of every location.
+            chainage (ndarray): The distance of every location from the start of its branch.
+            edge_length (ndarray): The branch lengths the chainages refer to, such as the network1d edge_length.
+                When given, chainages are scaled by the ratio between the geometric and the given branch lengths.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The x and y coordinates, NaN on branches without geometry.
+        """
+        branch_ids = np.asarray(branch_ids, dtype=np.int64)
+        chainage = np.asarray(chainage, dtype=np.double)
+        if branch_ids.shape != chainage.shape:
+            raise InputError("branch_ids and chainage must have the same shape")
+        if branch_ids.size > 0 and (
+            branch_ids.min() < 0 or branch_ids.max() >= self.num_branches
+        ):
+            raise InputError(f"Branch ids must lie in [0, {self.num_branches})")
+
+        lengths = self.lengths()
+        if edge_length is not None:
+            edge_length = np.asarray(edge_length, dtype=np.double)
+            if edge_length.size != self.num_branches:
+                raise InputError("edge_length must have one entry per branch")
+            scale = np.divide(
+                lengths, edge_length, out=np.ones(lengths.size), where=edge_length > 0.0
+            )
+            chainage = chainage * scale[branch_ids]
+
+        counts = self.nodes_per_branch[branch_ids]
+        first = np.minimum(self.node_offsets[branch_ids], max(self.x.size - 1, 0))
+        last = np.maximum(self.node_offsets[branch_ids + 1] - 1, first)
+        if self.x.size == 0:
+            nan = np.full(branch_ids.shape, np.nan)
+            return nan, nan.copy()
+
+        cumulative = self.__cumulative
+        target = cumulative[first] + np.clip(chainage, 0.0, lengths[branch_ids])
+        # Searching sorted targets walks the cumulative distances once instead of randomly
+        flat_target = target.ravel()
+        order = np.argsort(flat_target)
+        start = np.empty(flat_target.size, dtype=np.int64)
+        start[order] = np.searchsorted(cumulative, flat_target[order], side="right") - 1
+        start = start.reshape(target.shape)
+        start = np.clip(start, first, np.maximum(last - 1, first))
+        end = np.minimum(start + 1, last)
+        span = cumulative[end] - cumulative[start]
+        fraction = np.divide(
+            target - cumulative[start], span, out=np.zeros(span.shape), where=span > 0.0
+        )
+
+        x = self.x[start] + fraction * (self.x[end] - self.x[start])
+        y = self.y[start] + fraction * (self.y[end] - self.y[start])
+        x[counts == 0] = np.nan
+        y[counts == 0] = np.nan
+        return x, y
+
+
+def fill_mesh1d_coordinates(
+    mesh1d: UGridMesh1D,
+    network1d: UGridNetwork1D,
+    polylines: NetworkPolylines = None,
+) -> None:
+    """Computes the node and edge coordinates of a mesh1d from their location along the network1d branches.
+
+    node_x and node_y are computed from node_edge_id and node_edge_offset.
+    edge_x and edge_y are computed from edge_edge_id and edge_edge_offset when present,
+    and are the middle of the edge nodes otherwise.
+    Offsets refer to the network1d edge_length and are scaled to the branch geometries.
+    All locations are interpolated at once, the mesh1d is modified in place.
+
+    Args:
+        mesh1d (UGridMesh1D): The mesh1d to fill.
+        network1d (UGridNetwork1D): The network1d the mesh1d is defined on.
+        polylines (NetworkPolylines): The polylines of the network1d, built from it when not given.
+    """
+    if polylines is None:
+        polylines = NetworkPolylines.from_network1d(network1d)
+    edge_length = None
+    if network1d.edge_length.size == polylines.num_branches:
+        edge_length = network1d.edge_length
+
+    def locate(branch_ids, offsets):
+        branch_ids = np.asarray(branch_ids, dtype=np.int64) - network1d.start_index
+        return polylines.interpolate(branch_ids, offsets, edge_length)
+
+    num_nodes = mesh1d.node_edge_id.size
+    if mesh1d.node_edge_offset.size != num_nodes:
+        raise InputError("node_edge_id and node_edge_offset must have the same size")
+    num_edges = mesh1d.edge_node.size // 2
+    has_edge_locations = (
+        num_edges > 0
+        and mesh1d.edge_edge_id.size == num_edges
+        and mesh1d.edge_edge_offset.size == num_edges
+    )
+
+    if has_edge_locations:
+        # Nodes and edges are interpolated together, sharing a single search
+        x, y = locate(
+            np.concatenate([mesh1d.node_edge_id, mesh1d.edge_edge_id]),
+            np.concatenate([mesh1d.node_edge_offset, mesh1d.edge_edge_offset]),
+        )
+        mesh1d.node_x, mesh1d.edge_x = x[:num_nodes], x[num_nodes:]
+        mesh1d.node_y, mesh1d.edge_y = y[:num_nodes], y[num_nodes:]
+        return
+
+    mesh1d.node_x, mesh1d.node_y = locate(mesh1d.node_edge_id, mesh1d.node_edge_offset)
+    if num_edges > 0:
+        edge_nodes = mesh1d.edge_node.reshape(-1, 2).astype(np.int64)
+        edge_nodes -= mesh1d.start_index
+        mesh1d.edge_x = mesh1d.node_x[edge_nodes].mean(axis=1)
+        mesh1d.edge_y = mesh1d.node_y[edge_nodes].mean(axis=1)
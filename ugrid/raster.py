@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import math
+from typing import Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridMesh2D
+from ugrid.utils import face_vertex_coordinates, points_in_polygons
+
+
+class RasterGrid:
+    """A regular grid of rectangular pixels, stored row by row from the top as in GeoTIFF files.
+
+    Attributes:
+        x_min (float): The x-coordinate of the left side of the grid.
+        y_max (float): The y-coordinate of the top side of the grid.
+        cell_width (float): The width of a pixel.
+        cell_height (float): The height of a pixel.
+        num_columns (int): The number of pixel columns.
+        num_rows (int): The number of pixel rows.
+    """
+
+    def __init__(self, x_min, y_max, cell_width, cell_height, num_columns, num_rows):
+        if cell_width <= 0.0 or cell_height <= 0.0:
+            raise InputError("The pixel size must be positive")
+        self.x_min: float = x_min
+        self.y_max: float = y_max
+        self.cell_width: float = cell_width
+        self.cell_height: float = cell_height
+        self.num_columns: int = num_columns
+        self.num_rows: int = num_rows
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """The number of rows and columns."""
+        return self.num_rows, self.num_columns
+
+    @property
+    def num_pixels(self) -> int:
+        """The number of pixels."""
+        return self.num_rows * self.num_columns
+
+    @staticmethod
+    def from_bounds(x_min, y_min, x_max, y_max, cell_size) -> RasterGrid:
+        """Creates a grid of square pixels covering a bounding box.
+
+        Args:
+            x_min (float): The lowest x-coordinate to cover.
+            y_min (float): The lowest y-coordinate to cover.
+            x_max (float): The highest x-coordinate to cover.
+            y_max (float): The highest y-coordinate to cover.
+            cell_size (float): The width and height of a pixel.
+
+        Returns:
+            RasterGrid: The grid, anchored at the top left corner of the bounding box.
+        """
+        num_columns = max(math.ceil((x_max - x_min) / cell_size), 1)
+        num_rows = max(math.ceil((y_max - y_min) / cell_size), 1)
+        return RasterGrid(x_min, y_max, cell_size, cell_size, num_columns, num_rows)
+
+    @staticmethod
+    def from_mesh2d(mesh2d: UGridMesh2D, cell_size: float) -> RasterGrid:
+        """Creates a grid of square pixels covering the nodes of a mesh2d.
+
+        Args:
+            mesh2d (UGridMesh2D): The mesh2d to cover.
+            cell_size (float): The width and height of a pixel.
+
+        Returns:
+            RasterGrid: The grid.
+        """
+        if mesh2d.node_x.size == 0:
+            raise InputError("The mesh2d has no nodes")
+        return RasterGrid.from_bounds(
+            mesh2d.node_x.min(),
+            mesh2d.node_y.min(),
+            mesh2d.node_x.max(),
+            mesh2d.node_y.max(),
+            cell_size,
+        )
+
+    def pixel_centers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the coordinates of the pixel centers.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The x-coordinates of the columns and the y-coordinates of the rows.
+        """
+        x = self.x_min + (np.arange(self.num_columns) + 0.5) * self.cell_width
+        y = self.y_max - (np.arange(self.num_rows) + 0.5) * self.cell_height
+        return x, y
+
+    def geotransform(self) -> Tuple[float, float, float, float, float, float]:
+        """Gets the affine transformation of the grid, in the order used by GDAL.
+
+        Returns:
+            Tuple: The x_min, pixel width, row rotation, y_max, column rotation and negative pixel height.
+        """
+        return self.x_min, self.cell_width, 0.0, self.y_max, 0.0, -self.cell_height
+
+
+class MeshRasterizer:
+    """Rasterizes data defined on the faces or the nodes of a mesh2d onto a regular grid.
+
+    The face containing the center of every pixel is searched once, the first time it is needed, and cached.
+    Face data is then rasterized with a single gather. Node data is interpolated linearly
+    within the triangles fanning out of the first node of every face, with a cached sparse operator.
+    Rasterizing a time step therefore costs O(pixels), whatever the complexity of the mesh.
+
+    Attributes:
+        mesh2d (UGridMesh2D): The mesh2d to rasterize.
+        grid (RasterGrid): The grid to rasterize on.
+        block_size (int): The number of pixel candidates tested at once while searching the faces.
+    """
+
+    def __init__(self, mesh2d: UGridMesh2D, grid: RasterGrid, block_size=1 << 22):
+        self.mesh2d: UGridMesh2D = mesh2d
+        self.grid: RasterGrid = grid
+        self.block_size: int = block_size
+        self.__pixel_face = None
+        self.__node_weights = None
+
+    @property
+    def pixel_face(self) -> np.ndarray:
+        """The zero-based face containing the center of every pixel, -1 outside the mesh2d, with the grid shape."""
+        if self.__pixel_face is None:
+            self.__pixel_face = self.__locate_faces().reshape(self.grid.shape)
+        return self.__pixel_face
+
+    @property
+    def node_weights(self) -> csr_matrix:
+        """The sparse operator interpolating node data on the pixels, with shape (num_pixels, num_nodes)."""
+        if self.__node_weights is None:
+            self.__node_weights = self.__interpolation_weights()
+        return self.__node_weights
+
+    def rasterize(
+        self, data: np.ndarray, location: str = "face", fill_value: float = np.nan
+    ) -> np.ndarray:
+        """Rasterizes data defined on the faces or the nodes of the mesh2d.
+
+        Args:
+            data (ndarray): The data, with the faces or nodes along the last axis.
+                Leading axes, such as time, are rasterized at once.
+            location (str): The location of the data ("face" or "node").
+            fill_value (float): The value of the pixels outside the mesh2d.
+
+        Returns:
+            ndarray: The raster, with shape data.shape[:-1] + (num_rows, num_columns).
+        """
+        data = np.asarray(data)
+        pixel_face = self.pixel_face.ravel()
+        outside = pixel_face < 0
+
+        if location == "face":
+            num_entities = self.mesh2d.face_nodes.size // self.mesh2d.num_face_nodes_max
+            self.__check_size(data, num_entities, location)
+            raster = np.take(data, np.where(outside, 0, pixel_face), axis=-1)
+        elif location == "node":
+            self.__check_size(data, self.mesh2d.node_x.size, location)
+            flat = data.reshape(-1, data.shape[-1])
+            raster = (self.node_weights @ flat.T).T.reshape(data.shape[:-1] + (-1,))
+        else:
+            raise InputError(f"Unsupported location: {location}")
+
+        raster = np.where(outside, fill_value, raster)
+        return raster.reshape(data.shape[:-1] + self.grid.shape)
+
+    @staticmethod
+    def __check_size(data, num_entities, location):
+        if data.ndim == 0 or data.shape[-1] != num_entities:
+            raise InputError(
+                f"The last axis of the data must have one entry per {location} ({num_entities})"
+            )
+
+    def __locate_faces(self) -> np.ndarray:
+        grid = self.grid
+        _, vertex_x, vertex_y, counts = face_vertex_coordinates(self.mesh2d)
+        num_faces = vertex_x.shape[0]
+        pixel_face = np.full(grid.num_pixels, -1, dtype=np.int64)
+        if num_faces == 0:
+            return pixel_face
+
+        # The pixels whose center lies in the bounding box of each face
+        column_first = np.ceil(
+            (vertex_x.min(axis=1) - grid.x_min) / grid.cell_width - 0.5
+        )
+        column_last = np.floor(
+            (vertex_x.max(axis=1) - grid.x_min) / grid.cell_width - 0.5
+        )
+        row_first = np.ceil(
+            (grid.y_max - vertex_y.max(axis=1)) / grid.cell_height - 0.5
+        )
+        row_last = np.floor(
+            (grid.y_max - vertex_y.min(axis=1)) / grid.cell_height - 0.5
+        )
+        column_first = np.maximum(column_first, 0).astype(np.int64)
+        column_last = np.minimum(column_last, grid.num_columns - 1).astype(np.int64)
+        row_first = np.maximum(row_first, 0).astype(np.int64)
+        row_last = np.minimum(row_last, grid.num_rows - 1).astype(np.int64)
+        num_candidate_columns = np.maximum(column_last - column_first + 1, 0)
+        num_candidates = num_candidate_columns * np.maximum(row_last - row_first + 1, 0)
+        num_candidates[counts < 3] = 0
+        cumulative = np.cumsum(num_candidates)
+
+        begin = 0
+        while begin < num_faces:
+            done = cumulative[begin - 1] if begin > 0 else 0
+            end = int(np.searchsorted(cumulative, done + self.block_size, side="right"))
+            end = max(end, begin + 1)
+            block = np.arange(begin, end)
+            block_candidates = num_candidates[begin:end]
+            faces = np.repeat(block, block_candidates)
+            local = np.arange(faces.size) - np.repeat(
+                np.cumsum(block_candidates) - block_candidates, block_candidates
+            )
+            row, column = np.divmod(local, num_candidate_columns[faces])
+            row += row_first[faces]
+            column += column_first[faces]
+            x = grid.x_min + (column + 0.5) * grid.cell_width
+            y = grid.y_max - (row + 0.5) * grid.cell_height
+
+            inside = points_in_polygons(x, y, faces, vertex_x, vertex_y)
+            pixel_face[row[inside] * grid.num_columns + column[inside]] = faces[inside]
+            begin = end
+
+        return pixel_face
+
+    def __interpolation_weights(self) -> csr_matrix:
+        pixel_face = self.pixel_face.ravel()
+        pixels = np.flatnonzero(pixel_face >= 0)
+        faces = pixel_face[pixels]
+        nodes, vertex_x, vertex_y, counts = face_vertex_coordinates(self.mesh2d)
+        x_centers, y_centers = self.grid.pixel_centers()
+        x = x_centers[pixels % self.grid.num_columns]
+        y = y_centers[pixels // self.grid.num_columns]
+
+        # Barycentric coordinates in the triangles (0, k, k + 1) of the fan of every face.
+        # The triangle with the largest smallest coordinate contains the pixel center, or is the nearest one.
+        # Degenerate faces fall back to the value of their first node.
+        best = np.full(pixels.size, -np.inf)
+        weights = np.zeros((pixels.size, 3))
+        weights[:, 0] = 1.0
+        corners = np.zeros((pixels.size, 3), dtype=np.int64)
+        corners[:, 0] = nodes[faces, 0]
+        xa, ya = vertex_x[faces, 0] - x, vertex_y[faces, 0] - y
+        for k in range(1, nodes.shape[1] - 1):
+            xb, yb = vertex_x[faces, k] - x, vertex_y[faces, k] - y
+            xc, yc = vertex_x[faces, k + 1] - x, vertex_y[faces, k + 1] - y
+            twice_area = (xb - xa) * (yc - ya) - (xc - xa) * (yb - ya)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                wa = (xb * yc - xc * yb) / twice_area
+                wb = (xc * ya - xa * yc) / twice_area
+            wc = 1.0 - wa - wb
+            smallest = np.minimum(np.minimum(wa, wb), wc)
+            smallest[(k + 2 > counts[faces]) | ~np.isfinite(smallest)] = -np.inf
+            better = smallest > best
+            best[better] = smallest[better]
+            weights[better] = np.stack([wa, wb, wc], axis=1)[better]
+            corners[better, 1] = nodes[faces[better], k]
+            corners[better, 2] = nodes[faces[better], k + 1]
+
+        rows = np.repeat(pixels, 3)
+        return csr_matrix(
+            (weights.ravel(), (rows, corners.ravel())),
+            shape=(self.grid.num_pixels, self.mesh2d.node_x.size),
+        )
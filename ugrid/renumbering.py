@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridMesh1D, UGridMesh2D
+from ugrid.utils import hilbert_index, remap_indices, take_rows, valid_index_mask
+
+RENUMBERING_METHODS = ("hilbert", "rcm")
+
+
+class MeshPermutation:
+    """The permutations applied when renumbering a mesh.
+
+    Each permutation contains, for every new position, the old index of the entity stored there.
+    Data variables defined on the original mesh are therefore reordered with `data[..., permutation]`.
+
+    Attributes:
+        node (ndarray): The old node index at every new node position.
+        edge (ndarray): The old edge index at every new edge position.
+        face (ndarray): The old face index at every new face position (empty for a mesh1d).
+    """
+
+    def __init__(self, node, edge, face=np.array([], dtype=np.int64)):
+        self.node: np.ndarray = node
+        self.edge: np.ndarray = edge
+        self.face: np.ndarray = face
+
+    def inverse(self, location: str) -> np.ndarray:
+        """Gets the inverse permutation, mapping every old index to its new index.
+
+        Args:
+            location (str): The location of the permutation ("node", "edge" or "face").
+
+        Returns:
+            ndarray: The new index of every old entity.
+        """
+        permutation = self.__get(location)
+        inverse = np.empty_like(permutation)
+        inverse[permutation] = np.arange(permutation.size, dtype=permutation.dtype)
+        return inverse
+
+    def apply(self, data: np.ndarray, location: str, axis: int = -1) -> np.ndarray:
+        """Reorders a data variable defined on the original mesh.
+
+        Args:
+            data (ndarray): The data, with the entities of `location` along `axis`.
+            location (str): The location of the data ("node", "edge" or "face").
+            axis (int): The axis along which the entities are stored.
+
+        Returns:
+            ndarray: The data in the renumbered order.
+        """
+        return np.take(data, self.__get(location), axis=axis)
+
+    def __get(self, location: str) -> np.ndarray:
+        if location not in ("node", "edge", "face"):
+            raise InputError(f"Unsupported location: {location}")
+        return getattr(self, location)
+
+
+def node_adjacency(edge_nodes: np.ndarray, num_nodes: int) -> csr_matrix:
+    """Builds the symmetric node to node adjacency matrix of a mesh.
+
+    Args:
+        edge_nodes (ndarray): The zero-based edge nodes, with shape (num_edges, 2).
+        num_nodes (int): The number of nodes.
+
+    Returns:
+        csr_matrix: The adjacency matrix, with shape (num_nodes, num_nodes).
+    """
+    source = np.concatenate([edge_nodes[:, 0], edge_nodes[:, 1]])
+    target = np.concatenate([edge_nodes[:, 1], edge_nodes[:, 0]])
+    weights = np.ones(source.size, dtype=np.int8)
+    return csr_matrix((weights, (source, target)), shape=(num_nodes, num_nodes))
+
+
+def _check_method(method: str) -> None:
+    if method not in RENUMBERING_METHODS:
+        raise InputError(
+            f"Unsupported renumbering method: {method}. Use one of {RENUMBERING_METHODS}."
+        )
+
+
+def _edge_order(edge_nodes: np.ndarray, node_rank: np.ndarray) -> np.ndarray:
+    """Orders the edges by the new indices of their lowest and highest node."""
+    ranks = node_rank[edge_nodes].astype(np.int64)
+    key = ranks.min(axis=1) * node_rank.size + ranks.max(axis=1)
+    return np.argsort(key)
+
+
+def _rank(order: np.ndarray) -> np.ndarray:
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size, dtype=order.dtype)
+    return rank
+
+
+def renumber_mesh2d(
+    mesh2d: UGridMesh2D, method: str = "hilbert"
+) -> Tuple[UGridMesh2D, MeshPermutation]:
+    """Renumbers the nodes, edges and faces of a mesh2d to improve memory locality.
+
+    With `method="hilbert"` nodes and faces are sorted along a Hilbert curve through their coordinates.
+    With `method="rcm"` nodes are sorted with the reverse Cuthill-McKee algorithm and faces by their lowest node.
+    In both cases edges are sorted by their nodes.
+    All coordinate and connectivity arrays are permuted consistently, the input mesh is not modified.
+    The node indices in `boundary_node_connectivity` are remapped and the per-face `volume_coordinates` reordered.
+
+    Args:
+        mesh2d (UGridMesh2D): The mesh2d to renumber.
+        method (str): The renumbering method ("hilbert" or "rcm").
+
+    Returns:
+        Tuple[UGridMesh2D, MeshPermutation]: The renumbered mesh2d and the applied permutations.
+    """
+    _check_method(method)
+
+    start_index = mesh2d.start_index
+    fill = mesh2d.int_fill_value
+    num_nodes = mesh2d.node_x.size
+    edge_nodes = mesh2d.edge_nodes.reshape(-1, 2).astype(np.int64) - start_index
+    num_face_nodes_max = mesh2d.num_face_nodes_max
+    face_nodes = mesh2d.face_nodes.reshape(-1, num_face_nodes_max)
+    if face_nodes.size == 0:
+        face_nodes = face_nodes.astype(np.int32)
+    face_mask = valid_index_mask(face_nodes, start_index, fill)
+    num_faces = face_nodes.shape[0]
+
+    if method == "hilbert":
+        if mesh2d.face_x.size == num_faces:
+            face_x, face_y = mesh2d.face_x, mesh2d.face_y
+        else:
+            face_num_nodes = np.maximum(face_mask.sum(axis=1), 1)
+            safe_nodes = np.where(face_mask, face_nodes - start_index, 0)
+            face_x = (mesh2d.node_x[safe_nodes] * face_mask).sum(
+                axis=1
+            ) / face_num_nodes
+            face_y = (mesh2d.node_y[safe_nodes] * face_mask).sum(
+                axis=1
+            ) / face_num_nodes
+        # Faces and nodes share the same curve, so neighbouring faces reference neighbouring nodes
+        curve = hilbert_index(
+            np.concatenate([mesh2d.node_x, face_x]),
+            np.concatenate([mesh2d.node_y, face_y]),
+        )
+        node_order = np.argsort(curve[:num_nodes])
+        node_rank = _rank(node_order)
+        face_order = np.argsort(curve[num_nodes:])
+    else:
+        adjacency = node_adjacency(edge_nodes, num_nodes)
+        node_order = reverse_cuthill_mckee(adjacency, symmetric_mode=True)
+        node_rank = _rank(node_order)
+        face_min_rank = np.where(
+            face_mask,
+            node_rank[np.where(face_mask, face_nodes - start_index, 0)],
+            num_nodes,
+        ).min(axis=1, initial=num_nodes)
+        face_order = np.argsort(face_min_rank)
+
+    edge_order = _edge_order(edge_nodes, node_rank)
+    edge_rank = _rank(edge_order)
+    face_rank = _rank(face_order)
+
+    def remap(array, rank):
+        return remap_indices(array, rank, start_index, fill)
+
+    renumbered = UGridMesh2D(
+        name=mesh2d.name,
+        node_x=take_rows(mesh2d.node_x, node_order),
+        node_y=take_rows(mesh2d.node_y, node_order),
+        edge_node=remap(take_rows(mesh2d.edge_nodes, edge_order, 2), node_rank),
+        face_nodes=remap(
+            take_rows(mesh2d.face_nodes, face_order, num_face_nodes_max), node_rank
+        ),
+        edge_x=take_rows(mesh2d.edge_x, edge_order),
+        edge_y=take_rows(mesh2d.edge_y, edge_order),
+        face_x=take_rows(mesh2d.face_x, face_order),
+        face_y=take_rows(mesh2d.face_y, face_order),
+        edge_faces=remap(take_rows(mesh2d.edge_faces, edge_order, 2), face_rank),
+        face_edges=remap(
+            take_rows(mesh2d.face_edges, face_order, num_face_nodes_max), edge_rank
+        ),
+        face_faces=remap(
+            take_rows(mesh2d.face_faces, face_order, num_face_nodes_max), face_rank
+        ),
+        node_z=take_rows(mesh2d.node_z, node_order),
+        edge_z=take_rows(mesh2d.edge_z, edge_order),
+        face_z=take_rows(mesh2d.face_z, face_order),
+        layer_zs=mesh2d.layer_zs,
+        interface_zs=mesh2d.interface_zs,
+        boundary_node_connectivity=remap(mesh2d.boundary_node_connectivity, node_rank),
+        volume_coordinates=take_rows(mesh2d.volume_coordinates, face_order),
+        start_index=start_index,
+        num_face_nodes_max=num_face_nodes_max,
+        is_spherical=mesh2d.is_spherical,
+        double_fill_value=mesh2d.double_fill_value,
+        int_fill_value=fill,
+    )
+
+    return renumbered, MeshPermutation(node_order, edge_order, face_order)
+
+
+def renumber_mesh1d(
+    mesh1d: UGridMesh1D, method: str = "hilbert"
+) -> Tuple[UGridMesh1D, MeshPermutation]:
+    """Renumbers the nodes and edges of a mesh1d to improve memory locality.
+
+    With `method="hilbert"` nodes are sorted along a Hilbert curve through their coordinates,
+    which requires node_x and node_y to be present.
+    With `method="rcm"` nodes are sorted with the reverse Cuthill-McKee algorithm.
+    In both cases edges are sorted by their nodes. The input mesh is not modified.
+
+    Args:
+        mesh1d (UGridMesh1D): The mesh1d to renumber.
+        method (str): The renumbering method ("hilbert" or "rcm").
+
+    Returns:
+        Tuple[UGridMesh1D, MeshPermutation]: The renumbered mesh1d and the applied permutations.
+    """
+    _check_method(method)
+
+    start_index = mesh1d.start_index
+    num_nodes = mesh1d.node_edge_id.size
+    edge_nodes = mesh1d.edge_node.reshape(-1, 2).astype(np.int64) - start_index
+
+    if method == "hilbert":
+        if mesh1d.node_x.size != num_nodes:
+            raise InputError(
+                "Hilbert renumbering of a mesh1d requires node_x and node_y."
+            )
+        node_order = np.argsort(hilbert_index(mesh1d.node_x, mesh1d.node_y))
+    else:
+        adjacency = node_adjacency(edge_nodes, num_nodes)
+        node_order = reverse_cuthill_mckee(adjacency, symmetric_mode=True)
+
+    node_rank = _rank(node_order)
+    edge_order = _edge_order(edge_nodes, node_rank)
+
+    def take_names(names):
+        if len(names) != num_nodes:
+            return names
+        return [names[i] for i in node_order]
+
+    renumbered = UGridMesh1D(
+        name=mesh1d.name,
+        network_name=mesh1d.network_name,
+        node_edge_id=take_rows(mesh1d.node_edge_id, node_order),
+        node_edge_offset=take_rows(mesh1d.node_edge_offset, node_order),
+        node_x=take_rows(mesh1d.node_x, node_order),
+        node_y=take_rows(mesh1d.node_y, node_order),
+        edge_node=remap_indices(
+            take_rows(mesh1d.edge_node, edge_order, 2),
+            node_rank,
+            start_index,
+            mesh1d.int_fill_value,
+        ),
+        edge_edge_id=take_rows(mesh1d.edge_edge_id, edge_order),
+        edge_edge_offset=take_rows(mesh1d.edge_edge_offset, edge_order),
+        edge_x=take_rows(mesh1d.edge_x, edge_order),
+        edge_y=take_rows(mesh1d.edge_y, edge_order),
+        node_name_id=take_names(mesh1d.node_name_id),
+        node_name_long=take_names(mesh1d.node_name_long),
+        double_fill_value=mesh1d.double_fill_value,
+        int_fill_value=mesh1d.int_fill_value,
+    )
+    renumbered.is_spherical = mesh1d.is_spherical
+    renumbered.start_index = start_index
+
+    return renumbered, MeshPermutation(node_order, edge_order)
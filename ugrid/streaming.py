@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, Iterable
+
+import numpy as np
+
+from ugrid.errors import InputError, UGridError
+from ugrid.netcdf_classic import read_classic_header
+from ugrid.subset import subset_contacts, subset_mesh2d
+from ugrid.ugrid import UGrid
+
+TOPOLOGIES = ("network1d", "mesh1d", "mesh2d", "contacts")
+
+DEFAULT_BLOCK_BYTES = 64 << 20
+
+
+def copy(
+    source,
+    destination,
+    topologies: Iterable[str] = None,
+    variables: Iterable[str] = (),
+    time: slice = None,
+    faces=None,
+    block_bytes: int = DEFAULT_BLOCK_BYTES,
+) -> Dict[str, Path]:
+    """Copies the topologies and variables of a UGrid file, optionally restricted to a time range and a set of faces.
+
+    The topologies are written to the destination with `*_define` and `*_put`. With `faces`, the mesh2d is
+    reduced to the selected faces with the nodes and edges they use, and the contacts to that mesh2d are
+    reduced to the contacts of the kept faces.
+
+    Variables without dimensions, such as the coordinate reference system, are defined in the destination
+    with their attributes. Since the UGrid library can only write such integer variables, every variable
+    with data is written to its own `.npy` file next to the destination, named `<destination stem>.<variable>.npy`.
+    From a file in a NetCDF classic format, the data is streamed through a memory mapped view of the file
+    in blocks of at most `block_bytes`, so a variable is never held in memory as a whole. From other formats,
+    such as NetCDF-4, the UGrid library can only read whole variables, which are then read in one go.
+
+    `time` selects entries along the first axis of the variables whose first dimension is the dimension
+    of the "time" variable or the record dimension. From other formats, the dimension names are not known,
+    so time is the first axis of the variables whose first axis has the length of the "time" variable.
+    `faces` selects the entities of the variables located
+    on the faces, edges or nodes of the mesh2d.
+
+    Args:
+        source (str): The UGrid file to copy.
+        destination (str): The UGrid file to write, overwritten if it exists.
+        topologies (Iterable[str]): The kinds of topologies to copy, all of them when not given.
+        variables (Iterable[str]): The variables to copy.
+        time (slice): The time entries to copy, all of them when not given.
+        faces (ndarray): The faces of the mesh2d to keep, as a boolean mask or zero-based indices.
+            All faces are kept when not given.
+        block_bytes (int): The largest size of a block of source data.
+
+    Returns:
+        Dict[str, Path]: The `.npy` file written for every variable with data, keyed by variable name.
+
+    Raises:
+        InputError: If the arguments are not supported, or if `time` is given for a file in another format
+            than NetCDF classic without a "time" variable.
+    """
+
+    topologies = TOPOLOGIES if topologies is None else tuple(topologies)
+    unsupported = [t for t in topologies if t not in TOPOLOGIES]
+    if unsupported:
+        raise InputError(
+            f"Unsupported topologies: {unsupported}. Use some of {TOPOLOGIES}."
+        )
+    if time is not None and not isinstance(time, slice):
+        raise InputError("The time selection must be a slice")
+    if block_bytes <= 0:
+        raise InputError("The block size must be positive")
+
+    source = str(source)
+    destination = Path(destination)
+    header = read_classic_header(source)
+    written = {}
+
+    with UGrid(source, "r") as ug:
+        values = {
+            kind: [
+                getattr(ug, f"{kind}_get")(i)
+                for i in range(getattr(ug, f"{kind}_get_num_topologies")())
+            ]
+            for kind in topologies
+        }
+        num_times = None
+        if header is None:
+            try:
+                dimensions = ug.variable_get_dimensions("time")
+                if len(dimensions) == 1:
+                    num_times = int(dimensions[0])
+            except UGridError:
+                pass
+            if time is not None and num_times is None:
+                raise InputError(
+                    f"Selecting times requires a time variable in {source}"
+                )
+        described = [
+            _describe(ug, header, name, num_times) for name in dict.fromkeys(variables)
+        ]
+
+        # The number of entities and the kept entities of every location of the subset mesh2d
+        selections = {}
+        if faces is not None:
+            if len(values.get("mesh2d", [])) != 1:
+                raise InputError("Selecting faces requires copying exactly one mesh2d")
+            mesh2d = values["mesh2d"][0]
+            num_faces = mesh2d.face_nodes.size // mesh2d.num_face_nodes_max
+            subset, permutation = subset_mesh2d(mesh2d, faces)
+            values["mesh2d"][0] = subset
+            if "contacts" in values:
+                values["contacts"] = [
+                    (
+                        subset_contacts(contacts, permutation.face, num_faces)[0]
+                        if contacts.mesh_to_name == mesh2d.name
+                        else contacts
+                    )
+                    for contacts in values["contacts"]
+                ]
+            selections = {
+                (mesh2d.name, "node"): (mesh2d.node_x.size, permutation.node),
+                (mesh2d.name, "edge"): (mesh2d.edge_nodes.size // 2, permutation.edge),
+                (mesh2d.name, "face"): (num_faces, permutation.face),
+            }
+
+        with UGrid(str(destination), "w+") as destination_ug:
+            for kind in topologies:
+                for topology in values[kind]:
+                    topology_id = getattr(destination_ug, f"{kind}_define")(topology)
+                    getattr(destination_ug, f"{kind}_put")(topology_id, topology)
+            for name, shape, _, _, attributes in described:
+                if not shape:
+                    destination_ug.variable_int_with_attributes_define(name, attributes)
+
+        for name, shape, is_timed, view, attributes in described:
+            if not shape:
+                continue
+            if view is None:
+                # Only whole variables can be read from formats other than NetCDF classic
+                view = ug.variable_get_data_double(name).reshape(shape)
+
+            indices = [None] * len(shape)
+            if time is not None and is_timed:
+                indices[0] = np.arange(shape[0])[time]
+            key = (attributes.get("mesh"), attributes.get("location"))
+            if key in selections:
+                count, kept = selections[key]
+                # The entities are along the first axis of their length, after the time axis
+                axes = [
+                    axis
+                    for axis, length in enumerate(shape)
+                    if length == count and not (axis == 0 and is_timed)
+                ]
+                if axes:
+                    indices[axes[0]] = kept
+
+            path = destination.with_name(f"{destination.stem}.{name}.npy")
+            _stream(view, indices, path, block_bytes)
+            written[name] = path
+
+    return written
+
+
+def _describe(ug: UGrid, header, name: str, num_times: int = None):
+    """Describes a source variable by its name, shape, whether its first axis is the time,
+    a view on its data when it can be streamed, and its attributes.
+    Without a NetCDF classic header, the first axis is the time when its length is `num_times`.
+    """
+
+    attributes = dict(
+        zip(
+            ug.variable_get_attributes_names(name),
+            ug.variable_get_attributes_values(name),
+        )
+    )
+    variable = None if header is None else header.variables.get(name)
+    if variable is None:
+        shape = tuple(int(n) for n in ug.variable_get_dimensions(name))
+        is_timed = bool(shape) and num_times is not None and shape[0] == num_times
+        return name, shape, is_timed, None, attributes
+
+    # The typed attributes of the header replace the text values of the library
+    attributes.update(
+        {key: _attribute_value(value) for key, value in variable.attributes.items()}
+    )
+    time_variable = header.variables.get("time")
+    time_dimension = None
+    if time_variable is not None and len(time_variable.dimensions) == 1:
+        time_dimension = time_variable.dimensions[0]
+    is_timed = bool(variable.dimensions) and (
+        variable.is_record or variable.dimensions[0] == time_dimension
+    )
+    view = header.view(name) if variable.shape else None
+    return name, variable.shape, is_timed, view, attributes
+
+
+def _attribute_value(value):
+    """Converts an attribute value to a type `variable_int_with_attributes_define` can write."""
+    if isinstance(value, str):
+        return value
+    value = np.atleast_1d(value)
+    if value.dtype.kind in "iub":
+        return value.astype(np.int32)
+    return value.astype(np.double)
+
+
+def _stream(data: np.ndarray, indices: list, path: Path, block_bytes: int) -> None:
+    """Writes the selected entries of an array to a `.npy` file, a block of rows of the first axis at a time.
+
+    Args:
+        data (ndarray): The source, possibly a memory mapped view of a file.
+        indices (list): The indices selected along every axis, None to select the whole axis.
+        path (Path): The `.npy` file to write.
+        block_bytes (int): The largest size of a block of source data.
+    """
+    rows = np.arange(data.shape[0]) if indices[0] is None else indices[0]
+    shape = (rows.size,) + tuple(
+        length if selected is None else selected.size
+        for length, selected in zip(data.shape[1:], indices[1:])
+    )
+    output = np.lib.format.open_memmap(
+        path, mode="w+", dtype=data.dtype.newbyteorder("="), shape=shape
+    )
+    row_bytes = int(np.prod(data.shape[1:], dtype=np.int64)) * data.dtype.itemsize
+    block_rows = max(1, block_bytes // max(1, row_bytes))
+    for start in range(0, rows.size, block_rows):
+        stop = min(start + block_rows, rows.size)
+        block = data[rows[start:stop]]
+        for axis, selected in enumerate(indices[1:], start=1):
+            if selected is not None:
+                block = np.take(block, selected, axis=axis)
+        output[start:stop] = block
+    output.flush()
+    del output
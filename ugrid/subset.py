@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridContacts, UGridMesh2D
+from ugrid.renumbering import MeshPermutation
+from ugrid.utils import remap_indices, valid_index_mask
+
+
+def subset_mesh2d(mesh2d: UGridMesh2D, faces) -> Tuple[UGridMesh2D, MeshPermutation]:
+    """Extracts the faces of a mesh2d, with the nodes and edges they use.
+
+    Kept entities keep their relative order. Connectivity to entities that are not kept,
+    such as the neighbours of boundary faces in face_faces, becomes a fill value.
+
+    Args:
+        mesh2d (UGridMesh2D): The mesh2d.
+        faces (ndarray): The faces to keep, as a boolean mask over the faces or as zero-based face indices.
+
+    Returns:
+        Tuple[UGridMesh2D, MeshPermutation]: The subset and, for every kept entity, its index in the mesh2d.
+            Data variables are subset with `permutation.apply(data, location)`.
+    """
+    start_index = mesh2d.start_index
+    fill = mesh2d.int_fill_value
+    num_face_nodes_max = mesh2d.num_face_nodes_max
+    face_nodes = mesh2d.face_nodes.reshape(-1, num_face_nodes_max)
+    num_faces = face_nodes.shape[0]
+    num_nodes = mesh2d.node_x.size
+    edge_nodes = mesh2d.edge_nodes.reshape(-1, 2).astype(np.int64) - start_index
+    num_edges = edge_nodes.shape[0]
+
+    faces = np.asarray(faces)
+    if faces.dtype == bool:
+        if faces.size != num_faces:
+            raise InputError("The face mask must have one entry per face")
+        faces = np.flatnonzero(faces)
+    faces = np.unique(faces.astype(np.int64))
+    if faces.size > 0 and (faces[0] < 0 or faces[-1] >= num_faces):
+        raise InputError(f"Faces must lie in [0, {num_faces})")
+
+    # The nodes and the sides of the kept faces
+    kept_face_nodes = face_nodes[faces].astype(np.int64)
+    valid = valid_index_mask(kept_face_nodes, start_index, fill)
+    nodes = np.unique(kept_face_nodes[valid] - start_index)
+    counts = valid.sum(axis=1)
+    first = kept_face_nodes[:, :1]
+    following = np.roll(kept_face_nodes, -1, axis=1)
+    last = np.arange(num_face_nodes_max) == (counts - 1)[:, np.newaxis]
+    following = np.where(last, first, following)
+    side_a = kept_face_nodes[valid] - start_index
+    side_b = following[valid] - start_index
+    side_keys = np.minimum(side_a, side_b) * num_nodes + np.maximum(side_a, side_b)
+    edge_keys = edge_nodes.min(axis=1) * num_nodes + edge_nodes.max(axis=1)
+    edges = np.flatnonzero(np.isin(edge_keys, side_keys))
+
+    def mapping(kept, count):
+        new = np.full(count, -1, dtype=np.int64)
+        new[kept] = np.arange(kept.size)
+        return new
+
+    node_map = mapping(nodes, num_nodes)
+    edge_map = mapping(edges, num_edges)
+    face_map = mapping(faces, num_faces)
+
+    def take(array, kept, count, row_size=1):
+        # Optional arrays which are not sized for the entities are kept as they are
+        if array.size != count * row_size:
+            return array
+        return np.ascontiguousarray(array.reshape(-1, row_size)[kept]).ravel()
+
+    def remap(array, new):
+        result = remap_indices(array, np.maximum(new, 0), start_index, fill)
+        if array.size > 0:
+            valid = valid_index_mask(array, start_index, fill)
+            removed = np.zeros(array.shape, dtype=bool)
+            removed[valid] = new[array[valid] - start_index] < 0
+            result[removed] = fill
+        return result
+
+    subset = UGridMesh2D(
+        name=mesh2d.name,
+        node_x=take(mesh2d.node_x, nodes, num_nodes),
+        node_y=take(mesh2d.node_y, nodes, num_nodes),
+        edge_node=remap(take(mesh2d.edge_nodes, edges, num_edges, 2), node_map),
+        face_nodes=remap(
+            take(mesh2d.face_nodes, faces, num_faces, num_face_nodes_max), node_map
+        ),
+        edge_x=take(mesh2d.edge_x, edges, num_edges),
+        edge_y=take(mesh2d.edge_y, edges, num_edges),
+        face_x=take(mesh2d.face_x, faces, num_faces),
+        face_y=take(mesh2d.face_y, faces, num_faces),
+        edge_faces=remap(take(mesh2d.edge_faces, edges, num_edges, 2), face_map),
+        face_edges=remap(
+            take(mesh2d.face_edges, faces, num_faces, num_face_nodes_max), edge_map
+        ),
+        face_faces=remap(
+            take(mesh2d.face_faces, faces, num_faces, num_face_nodes_max), face_map
+        ),
+        node_z=take(mesh2d.node_z, nodes, num_nodes),
+        edge_z=take(mesh2d.edge_z, edges, num_edges),
+        face_z=take(mesh2d.face_z, faces, num_faces),
+        layer_zs=mesh2d.layer_zs,
+        interface_zs=mesh2d.interface_zs,
+        boundary_node_connectivity=mesh2d.boundary_node_connectivity,
+        volume_coordinates=mesh2d.volume_coordinates,
+        start_index=start_index,
+        num_face_nodes_max=num_face_nodes_max,
+        is_spherical=mesh2d.is_spherical,
+        double_fill_value=mesh2d.double_fill_value,
+        int_fill_value=fill,
+    )
+    return subset, MeshPermutation(nodes, edges, faces)
+
+
+def subset_contacts(
+    contacts: UGridContacts, faces: np.ndarray, num_faces: int
+) -> Tuple[UGridContacts, np.ndarray]:
+    """Keeps the contacts to a subset of the faces of the mesh2d they connect to.
+
+    Args:
+        contacts (UGridContacts): The contacts, from mesh1d nodes to mesh2d faces.
+        faces (ndarray): The zero-based kept faces, in their new order, such as `MeshPermutation.face`.
+        num_faces (int): The number of faces of the mesh2d before the subset.
+
+    Returns:
+        Tuple[UGridContacts, ndarray]: The kept contacts, referring to the new face indices,
+            and the index of every kept contact in the original contacts.
+    """
+    face_map = np.full(num_faces, -1, dtype=np.int64)
+    face_map[faces] = np.arange(faces.size)
+    edges = contacts.edges.reshape(-1, 2).astype(np.int64)
+    in_range = (edges[:, 1] >= 0) & (edges[:, 1] < num_faces)
+    kept = np.flatnonzero(
+        in_range & (face_map[np.where(in_range, edges[:, 1], 0)] >= 0)
+    )
+    new_edges = edges[kept].copy()
+    new_edges[:, 1] = face_map[new_edges[:, 1]]
+
+    def take_names(names):
+        return [names[i] for i in kept] if len(names) == edges.shape[0] else names
+
+    def take_values(values):
+        return values[kept] if values.size == edges.shape[0] else values
+
+    subset = UGridContacts(
+        name=contacts.name,
+        edges=new_edges.astype(contacts.edges.dtype).ravel(),
+        mesh_from_name=contacts.mesh_from_name,
+        mesh_to_name=contacts.mesh_to_name,
+        contact_type=take_values(contacts.contact_type),
+        contact_name_id=take_names(contacts.contact_name_id),
+        contact_name_long=take_names(contacts.contact_name_long),
+        mesh_from_location=contacts.mesh_from_location,
+        mesh_to_location=contacts.mesh_to_location,
+    )
+    return subset, kept
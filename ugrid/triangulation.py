@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from ugrid.py_structures import UGridMesh2D
+from ugrid.utils import face_vertex_coordinates
+
+
+class MeshTriangulation:
+    """A triangulation of the faces of a mesh2d, for rendering with tools that only draw triangles,
+    such as matplotlib `tripcolor` or VTK.
+
+    Convex faces are split in a fan around their first node, all at once.
+    Non-convex faces are split by ear clipping, one face at a time.
+    The triangles keep the orientation of their face and the triangles of a face are consecutive.
+    The triangulation is computed when first needed and cached.
+
+    Attributes:
+        mesh2d (UGridMesh2D): The triangulated mesh2d.
+    """
+
+    def __init__(self, mesh2d: UGridMesh2D):
+        self.mesh2d: UGridMesh2D = mesh2d
+        self.__triangles = None
+        self.__triangle_face = None
+
+    @property
+    def triangles(self) -> np.ndarray:
+        """The zero-based nodes of the triangles, with shape (num_triangles, 3)."""
+        if self.__triangles is None:
+            self.__triangulate()
+        return self.__triangles
+
+    @property
+    def triangle_face(self) -> np.ndarray:
+        """The zero-based face of every triangle."""
+        if self.__triangle_face is None:
+            self.__triangulate()
+        return self.__triangle_face
+
+    @property
+    def num_triangles(self) -> int:
+        """The number of triangles."""
+        return self.triangle_face.size
+
+    def face_to_triangles(self, values: np.ndarray) -> np.ndarray:
+        """Broadcasts face values to the triangles with a single gather.
+
+        Args:
+            values (ndarray): The face values, with the faces along the last axis.
+
+        Returns:
+            ndarray: The triangle values, with the triangles along the last axis.
+        """
+        return np.take(values, self.triangle_face, axis=-1)
+
+    def __triangulate(self) -> None:
+        nodes, vertex_x, vertex_y, counts = face_vertex_coordinates(self.mesh2d)
+        num_faces, num_face_nodes_max = nodes.shape
+
+        # The turn at every vertex has the sign of the face orientation for convex faces
+        previous_x = np.roll(vertex_x, 1, axis=1)
+        previous_y = np.roll(vertex_y, 1, axis=1)
+        next_x = np.roll(vertex_x, -1, axis=1)
+        next_y = np.roll(vertex_y, -1, axis=1)
+        columns = np.arange(num_face_nodes_max)
+        last = np.maximum(counts - 1, 0)[:, np.newaxis]
+        at_end = columns == last
+        # Padding repeats the first vertex, so the neighbours of the first and last vertex are fixed explicitly
+        previous_x[:, 0] = np.take_along_axis(vertex_x, last, axis=1)[:, 0]
+        previous_y[:, 0] = np.take_along_axis(vertex_y, last, axis=1)[:, 0]
+        next_x = np.where(at_end, vertex_x[:, :1], next_x)
+        next_y = np.where(at_end, vertex_y[:, :1], next_y)
+        turn = (vertex_x - previous_x) * (next_y - vertex_y) - (
+            vertex_y - previous_y
+        ) * (next_x - vertex_x)
+        turn[columns >= counts[:, np.newaxis]] = 0.0
+        convex = ~((turn > 0.0).any(axis=1) & (turn < 0.0).any(axis=1))
+        convex &= counts >= 3
+
+        # Fan triangles (0, k, k + 1) of the convex faces, ordered by face
+        num_fans = max(num_face_nodes_max - 2, 0)
+        fan = np.zeros((num_faces, num_fans, 3), dtype=np.int64)
+        fan[:, :, 0] = nodes[:, :1]
+        fan[:, :, 1] = nodes[:, 1 : num_fans + 1]
+        fan[:, :, 2] = nodes[:, 2 : num_fans + 2]
+        in_fan = (np.arange(num_fans) < (counts - 2)[:, np.newaxis]) & convex[
+            :, np.newaxis
+        ]
+        triangles = fan[in_fan]
+        triangle_face = np.repeat(np.arange(num_faces), in_fan.sum(axis=1))
+
+        concave = np.flatnonzero(~convex & (counts >= 3))
+        if concave.size > 0:
+            clipped = []
+            clipped_face = []
+            for face in concave:
+                count = counts[face]
+                local = _ear_clip(vertex_x[face, :count], vertex_y[face, :count])
+                clipped.append(nodes[face, :count][np.array(local, dtype=np.int64)])
+                clipped_face.append(np.full(len(local), face))
+            triangles = np.concatenate([triangles] + clipped)
+            triangle_face = np.concatenate([triangle_face] + clipped_face)
+            order = np.argsort(triangle_face, kind="stable")
+            triangles = triangles[order]
+            triangle_face = triangle_face[order]
+
+        self.__triangles = triangles
+        self.__triangle_face = triangle_face
+
+
+def _ear_clip(x: np.ndarray, y: np.ndarray) -> List[Tuple[int, int, int]]:
+    """Triangulates a simple polygon by ear clipping, keeping its orientation."""
+    area = np.sum(x * np.roll(y, -1) - np.roll(x, -1) * y)
+    orientation = 1.0 if area >= 0.0 else -1.0
+    remaining = list(range(x.size))
+    triangles = []
+
+    def cross(a, b, c):
+        return orientation * (
+            (x[b] - x[a]) * (y[c] - y[a]) - (y[b] - y[a]) * (x[c] - x[a])
+        )
+
+    while len(remaining) > 3:
+        size = len(remaining)
+        for i in range(size):
+            a, b, c = remaining[i - 1], remaining[i], remaining[(i + 1) % size]
+            if cross(a, b, c) <= 0.0:
+                continue
+            others = [p for p in remaining if p not in (a, b, c)]
+            if any(
+                cross(a, b, p) >= 0.0
+                and cross(b, c, p) >= 0.0
+                and cross(c, a, p) >= 0.0
+                for p in others
+            ):
+                continue
+            triangles.append((a, b, c))
+            del remaining[i]
+            break
+        else:
+            # No ear was found, the polygon is degenerate or self-intersecting
+            break
+
+    # Finish with a fan over what remains
+    for k in range(1, len(remaining) - 1):
+        triangles.append((remaining[0], remaining[k], remaining[k + 1]))
+    return triangles
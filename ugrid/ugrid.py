@@ -3,6 +3,7 @@ import logging
 import operator
 import os
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from ctypes import CDLL, byref, c_char_p, c_double, c_int
 from enum import IntEnum, unique
 from pathlib import Path
@@ -23,6 +24,12 @@ from ugrid.c_structures import (
 )
 from ugrid.errors import UGridError
 from ugrid.py_structures import UGridContacts, UGridMesh1D, UGridMesh2D, UGridNetwork1D
+from ugrid.validation import (
+    validate_contacts,
+    validate_mesh1d,
+    validate_mesh2d,
+    validate_network1d,
+)
 from ugrid.version import __version__
 
 logger = logging.getLogger(__name__)
@@ -37,13 +44,25 @@ class Status(IntEnum):
 class UGrid:
     """This class is the entry point for interacting with the UGridPy library"""
 
-    def __init__(self, file_path, method):
+    # The constants of the library, shared by all instances
+    __constants = {}
+
+    def __init__(self, file_path, method, topology_cache=None):
         """Constructor of UGrid
 
+        Args:
+            file_path (str): The path of the file to open.
+            method (str): The opening method ("r" for read, "w" for write, and "w+" for replace).
+            topology_cache (TopologyCache): A cache of the topologies shared between UGrid instances,
+                used when the file is opened for reading only.
+
         Raises:
             OSError: This gets raised in case UGrid is used within an unsupported OS.
         """
 
+        self.__file_path = str(file_path)
+        self.__method = method
+        self.__topology_cache = topology_cache if method == "r" else None
         lib_path = self.__get_library_path()
         self.lib = CDLL(str(lib_path))
         self.__open(file_path, method)
@@ -108,15 +127,26 @@ class UGrid:
 
     def __get_name_size(self):
         """Get the size of name strings"""
-        name_size = c_int(0)
-        self.__execute_function(self.lib.ug_name_get_length, byref(name_size))
-        return name_size.value
+        return self.__get_constant("ug_name_get_length")
 
     def __get_name_long_size(self):
         """Get the size of long name strings"""
-        name_long_size = c_int(0)
-        self.__execute_function(self.lib.ug_name_get_long_length, byref(name_long_size))
-        return name_long_size.value
+        return self.__get_constant("ug_name_get_long_length")
+
+    def __get_constant(self, function_name: str) -> int:
+        """Gets an integer constant of the library, such as a name size or an enum value, querying it only once
+
+        Args:
+            function_name (str): The name of the library function returning the constant.
+
+        Returns:
+            int: The constant.
+        """
+        if function_name not in UGrid.__constants:
+            constant = c_int(0)
+            self.__execute_function(getattr(self.lib, function_name), byref(constant))
+            UGrid.__constants[function_name] = constant.value
+        return UGrid.__constants[function_name]
 
     def network1d_get_num_topologies(self) -> int:
         """Gets the number of network topologies contained in the file.
@@ -160,6 +190,28 @@ class UGrid:
     def network1d_get(self, topology_id) -> UGridNetwork1D:
         """Gets the network1d data.
 
+        When the file is opened for reading with a topology cache, the network1d comes from the cache if present,
+        with read-only arrays.
+
+        Args:
+            topology_id (int): The index of the network1d topology to retrieve.
+
+        Returns:
+            UGridNetwork1D: The network1d (dimensions and data)
+        """
+
+        if self.__topology_cache is not None:
+            return self.__topology_cache.get(
+                self.__file_path,
+                "network1d",
+                topology_id,
+                lambda: self.__network1d_read(topology_id),
+            )
+        return self.__network1d_read(topology_id)
+
+    def __network1d_read(self, topology_id) -> UGridNetwork1D:
+        """Reads the network1d data from the file.
+
         Args:
             topology_id (int): The index of the network1d topology to retrieve.
 
@@ -234,14 +286,23 @@ class UGrid:
 
         return c_topology_id.value
 
-    def network1d_put(self, topology_id: int, network1d: UGridNetwork1D) -> None:
+    def network1d_put(
+        self, topology_id: int, network1d: UGridNetwork1D, validate: bool = False
+    ) -> None:
         """Writes a new network1d to UGrid file.
 
         Args:
             topology_id (int): The index of the network1d topology to write.
             network1d (UGridNetwork1D): An instance of Network1D (with dimensions and data)
+            validate (bool): Whether to validate the network1d before writing it.
+
+        Raises:
+            InputError: If `validate` is True and the network1d contains errors.
         """
 
+        if validate:
+            validate_network1d(network1d).raise_on_error()
+
         name_size = self.__get_name_size()
         name_long_size = self.__get_name_long_size()
 
@@ -299,6 +360,28 @@ class UGrid:
     def mesh1d_get(self, topology_id) -> UGridMesh1D:
         """Gets the mesh1d data.
 
+        When the file is opened for reading with a topology cache, the mesh1d comes from the cache if present,
+        with read-only arrays.
+
+        Args:
+            topology_id (int): The index of the mesh1d topology to retrieve.
+
+        Returns:
+            UGridMesh1D: The mesh1d (dimensions and data)
+        """
+
+        if self.__topology_cache is not None:
+            return self.__topology_cache.get(
+                self.__file_path,
+                "mesh1d",
+                topology_id,
+                lambda: self.__mesh1d_read(topology_id),
+            )
+        return self.__mesh1d_read(topology_id)
+
+    def __mesh1d_read(self, topology_id) -> UGridMesh1D:
+        """Reads the mesh1d data from the file.
+
         Args:
             topology_id (int): The index of the mesh1d topology to retrieve.
 
@@ -366,14 +449,23 @@ class UGrid:
 
         return c_topology_id.value
 
-    def mesh1d_put(self, topology_id: int, mesh1d: UGridMesh1D) -> None:
+    def mesh1d_put(
+        self, topology_id: int, mesh1d: UGridMesh1D, validate: bool = False
+    ) -> None:
         """Writes a new mesh1d to UGrid file.
 
         Args:
             topology_id (int): The index of the mesh1d topology to write.
             mesh1d (UGridMesh1D): An instance of mesh1d (with dimensions and data)
+            validate (bool): Whether to validate the mesh1d before writing it.
+
+        Raises:
+            InputError: If `validate` is True and the mesh1d contains errors.
         """
 
+        if validate:
+            validate_mesh1d(mesh1d).raise_on_error()
+
         name_size = self.__get_name_size()
         name_long_size = self.__get_name_long_size()
 
@@ -434,6 +526,28 @@ class UGrid:
     def mesh2d_get(self, topology_id) -> UGridMesh2D:
         """Gets the mesh2d data.
 
+        When the file is opened for reading with a topology cache, the mesh2d comes from the cache if present,
+        with read-only arrays.
+
+        Args:
+            topology_id (int): The index of the mesh2d topology to retrieve.
+
+        Returns:
+            UGridMesh2D: The mesh2d (dimensions and data)
+        """
+
+        if self.__topology_cache is not None:
+            return self.__topology_cache.get(
+                self.__file_path,
+                "mesh2d",
+                topology_id,
+                lambda: self.__mesh2d_read(topology_id),
+            )
+        return self.__mesh2d_read(topology_id)
+
+    def __mesh2d_read(self, topology_id) -> UGridMesh2D:
+        """Reads the mesh2d data from the file.
+
         Args:
             topology_id (int): The index of the mesh2d topology to retrieve.
 
@@ -488,14 +602,23 @@ class UGrid:
 
         return c_topology_id.value
 
-    def mesh2d_put(self, topology_id: int, ugrid_mesh2d: UGridMesh2D) -> None:
+    def mesh2d_put(
+        self, topology_id: int, ugrid_mesh2d: UGridMesh2D, validate: bool = False
+    ) -> None:
         """Writes a new mesh2d in a UGrid file.
 
         Args:
             topology_id (int): The index of the mesh2d topology to write.
             ugrid_mesh2d (UGridMesh2D): A mesh2d (dimensions and data)
+            validate (bool): Whether to validate the mesh2d before writing it.
+
+        Raises:
+            InputError: If `validate` is True and the mesh2d contains errors.
         """
 
+        if validate:
+            validate_mesh2d(ugrid_mesh2d).raise_on_error()
+
         name_size = self.__get_name_size()
         c_ugrid_mesh2d = CUGridMesh2D.from_py_structure(ugrid_mesh2d, name_size)
 
@@ -718,6 +841,28 @@ class UGrid:
     def contacts_get(self, topology_id) -> UGridContacts:
         """Gets the contacts data.
 
+        When the file is opened for reading with a topology cache, the contacts comes from the cache if present,
+        with read-only arrays.
+
+        Args:
+            topology_id (int): The index of the contacts topology to retrieve.
+
+        Returns:
+            UGridContacts: The contacts (dimensions and data)
+        """
+
+        if self.__topology_cache is not None:
+            return self.__topology_cache.get(
+                self.__file_path,
+                "contacts",
+                topology_id,
+                lambda: self.__contacts_read(topology_id),
+            )
+        return self.__contacts_read(topology_id)
+
+    def __contacts_read(self, topology_id) -> UGridContacts:
+        """Reads the contacts data from the file.
+
         Args:
             topology_id (int): The index of the contacts topology to retrieve.
 
@@ -760,6 +905,48 @@ class UGrid:
 
         return ugrid_contacts
 
+    def read_all(self, max_workers: int = None) -> dict:
+        """Reads every topology of every kind contained in the file.
+
+        The name sizes and enum values are queried once and shared by all the reads. Every topology is still
+        read by its own `*_get`, with its own inquiry and newly allocated arrays, since those arrays are returned.
+        With more than one worker and a file opened for reading, the topologies are read concurrently by a thread pool,
+        each through its own UGrid opened on the same file, since a UGrid must not be used by two threads at once.
+        Whether the reads actually overlap depends on the thread safety of the netCDF and HDF5 builds linked
+        to the library.
+
+        Args:
+            max_workers (int): The number of threads, the topologies are read one after the other when not given.
+
+        Returns:
+            dict: The lists of UGridNetwork1D, UGridMesh1D, UGridMesh2D and UGridContacts,
+                keyed by "network1d", "mesh1d", "mesh2d" and "contacts".
+        """
+
+        kinds = ("network1d", "mesh1d", "mesh2d", "contacts")
+        tasks = [
+            (kind, topology_id)
+            for kind in kinds
+            for topology_id in range(getattr(self, f"{kind}_get_num_topologies")())
+        ]
+
+        if max_workers is None or max_workers <= 1 or self.__method != "r":
+            values = [getattr(self, f"{kind}_get")(i) for kind, i in tasks]
+        else:
+
+            def read(task):
+                kind, topology_id = task
+                with UGrid(self.__file_path, "r", self.__topology_cache) as ug:
+                    return getattr(ug, f"{kind}_get")(topology_id)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                values = list(executor.map(read, tasks))
+
+        topologies = {kind: [] for kind in kinds}
+        for (kind, _), value in zip(tasks, values):
+            topologies[kind].append(value)
+        return topologies
+
     def contacts_define(self, contacts: UGridContacts) -> int:
         """Defines a new contacts in a UGrid file.
 
@@ -788,13 +975,21 @@ class UGrid:
 
         return c_topology_id.value
 
-    def contacts_put(self, topology_id: int, contacts: UGridContacts) -> None:
+    def contacts_put(
+        self, topology_id: int, contacts: UGridContacts, validate: bool = False
+    ) -> None:
         """Writes a new contacts in a UGrid file.
 
         Args:
             topology_id (int): The index of the contacts topology to write.
             contacts (UGridContacts): A contacts (dimensions and data)
+            validate (bool): Whether to validate the contacts before writing them.
+
+        Raises:
+            InputError: If `validate` is True and the contacts contain errors.
         """
+        if validate:
+            validate_contacts(contacts).raise_on_error()
         name_size = self.__get_name_size()
         name_long_size = self.__get_name_long_size()
 
@@ -856,11 +1051,7 @@ class UGrid:
             int: The node location enum value
         """
 
-        location = c_int(0)
-        self.__execute_function(
-            self.lib.ug_entity_get_node_location_enum, byref(location)
-        )
-        return location.value
+        return self.__get_constant("ug_entity_get_node_location_enum")
 
     def entity_get_edge_location_enum(self) -> int:
         """Get the edge location enum value
@@ -869,11 +1060,7 @@ class UGrid:
             int: The edge location enum value
         """
 
-        location = c_int(0)
-        self.__execute_function(
-            self.lib.ug_entity_get_edge_location_enum, byref(location)
-        )
-        return location.value
+        return self.__get_constant("ug_entity_get_edge_location_enum")
 
     def entity_get_face_location_enum(self) -> int:
         """Get the face location enum value
@@ -882,11 +1069,7 @@ class UGrid:
             int: The face location enum value
         """
 
-        location = c_int(0)
-        self.__execute_function(
-            self.lib.ug_entity_get_face_location_enum, byref(location)
-        )
-        return location.value
+        return self.__get_constant("ug_entity_get_face_location_enum")
 
     def topology_get_network1d_enum(self) -> int:
         """Gets the topology enum value associated with network1d.
@@ -894,12 +1077,7 @@ class UGrid:
         Returns:
             int: the topology enum value associated with network1d.
         """
-        topology_enum = c_int(0)
-        self.__execute_function(
-            self.lib.ug_topology_get_network1d_enum, byref(topology_enum)
-        )
-
-        return topology_enum.value
+        return self.__get_constant("ug_topology_get_network1d_enum")
 
     def topology_get_mesh1d_enum(self) -> int:
         """Gets the topology enum value associated with mesh1d.
@@ -907,12 +1085,7 @@ class UGrid:
         Returns:
             int: the topology enum value associated with mesh1d.
         """
-        topology_enum = c_int(0)
-        self.__execute_function(
-            self.lib.ug_topology_get_mesh1d_enum, byref(topology_enum)
-        )
-
-        return topology_enum.value
+        return self.__get_constant("ug_topology_get_mesh1d_enum")
 
     def topology_get_mesh2d_enum(self) -> int:
         """Gets the topology enum value associated with mesh2d.
@@ -920,12 +1093,7 @@ class UGrid:
         Returns:
             int: the topology enum value associated with mesh2d.
         """
-        topology_enum = c_int(0)
-        self.__execute_function(
-            self.lib.ug_topology_get_mesh2d_enum, byref(topology_enum)
-        )
-
-        return topology_enum.value
+        return self.__get_constant("ug_topology_get_mesh2d_enum")
 
     def topology_get_contacts_enum(self) -> int:
         """Gets the topology enum value associated with contacts.
@@ -933,12 +1101,7 @@ class UGrid:
         Returns:
             int: the topology enum value associated with contacts.
         """
-        topology_enum = c_int(0)
-        self.__execute_function(
-            self.lib.ug_topology_get_contacts_enum, byref(topology_enum)
-        )
-
-        return topology_enum.value
+        return self.__get_constant("ug_topology_get_contacts_enum")
 
     def __topology_count_data_variables(
         self, topology_id: int, topology_type: int, location: int
@@ -990,7 +1153,7 @@ class UGrid:
 
         string_buffer_encoded = c_char_p(string_buffer.encode("ASCII"))
         self.__execute_function(
-            self.lib.ug_topology_count_data_variables,
+            self.lib.ug_topology_get_data_variables_names,
             self._file_id,
             c_int(topology_type),
             c_int(topology_id),
@@ -1002,7 +1165,34 @@ class UGrid:
             string_buffer_encoded.value, num_data_variables, name_long_size
         )
 
-        return attribute_list.value
+        return attribute_list
+
+    def topology_inquire(self, topology: str, topology_id: int) -> dict:
+        """Gets the dimensions of a topology, such as its number of nodes, without reading its data.
+
+        Args:
+            topology (str): The kind of topology ("network1d", "mesh1d", "mesh2d" or "contacts").
+            topology_id (int): The index of the topology.
+
+        Returns:
+            dict: The integer "num_" fields filled by the inquiry, such as "num_nodes" or "num_faces".
+        """
+
+        inquire = {
+            "network1d": self.__network1d_inquire,
+            "mesh1d": self.__mesh1d_inquire,
+            "mesh2d": self.__mesh2d_inquire,
+            "contacts": self.__contacts_inquire,
+        }
+        if topology not in inquire:
+            raise ValueError(f"Unsupported topology: {topology}")
+
+        c_topology = inquire[topology](topology_id)
+        counts = {}
+        for field_name, field_type in c_topology._fields_:
+            if field_name.startswith("num_") and field_type is c_int:
+                counts[field_name] = getattr(c_topology, field_name)
+        return counts
 
     def __adjust_name(self, name: str) -> str:
         long_name = self.__get_name_long_size()
@@ -1096,11 +1286,11 @@ class UGrid:
 
         return attribute_list
 
-    def __variable_get_dimensions(self, variable_name) -> np.ndarray:
-        """Gets the variable dimensions
+    def variable_get_dimensions(self, variable_name: str) -> np.ndarray:
+        """Gets the variable dimensions, to reshape the flat data of a variable
 
         Args:
-            data_variable_name (str): The data variable name.
+            variable_name (str): The variable name.
 
         Returns:
             np.ndarray: An array with the dimension values
@@ -1136,7 +1326,7 @@ class UGrid:
             np.ndarray: A numpy array with the variable data
         """
 
-        dimension_vec = self.__variable_get_dimensions(variable_name)
+        dimension_vec = self.variable_get_dimensions(variable_name)
         data_vec_dimension = functools.reduce(operator.mul, dimension_vec)
 
         data_vec = np.empty(data_vec_dimension, dtype=np.double)
@@ -1162,7 +1352,7 @@ class UGrid:
             np.ndarray: A numpy array with the variable data
         """
 
-        dimension_vec = self.__variable_get_dimensions(variable_name)
+        dimension_vec = self.variable_get_dimensions(variable_name)
 
         data_vec_dimension = functools.reduce(operator.mul, dimension_vec)
 
@@ -1 +1,202 @@
 # def decode_byte_vectors(cNetwork1D: CNetwork1D, network1D: Network1D) -> None:
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+
+def valid_index_mask(
+    indices: np.ndarray, start_index: int, int_fill_value: int
+) -> np.ndarray:
+    """Flags the entries of an index array which are not fill values.
+
+    Args:
+        indices (ndarray): An index array, such as face_nodes or edge_faces.
+        start_index (int): The start index used in the array.
+        int_fill_value (int): The fill value used for missing indices.
+
+    Returns:
+        ndarray: A boolean array, True where the entry refers to an existing entity.
+    """
+    return (indices != int_fill_value) & (indices >= start_index)
+
+
+def remap_indices(
+    indices: np.ndarray, mapping: np.ndarray, start_index: int, int_fill_value: int
+) -> np.ndarray:
+    """Replaces the valid entries of an index array by their image through a zero-based mapping.
+    Fill values are left untouched and the start index is preserved.
+
+    Args:
+        indices (ndarray): An index array, such as face_nodes or edge_faces, possibly stored as doubles.
+        mapping (ndarray): For every zero-based old index, the zero-based new index.
+        start_index (int): The start index used in the array.
+        int_fill_value (int): The fill value used for missing indices.
+
+    Returns:
+        ndarray: The remapped index array, with the same dtype as the input.
+    """
+    result = indices.copy()
+    if indices.size == 0:
+        return result
+    valid = valid_index_mask(indices, start_index, int_fill_value)
+    result[valid] = mapping[indices[valid].astype(np.int64) - start_index] + start_index
+    return result
+
+
+def take_rows(array: np.ndarray, order: np.ndarray, row_size: int = 1) -> np.ndarray:
+    """Reorders a flat array made of consecutive rows of `row_size` entries.
+    Optional arrays which are not sized for `order` are returned unchanged.
+
+    Args:
+        array (ndarray): The flat array to reorder.
+        order (ndarray): The old row index at every new position.
+        row_size (int): The number of entries in each row.
+
+    Returns:
+        ndarray: The reordered flat array.
+    """
+    if array.size != order.size * row_size:
+        return array
+    return np.ascontiguousarray(array.reshape(-1, row_size)[order]).ravel()
+
+
+def find_edges(
+    first: np.ndarray, second: np.ndarray, edge_nodes: np.ndarray, num_nodes: int
+) -> np.ndarray:
+    """Locates node pairs among the edges of a mesh, whatever the orientation of either.
+    The pairs and the edges are keyed by their sorted nodes, searched with `searchsorted`.
+
+    Args:
+        first (ndarray): The zero-based first node of every pair.
+        second (ndarray): The zero-based second node of every pair.
+        edge_nodes (ndarray): The zero-based nodes of the edges, with shape (num_edges, 2).
+        num_nodes (int): A bound above every node index, used to build the keys.
+
+    Returns:
+        ndarray: For every pair, the zero-based edge joining its nodes, or -1 when there is none.
+    """
+    edges = np.full(first.size, -1, dtype=np.int64)
+    num_edges = edge_nodes.shape[0]
+    if num_edges == 0 or first.size == 0:
+        return edges
+    keys = np.minimum(first, second) * num_nodes + np.maximum(first, second)
+    edge_keys = edge_nodes.min(axis=1) * num_nodes + edge_nodes.max(axis=1)
+    sorted_edges = np.argsort(edge_keys)
+    position = np.searchsorted(edge_keys, keys, sorter=sorted_edges)
+    position = np.minimum(position, num_edges - 1)
+    found = edge_keys[sorted_edges[position]] == keys
+    edges[found] = sorted_edges[position[found]]
+    return edges
+
+
+def face_vertex_coordinates(
+    mesh2d,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Gets the nodes and their coordinates of every face of a mesh2d,
+    padded by repeating the first node of the face instead of the fill values.
+
+    Args:
+        mesh2d (UGridMesh2D): The mesh2d.
+
+    Returns:
+        Tuple[ndarray, ndarray, ndarray, ndarray]: The zero-based nodes, their x and y coordinates,
+            all with shape (num_faces, num_face_nodes_max), and the number of nodes of each face.
+    """
+    face_nodes = mesh2d.face_nodes.reshape(-1, mesh2d.num_face_nodes_max)
+    valid = valid_index_mask(face_nodes, mesh2d.start_index, mesh2d.int_fill_value)
+    counts = valid.sum(axis=1)
+    nodes = np.where(valid, face_nodes - mesh2d.start_index, 0)
+    nodes = np.where(valid, nodes, nodes[:, :1])
+    return nodes, mesh2d.node_x[nodes], mesh2d.node_y[nodes], counts
+
+
+def points_in_polygons(
+    x: np.ndarray,
+    y: np.ndarray,
+    polygons: np.ndarray,
+    vertex_x: np.ndarray,
+    vertex_y: np.ndarray,
+) -> np.ndarray:
+    """Tests whether points lie inside polygons with the crossing number rule, one polygon per point.
+
+    Args:
+        x (ndarray): The x-coordinates of the points.
+        y (ndarray): The y-coordinates of the points.
+        polygons (ndarray): The polygon to test for every point, a row of `vertex_x` and `vertex_y`.
+        vertex_x (ndarray): The x-coordinates of the polygon vertices, with shape (num_polygons, num_vertices_max).
+            Shorter polygons are padded by repeating a vertex, which produces zero length sides.
+        vertex_y (ndarray): The y-coordinates of the polygon vertices.
+
+    Returns:
+        ndarray: True for the points inside their polygon.
+    """
+    num_vertices = vertex_x.shape[1]
+    inside = np.zeros(np.shape(x), dtype=bool)
+    for k in range(num_vertices):
+        following = (k + 1) % num_vertices
+        xa, ya = vertex_x[polygons, k], vertex_y[polygons, k]
+        xb, yb = vertex_x[polygons, following], vertex_y[polygons, following]
+        straddles = (ya > y) != (yb > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossing = x < xa + (y - ya) * (xb - xa) / (yb - ya)
+        inside ^= straddles & crossing
+    return inside
+
+
+def hilbert_index(x: np.ndarray, y: np.ndarray, order: int = 16) -> np.ndarray:
+    """Computes the position of each point along a Hilbert curve covering the points bounding box.
+
+    Args:
+        x (ndarray): The x coordinates.
+        y (ndarray): The y coordinates.
+        order (int): The number of bits used to quantize each coordinate (at most 32).
+
+    Returns:
+        ndarray: The Hilbert index of each point.
+    """
+    side = 1 << order
+
+    def quantize(values):
+        values = np.asarray(values, dtype=np.double)
+        if values.size == 0:
+            return np.zeros(0, dtype=np.uint32)
+        low = values.min()
+        extent = values.max() - low
+        if extent <= 0.0:
+            return np.zeros(values.size, dtype=np.uint32)
+        return ((values - low) * ((side - 1) / extent)).astype(np.uint32)
+
+    xi = quantize(x)
+    yi = quantize(y)
+    distance = np.zeros(xi.size, dtype=np.uint64)
+
+    # Work on blocks that fit in cache, the bit loop touches every block many times
+    block_size = 1 << 16
+    for begin in range(0, xi.size, block_size):
+        end = begin + block_size
+        _hilbert_block(xi[begin:end], yi[begin:end], distance[begin:end], side)
+
+    return distance
+
+
+def _hilbert_block(xi: np.ndarray, yi: np.ndarray, distance: np.ndarray, side: int):
+    """Accumulates the Hilbert index of a block of quantized points, modifying `xi` and `yi` in place."""
+    s = side >> 1
+    while s > 0:
+        rx = (xi & s) != 0
+        ry = (yi & s) != 0
+        quadrant = (rx.astype(np.uint8) * 3) ^ ry
+        distance += quadrant.astype(np.uint64) * np.uint64(s * s)
+
+        # Rotate the quadrant so that the curve stays continuous.
+        # Only the lower bits are inspected afterwards, so reflections are done with masks.
+        ry = ~ry
+        flip = (rx & ry).astype(np.uint32) * np.uint32(s - 1)
+        xi ^= flip
+        yi ^= flip
+        swap = (xi ^ yi) & (ry.astype(np.uint32) * np.uint32(0xFFFFFFFF))
+        xi ^= swap
+        yi ^= swap
+        s >>= 1
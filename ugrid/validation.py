@@ -0,0 +1,723 @@
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from ugrid.errors import InputError
+from ugrid.py_structures import UGridContacts, UGridMesh1D, UGridMesh2D, UGridNetwork1D
+
+ERROR = "error"
+WARNING = "warning"
+
+
+class ValidationFinding:
+    """A problem found while validating a topology.
+
+    Attributes:
+        code (str): The identifier of the failed check, such as "index_out_of_range".
+        severity (str): "error" if the topology cannot be written as is, "warning" otherwise.
+        attribute (str): The name of the attribute where the problem was found.
+        message (str): A description of the problem.
+        indices (ndarray): The zero-based indices of the offending entities (nodes, edges, faces or contacts).
+    """
+
+    def __init__(
+        self, code, severity, attribute, message, indices=np.array([], dtype=np.int64)
+    ):
+        self.code: str = code
+        self.severity: str = severity
+        self.attribute: str = attribute
+        self.message: str = message
+        self.indices: np.ndarray = indices
+
+    @property
+    def count(self) -> int:
+        """The number of offending entities."""
+        return self.indices.size
+
+    def __str__(self) -> str:
+        text = f"{self.severity}: {self.attribute}: {self.message} [{self.code}]"
+        if self.count > 0:
+            shown = ", ".join(str(i) for i in self.indices[:10])
+            more = ", ..." if self.count > 10 else ""
+            text += f" ({self.count} entities: {shown}{more})"
+        return text
+
+
+class ValidationReport:
+    """The findings of the validation of a topology.
+
+    Attributes:
+        name (str): The name of the validated topology.
+        findings (list): The list of ValidationFinding.
+    """
+
+    def __init__(self, name):
+        self.name: str = name
+        self.findings: List[ValidationFinding] = []
+
+    @property
+    def errors(self) -> List[ValidationFinding]:
+        """The findings with an error severity."""
+        return [f for f in self.findings if f.severity == ERROR]
+
+    @property
+    def warnings(self) -> List[ValidationFinding]:
+        """The findings with a warning severity."""
+        return [f for f in self.findings if f.severity == WARNING]
+
+    @property
+    def is_valid(self) -> bool:
+        """True if no error was found."""
+        return len(self.errors) == 0
+
+    def raise_on_error(self) -> None:
+        """Raises an InputError describing all errors, if any.
+
+        Raises:
+            InputError: If the report contains errors.
+        """
+        if not self.is_valid:
+            raise InputError(str(self))
+
+    def add(
+        self, code: str, severity: str, attribute: str, message: str, indices=None
+    ) -> None:
+        """Adds a finding. When `indices` is given, the finding is only added if it is not empty.
+
+        Args:
+            code (str): The identifier of the failed check.
+            severity (str): "error" or "warning".
+            attribute (str): The name of the attribute where the problem was found.
+            message (str): A description of the problem.
+            indices (ndarray): The zero-based indices of the offending entities.
+        """
+        if indices is None:
+            indices = np.array([], dtype=np.int64)
+        elif indices.size == 0:
+            return
+        self.findings.append(
+            ValidationFinding(code, severity, attribute, message, indices)
+        )
+
+    def __str__(self) -> str:
+        if not self.findings:
+            return f"{self.name}: no findings"
+        lines = [
+            f"{self.name}: {len(self.errors)} errors, {len(self.warnings)} warnings"
+        ]
+        lines.extend(f"  {finding}" for finding in self.findings)
+        return "\n".join(lines)
+
+
+def _check_size(
+    report: ValidationReport, attribute: str, array, expected: int, optional=True
+) -> bool:
+    """Checks the size of an attribute, optional attributes may be empty."""
+    size = len(array)
+    if size == expected or (optional and size == 0):
+        return True
+    report.add(
+        "size_mismatch",
+        ERROR,
+        attribute,
+        f"has {size} entries, {expected} expected",
+    )
+    return False
+
+
+def _check_finite(report: ValidationReport, attribute: str, values) -> None:
+    report.add(
+        "not_finite",
+        ERROR,
+        attribute,
+        "contains NaN or infinite values",
+        np.flatnonzero(~np.isfinite(values)),
+    )
+
+
+def _check_indices(
+    report: ValidationReport,
+    attribute: str,
+    indices: np.ndarray,
+    row_size: int,
+    num_entities: int,
+    start_index: int,
+    int_fill_value,
+    target: str,
+) -> np.ndarray:
+    """Checks that an index array only refers to existing entities, or is filled.
+
+    Returns:
+        ndarray: The zero-based indices, with -1 for fill values and out of range entries.
+    """
+    indices = np.asarray(indices).reshape(-1, row_size)
+    zero_based = indices.astype(np.int64) - start_index
+    in_range = (zero_based >= 0) & (zero_based < num_entities)
+    filled = np.zeros(indices.shape, dtype=bool)
+    if int_fill_value is not None:
+        filled = indices == int_fill_value
+    out_of_range = ~in_range & ~filled
+    report.add(
+        "index_out_of_range",
+        ERROR,
+        attribute,
+        f"refers to {target} outside [{start_index}, {start_index + num_entities})",
+        np.flatnonzero(out_of_range.any(axis=1)),
+    )
+    zero_based[~in_range] = -1
+    return zero_based
+
+
+def _check_start_index(
+    report: ValidationReport, attribute: str, indices: np.ndarray, num_entities: int
+) -> None:
+    """Detects index arrays which are consistently shifted by one with respect to the start index."""
+    if any(finding.code == "start_index_mismatch" for finding in report.findings):
+        return
+    if indices.size == 0 or num_entities == 0:
+        return
+    lowest = int(indices.min())
+    highest = int(indices.max())
+    if lowest >= 1 and highest == num_entities:
+        report.add(
+            "start_index_mismatch",
+            ERROR,
+            attribute,
+            "indices range from 1 to the number of entities, but start_index is 0",
+        )
+    elif lowest == -1 and highest == num_entities - 2:
+        report.add(
+            "start_index_mismatch",
+            ERROR,
+            attribute,
+            "indices range from 0 to the number of entities - 1, but start_index is 1",
+        )
+
+
+def _check_edges(
+    report: ValidationReport,
+    attribute: str,
+    edge_nodes: np.ndarray,
+    num_nodes: int,
+    duplicate_severity: str = ERROR,
+) -> None:
+    """Checks for edges connecting a node to itself and for duplicated edges."""
+    valid = np.all(edge_nodes >= 0, axis=1)
+    report.add(
+        "degenerate_edge",
+        ERROR,
+        attribute,
+        "edges connect a node to itself",
+        np.flatnonzero(valid & (edge_nodes[:, 0] == edge_nodes[:, 1])),
+    )
+
+    edges = np.flatnonzero(valid)
+    low = np.minimum(edge_nodes[edges, 0], edge_nodes[edges, 1])
+    high = np.maximum(edge_nodes[edges, 0], edge_nodes[edges, 1])
+    keys = low * max(num_nodes, 1) + high
+
+    # Sorting the keys is cheaper than sorting indices, the positions are only needed for duplicates
+    sorted_keys = np.sort(keys)
+    if not np.any(sorted_keys[1:] == sorted_keys[:-1]):
+        return
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    repeated = np.zeros(order.size, dtype=bool)
+    repeated[1:] = sorted_keys[1:] == sorted_keys[:-1]
+    report.add(
+        "duplicate_edge",
+        duplicate_severity,
+        attribute,
+        "edges connect the same pair of nodes as a previous edge",
+        np.sort(edges[order[repeated]]),
+    )
+
+
+def _check_orphans(
+    report: ValidationReport, num_nodes: int, connectivity: np.ndarray
+) -> None:
+    used = np.zeros(num_nodes, dtype=bool)
+    used[connectivity[connectivity >= 0]] = True
+    report.add(
+        "orphan_node",
+        WARNING,
+        "node_x",
+        "nodes are not used by any edge or face",
+        np.flatnonzero(~used),
+    )
+
+
+def validate_mesh2d(mesh2d: UGridMesh2D, block_size: int = 1 << 20) -> ValidationReport:
+    """Validates a mesh2d before writing it.
+
+    The checks are: consistent array sizes, finite coordinates, start index, out of range indices,
+    degenerate and duplicated edges, fill values in the middle of faces, faces with less than three nodes,
+    repeated face nodes, degenerate and clockwise faces, `num_face_nodes_max` and orphan nodes.
+    Faces are processed in blocks of `block_size` to bound the memory use.
+
+    Args:
+        mesh2d (UGridMesh2D): The mesh2d to validate.
+        block_size (int): The number of faces checked at once.
+
+    Returns:
+        ValidationReport: The findings.
+    """
+    report = ValidationReport(mesh2d.name)
+    start_index = mesh2d.start_index
+    fill = mesh2d.int_fill_value
+    if start_index not in (0, 1):
+        report.add("start_index", ERROR, "start_index", f"{start_index} is not 0 or 1")
+
+    num_nodes = len(mesh2d.node_x)
+    if not _check_size(report, "node_y", mesh2d.node_y, num_nodes, optional=False):
+        return report
+    _check_finite(report, "node_x", mesh2d.node_x)
+    _check_finite(report, "node_y", mesh2d.node_y)
+    _check_size(report, "node_z", mesh2d.node_z, num_nodes)
+
+    if mesh2d.edge_nodes.size % 2 != 0:
+        report.add("size_mismatch", ERROR, "edge_nodes", "has an odd number of entries")
+        return report
+    num_edges = mesh2d.edge_nodes.size // 2
+    for attribute in ("edge_x", "edge_y", "edge_z"):
+        _check_size(report, attribute, getattr(mesh2d, attribute), num_edges)
+
+    edge_nodes = _check_indices(
+        report,
+        "edge_nodes",
+        mesh2d.edge_nodes,
+        2,
+        num_nodes,
+        start_index,
+        None,
+        "nodes",
+    )
+    _check_start_index(
+        report,
+        "edge_nodes",
+        mesh2d.edge_nodes.astype(np.int64) - start_index,
+        num_nodes,
+    )
+    _check_edges(report, "edge_nodes", edge_nodes, num_nodes)
+
+    num_face_nodes_max = mesh2d.num_face_nodes_max
+    face_nodes = np.empty((0, max(num_face_nodes_max, 1)), dtype=np.int64)
+    if mesh2d.face_nodes.size > 0:
+        if num_face_nodes_max < 3 or mesh2d.face_nodes.size % num_face_nodes_max != 0:
+            report.add(
+                "num_face_nodes_max",
+                ERROR,
+                "num_face_nodes_max",
+                f"{num_face_nodes_max} is inconsistent with {mesh2d.face_nodes.size} face nodes",
+            )
+            return report
+        face_nodes = _check_indices(
+            report,
+            "face_nodes",
+            mesh2d.face_nodes,
+            num_face_nodes_max,
+            num_nodes,
+            start_index,
+            fill,
+            "nodes",
+        )
+        filled = mesh2d.face_nodes.reshape(-1, num_face_nodes_max) != fill
+        _check_start_index(
+            report,
+            "face_nodes",
+            mesh2d.face_nodes.reshape(-1, num_face_nodes_max)[filled].astype(np.int64)
+            - start_index,
+            num_nodes,
+        )
+    num_faces = face_nodes.shape[0]
+
+    for attribute in ("face_x", "face_y", "face_z"):
+        _check_size(report, attribute, getattr(mesh2d, attribute), num_faces)
+    if _check_size(report, "edge_faces", mesh2d.edge_faces, 2 * num_edges):
+        _check_indices(
+            report,
+            "edge_faces",
+            mesh2d.edge_faces,
+            2,
+            num_faces,
+            start_index,
+            fill,
+            "faces",
+        )
+    row_size = max(num_face_nodes_max, 1)
+    if _check_size(report, "face_edges", mesh2d.face_edges, num_faces * row_size):
+        _check_indices(
+            report,
+            "face_edges",
+            mesh2d.face_edges,
+            row_size,
+            num_edges,
+            start_index,
+            fill,
+            "edges",
+        )
+    if _check_size(report, "face_faces", mesh2d.face_faces, num_faces * row_size):
+        _check_indices(
+            report,
+            "face_faces",
+            mesh2d.face_faces,
+            row_size,
+            num_faces,
+            start_index,
+            fill,
+            "faces",
+        )
+
+    if num_faces > 0:
+        _check_faces(report, mesh2d, face_nodes, block_size)
+
+    # In a consistent mesh2d every face node is on an edge, faces are only used without edges
+    _check_orphans(report, num_nodes, edge_nodes if num_edges > 0 else face_nodes)
+    return report
+
+
+def _check_faces(
+    report: ValidationReport,
+    mesh2d: UGridMesh2D,
+    face_nodes: np.ndarray,
+    block_size: int,
+) -> None:
+    """Checks the shape and orientation of the faces, block by block."""
+    num_faces, num_face_nodes_max = face_nodes.shape
+    node_x = np.asarray(mesh2d.node_x, dtype=np.double)
+    node_y = np.asarray(mesh2d.node_y, dtype=np.double)
+    fill_marks = -1 - np.arange(num_face_nodes_max)
+    findings = {
+        "face_padding": [],
+        "too_few_nodes": [],
+        "repeated_node": [],
+        "degenerate_face": [],
+        "clockwise_face": [],
+    }
+    largest_face = 0
+
+    for begin in range(0, num_faces, block_size):
+        rows = face_nodes[begin : begin + block_size]
+        offset = np.int64(begin)
+        valid = rows >= 0
+        counts = valid.sum(axis=1)
+        largest_face = max(largest_face, int(counts.max()))
+
+        # Valid nodes must precede the fill values
+        padded_inside = np.any(valid[:, 1:] & ~valid[:, :-1], axis=1)
+        findings["face_padding"].append(np.flatnonzero(padded_inside) + offset)
+        findings["too_few_nodes"].append(np.flatnonzero(counts < 3) + offset)
+
+        marked = np.where(valid, rows, fill_marks)
+        marked.sort(axis=1)
+        repeated = np.any(marked[:, 1:] == marked[:, :-1], axis=1)
+        findings["repeated_node"].append(np.flatnonzero(repeated) + offset)
+
+        # Signed area with the shoelace formula, relative to the first node
+        safe = np.where(valid, rows, rows[:, :1].clip(min=0))
+        x = node_x[safe] - node_x[safe[:, :1]]
+        y = node_y[safe] - node_y[safe[:, :1]]
+        # The last node is followed by the first one, which lies at the origin
+        x_next = np.roll(x, -1, axis=1)
+        y_next = np.roll(y, -1, axis=1)
+        partial = np.flatnonzero((counts > 0) & (counts < num_face_nodes_max))
+        x_next[partial, counts[partial] - 1] = 0.0
+        y_next[partial, counts[partial] - 1] = 0.0
+        cross = np.where(valid, x * y_next - x_next * y, 0.0)
+        area = cross.sum(axis=1)
+        scale = np.abs(cross).sum(axis=1)
+        checked = (counts >= 3) & ~padded_inside & ~repeated
+        degenerate = checked & (np.abs(area) <= 1e-12 * scale)
+        findings["degenerate_face"].append(np.flatnonzero(degenerate) + offset)
+        findings["clockwise_face"].append(
+            np.flatnonzero(checked & ~degenerate & (area < 0.0)) + offset
+        )
+
+    messages = {
+        "face_padding": (ERROR, "faces have fill values before valid nodes"),
+        "too_few_nodes": (ERROR, "faces have less than three nodes"),
+        "repeated_node": (ERROR, "faces use the same node more than once"),
+        "degenerate_face": (ERROR, "faces have a zero area"),
+        "clockwise_face": (WARNING, "faces are ordered clockwise"),
+    }
+    for code, blocks in findings.items():
+        severity, message = messages[code]
+        report.add(code, severity, "face_nodes", message, np.concatenate(blocks))
+
+    if largest_face < mesh2d.num_face_nodes_max:
+        report.add(
+            "num_face_nodes_max",
+            WARNING,
+            "num_face_nodes_max",
+            f"is {mesh2d.num_face_nodes_max}, but the largest face has {largest_face} nodes",
+        )
+
+
+def validate_mesh1d(
+    mesh1d: UGridMesh1D, network1d: UGridNetwork1D = None
+) -> ValidationReport:
+    """Validates a mesh1d before writing it.
+
+    The checks are: consistent array sizes, finite values, start index, out of range indices,
+    degenerate and duplicated edges and orphan nodes. When the network1d is given,
+    the network edge ids and the offsets along the network edges are checked as well.
+
+    Args:
+        mesh1d (UGridMesh1D): The mesh1d to validate.
+        network1d (UGridNetwork1D): The network1d the mesh1d is defined on, optional.
+
+    Returns:
+        ValidationReport: The findings.
+    """
+    report = ValidationReport(mesh1d.name)
+    start_index = mesh1d.start_index
+    if start_index not in (0, 1):
+        report.add("start_index", ERROR, "start_index", f"{start_index} is not 0 or 1")
+
+    num_nodes = len(mesh1d.node_edge_id)
+    if not _check_size(
+        report, "node_edge_offset", mesh1d.node_edge_offset, num_nodes, optional=False
+    ):
+        return report
+    _check_finite(report, "node_edge_offset", mesh1d.node_edge_offset)
+    for attribute in ("node_x", "node_y", "node_name_id", "node_name_long"):
+        _check_size(report, attribute, getattr(mesh1d, attribute), num_nodes)
+
+    if mesh1d.edge_node.size % 2 != 0:
+        report.add("size_mismatch", ERROR, "edge_node", "has an odd number of entries")
+        return report
+    num_edges = mesh1d.edge_node.size // 2
+    for attribute in ("edge_edge_id", "edge_edge_offset", "edge_x", "edge_y"):
+        _check_size(report, attribute, getattr(mesh1d, attribute), num_edges)
+
+    edge_nodes = _check_indices(
+        report, "edge_node", mesh1d.edge_node, 2, num_nodes, start_index, None, "nodes"
+    )
+    _check_start_index(
+        report, "edge_node", mesh1d.edge_node.astype(np.int64) - start_index, num_nodes
+    )
+    _check_edges(report, "edge_node", edge_nodes, num_nodes)
+
+    if network1d is not None:
+        num_network_edges = network1d.edge_node.size // 2
+        network_start_index = network1d.start_index
+        for id_attribute, offset_attribute in (
+            ("node_edge_id", "node_edge_offset"),
+            ("edge_edge_id", "edge_edge_offset"),
+        ):
+            ids = getattr(mesh1d, id_attribute)
+            offsets = getattr(mesh1d, offset_attribute)
+            if ids.size == 0 or ids.size != offsets.size:
+                continue
+            network_edges = _check_indices(
+                report,
+                id_attribute,
+                ids,
+                1,
+                num_network_edges,
+                network_start_index,
+                None,
+                "network edges",
+            ).ravel()
+            inside = network_edges >= 0
+            if network1d.edge_length.size == num_network_edges:
+                lengths = np.asarray(network1d.edge_length, dtype=np.double)
+                length = lengths[np.where(inside, network_edges, 0)]
+                tolerance = 1e-6 * np.maximum(length, 1.0)
+                outside = inside & (
+                    (offsets < -tolerance) | (offsets > length + tolerance)
+                )
+                report.add(
+                    "offset_out_of_range",
+                    ERROR,
+                    offset_attribute,
+                    "offsets are outside [0, edge_length] of their network edge",
+                    np.flatnonzero(outside),
+                )
+
+    _check_orphans(report, num_nodes, edge_nodes)
+    return report
+
+
+def validate_network1d(network1d: UGridNetwork1D) -> ValidationReport:
+    """Validates a network1d before writing it.
+
+    The checks are: consistent array sizes, finite values, start index, out of range indices,
+    degenerate and duplicated branches, non positive branch lengths,
+    branch geometries not starting and ending at the branch nodes, and orphan nodes.
+
+    Args:
+        network1d (UGridNetwork1D): The network1d to validate.
+
+    Returns:
+        ValidationReport: The findings.
+    """
+    report = ValidationReport(network1d.name)
+    start_index = network1d.start_index
+    if start_index not in (0, 1):
+        report.add("start_index", ERROR, "start_index", f"{start_index} is not 0 or 1")
+
+    num_nodes = len(network1d.node_x)
+    if not _check_size(report, "node_y", network1d.node_y, num_nodes, optional=False):
+        return report
+    _check_finite(report, "node_x", network1d.node_x)
+    _check_finite(report, "node_y", network1d.node_y)
+    _check_size(report, "node_id", network1d.node_id, num_nodes)
+    _check_size(report, "node_long_name", network1d.node_long_name, num_nodes)
+
+    if network1d.edge_node.size % 2 != 0:
+        report.add("size_mismatch", ERROR, "edge_node", "has an odd number of entries")
+        return report
+    num_edges = network1d.edge_node.size // 2
+    _check_size(report, "edge_length", network1d.edge_length, num_edges, optional=False)
+    for attribute in ("edge_order", "edge_id", "edge_long_name"):
+        _check_size(report, attribute, getattr(network1d, attribute), num_edges)
+    report.add(
+        "non_positive_length",
+        ERROR,
+        "edge_length",
+        "branches have a length smaller than or equal to zero",
+        np.flatnonzero(~(np.asarray(network1d.edge_length) > 0.0)),
+    )
+
+    edge_nodes = _check_indices(
+        report,
+        "edge_node",
+        network1d.edge_node,
+        2,
+        num_nodes,
+        start_index,
+        None,
+        "nodes",
+    )
+    _check_start_index(
+        report,
+        "edge_node",
+        network1d.edge_node.astype(np.int64) - start_index,
+        num_nodes,
+    )
+    _check_edges(report, "edge_node", edge_nodes, num_nodes, duplicate_severity=WARNING)
+
+    num_geometry_nodes = len(network1d.geometry_nodes_x)
+    counts = np.asarray(network1d.num_edge_geometry_nodes, dtype=np.int64)
+    _check_size(
+        report, "geometry_nodes_y", network1d.geometry_nodes_y, num_geometry_nodes
+    )
+    if _check_size(
+        report, "num_edge_geometry_nodes", counts, num_edges, optional=False
+    ):
+        if counts.sum() != num_geometry_nodes:
+            report.add(
+                "size_mismatch",
+                ERROR,
+                "num_edge_geometry_nodes",
+                f"sums to {counts.sum()}, but there are {num_geometry_nodes} geometry nodes",
+            )
+        else:
+            report.add(
+                "too_few_nodes",
+                ERROR,
+                "num_edge_geometry_nodes",
+                "branch geometries have less than two nodes",
+                np.flatnonzero(counts < 2),
+            )
+            _check_geometry_ends(report, network1d, edge_nodes, counts)
+
+    _check_orphans(report, num_nodes, edge_nodes)
+    return report
+
+
+def _check_geometry_ends(
+    report: ValidationReport,
+    network1d: UGridNetwork1D,
+    edge_nodes: np.ndarray,
+    counts: np.ndarray,
+) -> None:
+    """Checks that the branch geometries start and end at the branch nodes."""
+    checked = np.flatnonzero((counts >= 2) & np.all(edge_nodes >= 0, axis=1))
+    ends = np.cumsum(counts)
+    first = (ends - counts)[checked]
+    last = ends[checked] - 1
+    geometry_x = np.asarray(network1d.geometry_nodes_x, dtype=np.double)
+    geometry_y = np.asarray(network1d.geometry_nodes_y, dtype=np.double)
+    node_x = np.asarray(network1d.node_x, dtype=np.double)
+    node_y = np.asarray(network1d.node_y, dtype=np.double)
+    from_node = edge_nodes[checked, 0]
+    to_node = edge_nodes[checked, 1]
+    scale = 1e-6 * np.maximum(np.abs(network1d.edge_length[checked]), 1.0)
+    mismatch = (
+        np.hypot(
+            geometry_x[first] - node_x[from_node], geometry_y[first] - node_y[from_node]
+        )
+        > scale
+    ) | (
+        np.hypot(geometry_x[last] - node_x[to_node], geometry_y[last] - node_y[to_node])
+        > scale
+    )
+    report.add(
+        "geometry_ends",
+        WARNING,
+        "geometry_nodes_x",
+        "branch geometries do not start and end at the branch nodes",
+        checked[mismatch],
+    )
+
+
+def validate_contacts(
+    contacts: UGridContacts, num_from_entities: int = None, num_to_entities: int = None
+) -> ValidationReport:
+    """Validates contacts before writing them.
+
+    The checks are: consistent array sizes, negative indices and duplicated contacts.
+    When the number of entities of the connected meshes at `mesh_from_location` and `mesh_to_location`
+    are given, the contact indices are range checked as well.
+
+    Args:
+        contacts (UGridContacts): The contacts to validate.
+        num_from_entities (int): The number of entities at the contact start, optional.
+        num_to_entities (int): The number of entities at the contact end, optional.
+
+    Returns:
+        ValidationReport: The findings.
+    """
+    report = ValidationReport(contacts.name)
+    if contacts.edges.size % 2 != 0:
+        report.add("size_mismatch", ERROR, "edges", "has an odd number of entries")
+        return report
+    num_contacts = contacts.edges.size // 2
+    _check_size(report, "contact_type", contacts.contact_type, num_contacts)
+    for attribute in ("contact_name_id", "contact_name_long"):
+        names = getattr(contacts, attribute)
+        if isinstance(names, list):
+            _check_size(report, attribute, names, num_contacts)
+
+    edges = np.asarray(contacts.edges, dtype=np.int64).reshape(-1, 2)
+    for column, num_entities, side in (
+        (0, num_from_entities, "from"),
+        (1, num_to_entities, "to"),
+    ):
+        invalid = edges[:, column] < 0
+        message = f"contacts refer to negative mesh {side} entities"
+        if num_entities is not None:
+            invalid |= edges[:, column] >= num_entities
+            message = (
+                f"contacts refer to mesh {side} entities outside [0, {num_entities})"
+            )
+        report.add(
+            "index_out_of_range", ERROR, "edges", message, np.flatnonzero(invalid)
+        )
+
+    keys = edges[:, 0] * (int(edges[:, 1].max(initial=0)) + 1) + edges[:, 1]
+    order = np.argsort(keys, kind="stable")
+    repeated = np.zeros(order.size, dtype=bool)
+    repeated[1:] = keys[order[1:]] == keys[order[:-1]]
+    report.add(
+        "duplicate_contact",
+        WARNING,
+        "edges",
+        "contacts connect the same entities as a previous contact",
+        np.sort(order[repeated]),
+    )
+    return report
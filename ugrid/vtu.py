@@ -0,0 +1,451 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+from xml.sax.saxutils import quoteattr
+
+import numpy as np
+
+from ugrid.errors import InputError, UGridError
+from ugrid.file_inventory import inventory
+from ugrid.netcdf_classic import read_classic_header
+from ugrid.network import NetworkPolylines
+from ugrid.py_structures import UGridMesh1D, UGridMesh2D, UGridNetwork1D
+from ugrid.ugrid import UGrid
+from ugrid.utils import valid_index_mask
+
+# The VTK cell types used for the topologies
+VTK_LINE = 3
+VTK_POLY_LINE = 4
+VTK_TRIANGLE = 5
+VTK_POLYGON = 7
+VTK_QUAD = 9
+
+# The VTK names of the types of the arrays
+VTK_TYPES = {
+    np.dtype("int8"): "Int8",
+    np.dtype("uint8"): "UInt8",
+    np.dtype("int16"): "Int16",
+    np.dtype("uint16"): "UInt16",
+    np.dtype("int32"): "Int32",
+    np.dtype("uint32"): "UInt32",
+    np.dtype("int64"): "Int64",
+    np.dtype("uint64"): "UInt64",
+    np.dtype("float32"): "Float32",
+    np.dtype("float64"): "Float64",
+}
+
+
+class VtuGeometry:
+    """The points and cells of a topology, as stored in a VTK unstructured grid.
+
+    The faces of a mesh2d become triangles, quadrilaterals or polygons, depending on their number of nodes.
+    The edges of a mesh1d become lines between its nodes. The branches of a network1d become poly-lines
+    through their geometry nodes. All arrays are little-endian and contiguous, ready to be written.
+
+    Attributes:
+        points (ndarray): The coordinates of the points, with a shape (num_points, 3).
+        connectivity (ndarray): The zero-based points of all cells, one cell after the other.
+        offsets (ndarray): The end of every cell in the connectivity.
+        types (ndarray): The VTK cell type of every cell.
+    """
+
+    def __init__(self, points, connectivity, offsets, types):
+        self.points: np.ndarray = _little_endian(points)
+        self.connectivity: np.ndarray = _little_endian(connectivity)
+        self.offsets: np.ndarray = _little_endian(offsets)
+        self.types: np.ndarray = _little_endian(types)
+
+    @property
+    def num_points(self) -> int:
+        """The number of points."""
+        return self.points.shape[0]
+
+    @property
+    def num_cells(self) -> int:
+        """The number of cells."""
+        return self.offsets.size
+
+    @staticmethod
+    def from_topology(topology) -> VtuGeometry:
+        """Creates the geometry of a mesh2d, a mesh1d or a network1d.
+
+        Args:
+            topology: A UGridMesh2D, UGridMesh1D or UGridNetwork1D.
+
+        Returns:
+            VtuGeometry: The points and cells.
+
+        Raises:
+            InputError: If the topology is not supported, or if faces of a mesh2d have no nodes.
+        """
+        if isinstance(topology, UGridMesh2D):
+            face_nodes = topology.face_nodes.reshape(-1, topology.num_face_nodes_max)
+            valid = valid_index_mask(
+                face_nodes, topology.start_index, topology.int_fill_value
+            )
+            counts = valid.sum(axis=1)
+            empty = np.flatnonzero(counts == 0)
+            if empty.size > 0:
+                # Dropping them would shift the data of the following faces
+                raise InputError(
+                    f"{empty.size} faces have no nodes, such as face {empty[0]}"
+                )
+            # The fill values pad the end of the rows, the valid nodes keep their order
+            connectivity = face_nodes[valid].astype(np.int64) - topology.start_index
+            types = np.full(counts.size, VTK_POLYGON, dtype=np.uint8)
+            types[counts == 3] = VTK_TRIANGLE
+            types[counts == 4] = VTK_QUAD
+            return VtuGeometry(
+                _points(topology.node_x, topology.node_y, topology.node_z),
+                connectivity,
+                np.cumsum(counts, dtype=np.int64),
+                types,
+            )
+        if isinstance(topology, UGridMesh1D):
+            edge_nodes = topology.edge_node.astype(np.int64) - topology.start_index
+            num_edges = edge_nodes.size // 2
+            return VtuGeometry(
+                _points(topology.node_x, topology.node_y),
+                edge_nodes,
+                np.arange(2, 2 * num_edges + 1, 2, dtype=np.int64),
+                np.full(num_edges, VTK_LINE, dtype=np.uint8),
+            )
+        if isinstance(topology, UGridNetwork1D):
+            polylines = NetworkPolylines.from_network1d(topology)
+            return VtuGeometry(
+                _points(polylines.x, polylines.y),
+                np.arange(polylines.x.size, dtype=np.int64),
+                polylines.node_offsets[1:].astype(np.int64),
+                np.full(polylines.num_branches, VTK_POLY_LINE, dtype=np.uint8),
+            )
+        raise InputError(f"Cannot convert a {type(topology).__name__} to VTK")
+
+
+def write_vtu(
+    path,
+    geometry: VtuGeometry,
+    cell_data: Dict[str, np.ndarray] = None,
+    point_data: Dict[str, np.ndarray] = None,
+) -> None:
+    """Writes a VTK unstructured grid file (.vtu) with binary appended data.
+
+    Args:
+        path (str): The file to write.
+        geometry (VtuGeometry): The points and cells, such as `VtuGeometry.from_topology(mesh2d)`.
+        cell_data (Dict[str, ndarray]): The values of every cell, with a shape (num_cells,)
+            or (num_cells, num_components), keyed by name.
+        point_data (Dict[str, ndarray]): The values of every point, with a shape (num_points,)
+            or (num_points, num_components), keyed by name.
+    """
+    cell_data = _check_data(cell_data, geometry.num_cells, "cell")
+    point_data = _check_data(point_data, geometry.num_points, "point")
+
+    arrays = []
+    offset = 0
+
+    def data_array(name, values, components=None):
+        nonlocal offset
+        attributes = f'type="{VTK_TYPES[values.dtype.newbyteorder("=")]}"'
+        if name is not None:
+            attributes += f" Name={quoteattr(name)}"
+        if components is not None:
+            attributes += f' NumberOfComponents="{components}"'
+        arrays.append(values)
+        element = f'<DataArray {attributes} format="appended" offset="{offset}"/>'
+        offset += 8 + values.nbytes
+        return element
+
+    def data_section(tag, data):
+        elements = [
+            data_array(name, values, 1 if values.ndim == 1 else int(values.shape[1]))
+            for name, values in data.items()
+        ]
+        return [f"<{tag}>"] + [f"  {e}" for e in elements] + [f"</{tag}>"]
+
+    lines = [
+        '<?xml version="1.0"?>',
+        '<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" header_type="UInt64">',
+        "<UnstructuredGrid>",
+        f'<Piece NumberOfPoints="{geometry.num_points}" NumberOfCells="{geometry.num_cells}">',
+        *data_section("PointData", point_data),
+        *data_section("CellData", cell_data),
+        "<Points>",
+        "  " + data_array(None, geometry.points, 3),
+        "</Points>",
+        "<Cells>",
+        "  " + data_array("connectivity", geometry.connectivity),
+        "  " + data_array("offsets", geometry.offsets),
+        "  " + data_array("types", geometry.types),
+        "</Cells>",
+        "</Piece>",
+        "</UnstructuredGrid>",
+        '<AppendedData encoding="raw">',
+    ]
+
+    with open(path, "wb") as file:
+        file.write(("\n".join(lines) + "\n_").encode("utf-8"))
+        for values in arrays:
+            file.write(np.uint64(values.nbytes).astype("<u8").tobytes())
+            # Contiguous arrays are written from their memory, without copying
+            file.write(memoryview(values).cast("B"))
+        file.write(b"\n</AppendedData>\n</VTKFile>\n")
+
+
+class VtuSeriesWriter:
+    """Writes a time series of VTK unstructured grid files on the same topology, with a ParaView collection (.pvd).
+
+    The geometry of the topology is converted once and rewritten as it is for every time step,
+    only the data changes from one step to the next. Every step is written to `<name>_<step>.vtu`
+    and the collection `<name>.pvd` lists them with their time, it is written when the writer is closed::
+
+        with VtuSeriesWriter(directory, "map", mesh2d) as writer:
+            for time, water_level in steps:
+                writer.write(time, cell_data={"water_level": water_level})
+
+    Attributes:
+        directory (Path): The directory of the files.
+        name (str): The stem of the file names.
+        geometry (VtuGeometry): The points and cells of the topology.
+        steps (list): The time and the file of every step written.
+    """
+
+    def __init__(self, directory, name: str, topology):
+        self.directory: Path = Path(directory)
+        self.name: str = name
+        self.geometry: VtuGeometry = (
+            topology
+            if isinstance(topology, VtuGeometry)
+            else VtuGeometry.from_topology(topology)
+        )
+        self.steps: List[Tuple[float, Path]] = []
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def write(
+        self,
+        time: float,
+        cell_data: Dict[str, np.ndarray] = None,
+        point_data: Dict[str, np.ndarray] = None,
+    ) -> Path:
+        """Writes the data of a time step.
+
+        Args:
+            time (float): The time of the step.
+            cell_data (Dict[str, ndarray]): The values of every cell, keyed by name.
+            point_data (Dict[str, ndarray]): The values of every point, keyed by name.
+
+        Returns:
+            Path: The file written.
+        """
+        path = self.directory / f"{self.name}_{len(self.steps):04d}.vtu"
+        write_vtu(path, self.geometry, cell_data, point_data)
+        self.steps.append((float(time), path))
+        return path
+
+    def close(self) -> Path:
+        """Writes the collection of the steps written.
+
+        Returns:
+            Path: The collection file.
+        """
+        path = self.directory / f"{self.name}.pvd"
+        lines = [
+            '<?xml version="1.0"?>',
+            '<VTKFile type="Collection" version="0.1" byte_order="LittleEndian">',
+            "<Collection>",
+        ]
+        lines += [
+            f'  <DataSet timestep="{time!r}" part="0" file={quoteattr(os.path.relpath(step, self.directory))}/>'
+            for time, step in self.steps
+        ]
+        lines += ["</Collection>", "</VTKFile>", ""]
+        path.write_text("\n".join(lines), encoding="utf-8")
+        return path
+
+
+def export_vtu(
+    source,
+    directory,
+    topology: str = "mesh2d",
+    topology_id: int = 0,
+    variables: Iterable[str] = None,
+    time: slice = None,
+) -> Path:
+    """Exports a topology of a UGrid file and the data variables defined on it to a VTK time series for ParaView.
+
+    The topology is read once. Variables located on the faces of a mesh2d, or on the edges of a mesh1d
+    or a network1d, are written as cell data, variables located on the nodes of a mesh2d or a mesh1d
+    as point data. Variables with a value per time step are written one time step after the other:
+    from a file in a NetCDF classic format, each step is read through a memory mapped view of the file,
+    so a variable is never held in memory as a whole. From other formats, the UGrid library can only
+    read whole variables. Variables without time are written at every step. Values per layer, or any other
+    trailing dimension, become the components of the VTK arrays. In a NetCDF classic file, time is the first
+    dimension of a variable when it is the dimension of the "time" variable or the record dimension.
+    Other formats do not tell the dimension names, time is then the first axis of a variable when it has
+    the length of the times and is followed by an axis with the number of cells or points.
+
+    Args:
+        source (str): The UGrid file.
+        directory (str): The directory of the files, created if needed.
+        topology (str): The kind of topology ("network1d", "mesh1d" or "mesh2d").
+        topology_id (int): The index of the topology in the file.
+        variables (Iterable[str]): The data variables to export, all the data variables of the topology
+            that can be located on its cells or points when not given.
+        time (slice): The time steps to export, all of them when not given.
+
+    Returns:
+        Path: The ParaView collection (.pvd) listing the files of the time steps.
+    """
+    if topology not in ("network1d", "mesh1d", "mesh2d"):
+        raise InputError(
+            f"Unsupported topology: {topology}. Use network1d, mesh1d or mesh2d."
+        )
+    if time is not None and not isinstance(time, slice):
+        raise InputError("The time selection must be a slice")
+
+    source = str(source)
+    header = read_classic_header(source)
+    summary = inventory(source)
+    counts = next(
+        (
+            t.counts
+            for t in summary.topologies
+            if (t.topology, t.topology_id) == (topology, topology_id)
+        ),
+        None,
+    )
+    if counts is None:
+        raise InputError(f"{source} has no {topology} {topology_id}")
+
+    with UGrid(source, "r") as ug:
+        value = getattr(ug, f"{topology}_get")(topology_id)
+        if header is not None and "time" in header.variables:
+            times = header.view("time")
+        else:
+            try:
+                times = ug.variable_get_data_double("time")
+            except UGridError:
+                times = None
+    times = np.zeros(1) if times is None else np.atleast_1d(times.astype(np.double))
+
+    time_dimension = None
+    if header is not None and "time" in header.variables:
+        time_variable = header.variables["time"]
+        if len(time_variable.dimensions) == 1:
+            time_dimension = time_variable.dimensions[0]
+
+    sections = {"face": "cell", "node": "point"}
+    if topology != "mesh2d":
+        sections = {"edge": "cell", "node": "point"}
+    if topology == "network1d":
+        # The points are the geometry nodes of the branches, not the network nodes
+        sections.pop("node")
+
+    def section(variable):
+        location = sections.get(variable.location)
+        count = counts.get(f"num_{variable.location}s")
+        shape = variable.shape
+        if location is None or count is None or not shape:
+            return None
+        if variable.dimensions is not None:
+            # The first dimension is the time by its name, whatever the lengths
+            is_timed = (
+                variable.dimensions[0] == time_dimension
+                or header.variables[variable.name].is_record
+            )
+            if is_timed and shape[0] != times.size:
+                return None
+        else:
+            is_timed = len(shape) > 1 and shape[0] == times.size and shape[1] == count
+        entity_axis = 1 if is_timed else 0
+        if len(shape) > entity_axis and shape[entity_axis] == count:
+            return location, is_timed
+        return None
+
+    described = [
+        v
+        for v in summary.variables
+        if (v.topology, v.topology_id) == (topology, topology_id)
+    ]
+    if variables is None:
+        selected = [v for v in described if section(v) is not None]
+    else:
+        by_name = {v.name: v for v in described}
+        selected = []
+        for name in dict.fromkeys(variables):
+            if name not in by_name:
+                raise InputError(f"{name} is not a data variable of the {topology}")
+            if section(by_name[name]) is None:
+                raise InputError(
+                    f"{name} is not located on the cells or points of the {topology}"
+                )
+            selected.append(by_name[name])
+
+    def components(values):
+        values = np.asarray(values)
+        return values.reshape(values.shape[0], -1) if values.ndim > 2 else values
+
+    sources = {}
+    for variable in selected:
+        if header is not None and variable.name in header.variables:
+            sources[variable.name] = header.view(variable.name)
+        else:
+            with UGrid(source, "r") as ug:
+                sources[variable.name] = ug.variable_get_data_double(
+                    variable.name
+                ).reshape(variable.shape)
+
+    steps = np.arange(times.size)
+    if time is not None:
+        steps = steps[time]
+    directory = Path(directory)
+    with VtuSeriesWriter(directory, Path(source).stem, value) as writer:
+        for step in steps:
+            data = {"cell": {}, "point": {}}
+            for variable in selected:
+                location, is_timed = section(variable)
+                values = sources[variable.name]
+                data[location][variable.name] = components(
+                    values[step] if is_timed else values
+                )
+            writer.write(times[step], data["cell"], data["point"])
+    return directory / f"{Path(source).stem}.pvd"
+
+
+def _points(x, y, z=None) -> np.ndarray:
+    """Stacks coordinates into points with three components, z being zero when not given."""
+    x = np.asarray(x, dtype=np.double)
+    points = np.zeros((x.size, 3))
+    points[:, 0] = x
+    points[:, 1] = y
+    if z is not None and np.size(z) == x.size:
+        points[:, 2] = z
+    return points
+
+
+def _little_endian(values: np.ndarray) -> np.ndarray:
+    """Converts an array to a contiguous little-endian array, without copying it when it is one already."""
+    values = np.asarray(values)
+    return np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("<"))
+
+
+def _check_data(data: dict, count: int, location: str) -> Dict[str, np.ndarray]:
+    """Checks the arrays of the cell or point data and converts them for writing."""
+    checked = {}
+    for name, values in (data or {}).items():
+        values = _little_endian(values)
+        if values.ndim not in (1, 2) or values.shape[0] != count:
+            raise InputError(
+                f"{name} must have a value or a row of components for every {location}"
+            )
+        if values.dtype.newbyteorder("=") not in VTK_TYPES:
+            raise InputError(f"{name} has an unsupported type {values.dtype}")
+        checked[name] = values
+    return checked
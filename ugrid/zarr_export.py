@@ -0,0 +1,397 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+
+import numpy as np
+
+from ugrid.errors import InputError, UGridError
+from ugrid.file_inventory import inventory
+from ugrid.netcdf_classic import read_classic_header
+from ugrid.ugrid import UGrid
+
+DEFAULT_TIME_CHUNK = 24
+DEFAULT_FACE_CHUNK = 1 << 16
+DEFAULT_BLOCK_BYTES = 64 << 20
+
+# The arrays of every kind of topology, with the location of their rows and the number of entries per row,
+# None for rows of num_face_nodes_max entries
+TOPOLOGY_ARRAYS = {
+    "network1d": {
+        "node_x": ("node", 1),
+        "node_y": ("node", 1),
+        "edge_node": ("edge", 2),
+        "edge_length": ("edge", 1),
+        "edge_order": ("edge", 1),
+        "geometry_nodes_x": ("geometry_node", 1),
+        "geometry_nodes_y": ("geometry_node", 1),
+    },
+    "mesh1d": {
+        "node_x": ("node", 1),
+        "node_y": ("node", 1),
+        "edge_node": ("edge", 2),
+        "node_edge_id": ("node", 1),
+        "node_edge_offset": ("node", 1),
+        "edge_edge_id": ("edge", 1),
+        "edge_edge_offset": ("edge", 1),
+        "edge_x": ("edge", 1),
+        "edge_y": ("edge", 1),
+    },
+    "mesh2d": {
+        "node_x": ("node", 1),
+        "node_y": ("node", 1),
+        "node_z": ("node", 1),
+        "edge_nodes": ("edge", 2),
+        "edge_x": ("edge", 1),
+        "edge_y": ("edge", 1),
+        "edge_z": ("edge", 1),
+        "edge_faces": ("edge", 2),
+        "face_nodes": ("face", None),
+        "face_x": ("face", 1),
+        "face_y": ("face", 1),
+        "face_z": ("face", 1),
+        "face_edges": ("face", None),
+        "face_faces": ("face", None),
+    },
+    "contacts": {
+        "edges": ("contact", 2),
+        "contact_type": ("contact", 1),
+    },
+}
+
+# The UGRID roles of the topology arrays, written as attributes of the topology variable
+TOPOLOGY_ROLES = {
+    "edge_node": "edge_node_connectivity",
+    "edge_nodes": "edge_node_connectivity",
+    "face_nodes": "face_node_connectivity",
+    "edge_faces": "edge_face_connectivity",
+    "face_edges": "face_edge_connectivity",
+    "face_faces": "face_face_connectivity",
+}
+
+# The lists of names of every kind of topology, with the location of their entries
+TOPOLOGY_NAMES = {
+    "network1d": {
+        "node_id": "node",
+        "node_long_name": "node",
+        "edge_id": "edge",
+        "edge_long_name": "edge",
+    },
+    "mesh1d": {"node_name_id": "node", "node_name_long": "node"},
+    "mesh2d": {},
+    "contacts": {"contact_name_id": "contact", "contact_name_long": "contact"},
+}
+
+
+def export_zarr(
+    source,
+    store,
+    variables: Iterable[str] = None,
+    time_chunk: int = DEFAULT_TIME_CHUNK,
+    face_chunk: int = DEFAULT_FACE_CHUNK,
+    block_bytes: int = DEFAULT_BLOCK_BYTES,
+    max_workers: int = None,
+) -> List[str]:
+    """Exports the topologies and data variables of a UGrid file to a chunked and compressed Zarr store.
+
+    Requires the optional `zarr` package, installed with `pip install UGrid[zarr]`.
+
+    The store is written in the Zarr version 2 format, with the dimension names in the `_ARRAY_DIMENSIONS`
+    attribute of every array, so that it can be opened by xarray. Every topology is written as in a UGRID
+    NetCDF file: an attribute-only topology variable carrying the UGRID roles, and an array per coordinate
+    and connectivity. Connectivity arrays keep the start index and fill value of the file. Lists of names
+    are written as arrays of characters, one row per name. The global attributes of the file are kept.
+
+    Data variables are chunked by `time_chunk` along time and by `face_chunk` along their faces, edges or nodes,
+    other dimensions are not chunked. From a file in a NetCDF classic format, the data is streamed through
+    a memory mapped view of the file in blocks of whole chunks of about `block_bytes`. From other formats,
+    the UGrid library can only read whole variables, which are then read in one go.
+
+    Args:
+        source (str): The UGrid file.
+        store (str): The directory of the Zarr store, overwritten if it exists.
+        variables (Iterable[str]): The data variables to export, all the data variables of the topologies when not given.
+        time_chunk (int): The number of time entries per chunk.
+        face_chunk (int): The number of faces, edges or nodes per chunk.
+        block_bytes (int): The size of the blocks of source data, rounded to whole chunks.
+        max_workers (int): The number of threads exporting data variables concurrently,
+            the variables are exported one after the other when not given.
+
+    Returns:
+        List[str]: The names of the arrays written.
+    """
+    zarr = _import_zarr()
+    if time_chunk <= 0 or face_chunk <= 0 or block_bytes <= 0:
+        raise InputError("The chunk and block sizes must be positive")
+
+    source = str(source)
+    header = read_classic_header(source)
+    summary = inventory(source)
+    described = {variable.name: variable for variable in summary.variables}
+    if variables is None:
+        names = list(described)
+    else:
+        names = list(dict.fromkeys(variables))
+        missing = [name for name in names if name not in described]
+        if missing:
+            raise InputError(f"{missing} are not data variables of {source}")
+    if header is not None and "time" in header.variables and "time" not in names:
+        names.insert(0, "time")
+
+    with UGrid(source, "r") as ug:
+        topologies = ug.read_all()
+        locations = {
+            ug.entity_get_node_location_enum(): "node",
+            ug.entity_get_edge_location_enum(): "edge",
+            ug.entity_get_face_location_enum(): "face",
+        }
+        time_attributes = {}
+        if header is None:
+            try:
+                num_times = int(ug.variable_get_dimensions("time")[0])
+                if "time" not in names:
+                    names.insert(0, "time")
+                # The time is no data variable, its units and calendar are not in the inventory
+                time_attributes = dict(
+                    zip(
+                        ug.variable_get_attributes_names("time"),
+                        ug.variable_get_attributes_values("time"),
+                    )
+                )
+            except UGridError:
+                num_times = None
+
+    # zarr 3 writes its own format by default, for groups and arrays alike
+    format_arguments = {}
+    if int(zarr.__version__.split(".")[0]) >= 3:
+        format_arguments["zarr_format"] = 2
+    root = zarr.open_group(str(store), mode="w", **format_arguments)
+    root.attrs.update(_json_attributes(summary.global_attributes))
+    root.attrs.setdefault("Conventions", "CF-1.8 UGRID-1.0")
+    written = []
+
+    for kind, values in topologies.items():
+        for topology in values:
+            written += _write_topology(
+                root, kind, topology, locations, face_chunk, format_arguments
+            )
+
+    # The arrays are created first, their chunks are then filled concurrently
+    tasks = []
+    for name in names:
+        variable = described.get(name)
+        attributes = dict(
+            variable.attributes if variable is not None else time_attributes
+        )
+        if header is not None:
+            classic = header.variables[name]
+            shape, dimensions, dtype = classic.shape, classic.dimensions, classic.dtype
+            attributes.update(_json_attributes(classic.attributes))
+            # A time variable without dimensions, for a single time, gives no time dimension
+            time_variable = header.variables.get("time")
+            is_timed = bool(dimensions) and (
+                classic.is_record
+                or (
+                    time_variable is not None
+                    and len(time_variable.dimensions) > 0
+                    and dimensions[0] == time_variable.dimensions[0]
+                )
+            )
+        else:
+            shape = (
+                (num_times,)
+                if variable is None
+                else tuple(int(length) for length in variable.shape)
+            )
+            dtype = np.dtype(np.double)
+            is_timed = bool(shape) and shape[0] == num_times
+            dimensions = None
+
+        count = None
+        if variable is not None:
+            mesh = next(
+                t
+                for t in summary.topologies
+                if (t.topology, t.topology_id)
+                == (variable.topology, variable.topology_id)
+            )
+            count = mesh.counts.get(f"num_{variable.location}s")
+            mesh_name = (
+                mesh.name or topologies[variable.topology][variable.topology_id].name
+            )
+        # Dimension names are only known for the NetCDF classic formats
+        chunks, names_of_axes = [], []
+        entity_axis = None
+        for axis, length in enumerate(shape):
+            if axis == 0 and is_timed:
+                chunks.append(time_chunk)
+                names_of_axes.append("time")
+            elif entity_axis is None and length == count:
+                entity_axis = axis
+                chunks.append(face_chunk)
+                names_of_axes.append(f"n{mesh_name}_{variable.location}")
+            else:
+                chunks.append(length)
+                names_of_axes.append(f"{name}_dim{axis}")
+        chunks = tuple(max(1, min(c, length)) for c, length in zip(chunks, shape))
+        dimensions = dimensions or tuple(names_of_axes)
+
+        fill_value = attributes.pop("_FillValue", 0)
+        if isinstance(fill_value, str):
+            # The attribute values of the UGrid library are text
+            fill_value = float(fill_value)
+        array = root.full(
+            name=name,
+            shape=shape,
+            chunks=chunks or None,
+            dtype=dtype.newbyteorder("="),
+            fill_value=fill_value,
+            **format_arguments,
+        )
+        array.attrs.update(
+            {**_json_attributes(attributes), "_ARRAY_DIMENSIONS": list(dimensions)}
+        )
+        written.append(name)
+        tasks.append((name, array, shape, chunks))
+
+    def export(task):
+        name, array, shape, chunks = task
+        if header is not None:
+            data = header.view(name)
+        else:
+            with UGrid(source, "r") as ug:
+                data = ug.variable_get_data_double(name).reshape(shape)
+        if not shape:
+            array[...] = data[()]
+            return
+        row_bytes = int(np.prod(shape[1:], dtype=np.int64)) * data.dtype.itemsize
+        rows = max(1, block_bytes // max(1, row_bytes))
+        rows = max(chunks[0], rows // chunks[0] * chunks[0])
+        for start in range(0, shape[0], rows):
+            stop = min(start + rows, shape[0])
+            array[start:stop] = data[start:stop]
+
+    if max_workers is None or max_workers <= 1:
+        for task in tasks:
+            export(task)
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(export, tasks))
+
+    return written
+
+
+def _import_zarr():
+    """Imports the optional zarr package."""
+    try:
+        import zarr
+    except ImportError as error:
+        raise ImportError(
+            "Exporting to Zarr requires the zarr package, install it with `pip install UGrid[zarr]`"
+        ) from error
+    return zarr
+
+
+def _write_topology(
+    root, kind: str, topology, locations: dict, chunk: int, format_arguments: dict
+) -> list:
+    """Writes the arrays and the attribute-only topology variable of a topology."""
+    name = topology.name
+    attributes = {}
+    written = []
+
+    def dimension(location):
+        return f"n{name}_{location}"
+
+    def create(array_name, data, dimensions, extra_attributes, fill_value=0):
+        chunks = (max(1, min(chunk, data.shape[0])),) + data.shape[1:]
+        array = root.full(
+            name=array_name,
+            shape=data.shape,
+            chunks=chunks,
+            dtype=data.dtype.newbyteorder("="),
+            fill_value=fill_value,
+            **format_arguments,
+        )
+        if data.size > 0:
+            array[...] = data
+        array.attrs.update({**extra_attributes, "_ARRAY_DIMENSIONS": dimensions})
+        written.append(array_name)
+
+    num_face_nodes_max = getattr(topology, "num_face_nodes_max", 1)
+    for attribute, (location, row_size) in TOPOLOGY_ARRAYS[kind].items():
+        data = np.asarray(getattr(topology, attribute))
+        if data.size == 0:
+            continue
+        row_size = num_face_nodes_max if row_size is None else row_size
+        dimensions = [dimension(location)]
+        if row_size > 1:
+            data = data.reshape(-1, row_size)
+            dimensions.append("Two" if row_size == 2 else dimension("max_face_nodes"))
+        array_name = f"{name}_{attribute}"
+        extra_attributes = {"mesh": name, "location": location}
+        fill_value = getattr(topology, "double_fill_value", -999.0)
+        if data.dtype.kind in "iu":
+            extra_attributes["start_index"] = int(getattr(topology, "start_index", 0))
+            fill_value = int(getattr(topology, "int_fill_value", -999))
+        if attribute in TOPOLOGY_ROLES:
+            extra_attributes["cf_role"] = TOPOLOGY_ROLES[attribute]
+            attributes[TOPOLOGY_ROLES[attribute]] = array_name
+        create(array_name, data, dimensions, extra_attributes, fill_value)
+
+    for attribute, location in TOPOLOGY_NAMES[kind].items():
+        values = list(getattr(topology, attribute))
+        if not values:
+            continue
+        encoded = np.array([value.encode("utf-8") for value in values])
+        characters = np.frombuffer(encoded.tobytes(), dtype=np.uint8)
+        characters = characters.reshape(len(values), encoded.dtype.itemsize)
+        create(
+            f"{name}_{attribute}",
+            characters,
+            [dimension(location), f"{name}_{attribute}_strlen"],
+            {"mesh": name, "location": location, "_Encoding": "utf-8"},
+        )
+
+    array_names = set(written)
+    if kind == "contacts":
+        attributes["cf_role"] = "mesh_topology_contact"
+        attributes["contact"] = (
+            f"{topology.mesh_from_name}: {locations.get(topology.mesh_from_location)} "
+            f"{topology.mesh_to_name}: {locations.get(topology.mesh_to_location)}"
+        )
+        attributes["contact_connectivity"] = f"{name}_edges"
+        if f"{name}_contact_type" in array_names:
+            attributes["contact_type"] = f"{name}_contact_type"
+    else:
+        attributes["cf_role"] = "mesh_topology"
+        attributes["topology_dimension"] = 2 if kind == "mesh2d" else 1
+        attributes["node_coordinates"] = f"{name}_node_x {name}_node_y"
+        attributes["node_dimension"] = dimension("node")
+        attributes["edge_dimension"] = dimension("edge")
+        for location in ("edge", "face"):
+            if f"{name}_{location}_x" in array_names:
+                attributes[f"{location}_coordinates"] = (
+                    f"{name}_{location}_x {name}_{location}_y"
+                )
+        if kind == "mesh2d":
+            attributes["face_dimension"] = dimension("face")
+            attributes["max_face_nodes_dimension"] = dimension("max_face_nodes")
+        if kind == "mesh1d":
+            attributes["coordinate_space"] = topology.network_name
+
+    variable = root.full(
+        name=name, shape=(), dtype=np.int32, fill_value=0, **format_arguments
+    )
+    variable.attrs.update({**attributes, "_ARRAY_DIMENSIONS": []})
+    return [name] + written
+
+
+def _json_attributes(attributes: dict) -> dict:
+    """Converts attribute values to types that can be stored as JSON."""
+    converted = {}
+    for key, value in attributes.items():
+        if isinstance(value, (np.ndarray, np.generic)):
+            value = value.tolist()
+        converted[key] = value
+    return converted